@@ -1,9 +1,8 @@
 # start the server with streamlit run app.py
+# (page scripts are only executed when opened; see startup_profile.py for import times)
 
 import streamlit as st
 
-from calculators.thermo.reynolds_calc import reynolds_number
-
 if __name__ == "__main__":
     # main()
     home_page = st.Page("pages/main/home.py", title="Home")
@@ -24,23 +23,24 @@ if __name__ == "__main__":
     # math
     
     # pipe_flow
-    piping_pressure_drop_page = st.Page("pages/pipe_flow/piping_pressure_drop_page.py", title="(x) Piping Pressure Drop")
+    piping_pressure_drop_page = st.Page("pages/pipe_flow/piping_pressure_drop_page.py", title="Piping Pressure Drop")
     erosional_velocity_page = st.Page("pages/pipe_flow/erosional_velocity_page.py", title="Erosional Velocity")
     
     # pressure_changers
     npsh_page = st.Page("pages/pressure_changers/npsh_page.py", title="Pump NPSH")
-    pump_compressor_power_page = st.Page("pages/pressure_changers/pump_compressor_power_page.py", title="(x) Pump/Compressor Power")
-    control_valve_sizing_page = st.Page("pages/pressure_changers/control_valve_page.py", title="(x) Control Valve Sizing")
+    pump_compressor_power_page = st.Page("pages/pressure_changers/pump_compressor_power_page.py", title="Pump/Compressor Power")
+    control_valve_sizing_page = st.Page("pages/pressure_changers/control_valve_page.py", title="Control Valve Sizing")
     
     # thermo
     reynolds_page = st.Page("pages/thermo/reynolds_page.py", title="Reynolds Number")
+    pr_flash_page = st.Page("pages/thermo/pr_flash.py", title="Peng-Robinson Flash")
     
     # unit_ops
-    dehy_circ_rate_page = st.Page("pages/unit_ops/glycol_circ_rate_page.py", title="(x) Glycol Dehy Circulation Rate")
-    amine_circ_rate_page = st.Page("pages/unit_ops/amine_circ_rate_page.py", title="(x) Amine Circulation Rate")
+    dehy_circ_rate_page = st.Page("pages/unit_ops/glycol_circ_rate_page.py", title="Glycol Dehy Circulation Rate")
+    amine_circ_rate_page = st.Page("pages/unit_ops/amine_circ_rate_page.py", title="Amine Circulation Rate")
     
     # information
-    control_valve_catalog_page = st.Page("pages/info/control_valve_catalog_page.py", title="(x) Control Valve Catalog")
+    control_valve_catalog_page = st.Page("pages/info/control_valve_catalog_page.py", title="Control Valve Catalog")
     
     # utilities
     barometric_pressure_page = st.Page("pages/utilities/barometric_pressure_page.py", title="Barometric Pressure")
@@ -85,6 +85,7 @@ if __name__ == "__main__":
         
         "Thermodynamics": [
             reynolds_page,
+            pr_flash_page,
         ],
         
         "Unit Operations": [
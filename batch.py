@@ -0,0 +1,277 @@
+# run a calculator over a file of cases with:
+#   python batch.py <calculator> <input.csv|input.parquet> <output.csv|output.parquet>
+#
+# input columns are matched to the calculator's parameter names (use --map to rename),
+# and values shared by every row are given with --set, e.g.
+#   python batch.py vessel_volume levels.parquet volumes.parquet --set vessel_type=Horizontal --set head_type=Elliptical
+#
+# inputs in other units than the parameter name's are tagged with --unit, e.g.
+#   python batch.py reynolds_number cases.csv out.csv --unit diameter_m=in --unit dynamic_viscosity_pa_s=cP
+#
+# calculators that are slow per case (iterative solves) can be spread over worker processes
+# with --workers; each chunk read is split evenly between them, so use a --chunk-size of at
+# least a few thousand rows per worker, e.g.
+#   python batch.py npsh_advanced assets.parquet npsh.parquet --workers 64 --chunk-size 640000
+
+import argparse
+import inspect
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from calculators.parallel import ParallelExecutor
+from calculators.registry import CALCULATORS, get_calculator
+from utilities.units import Quantity, unit_conversion
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+def run_batch(
+    calculator: str,
+    input_path: str,
+    output_path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    constants: dict | None = None,
+    column_map: dict | None = None,
+    result_column: str | None = None,
+    keep_columns: bool = True,
+    units: dict | None = None,
+    workers: int = 1,
+) -> int:
+    _validate_positive(chunk_size, "chunk_size")
+    _validate_positive(workers, "workers")
+
+    func = get_calculator(calculator)
+    constants = constants or {}
+    column_map = column_map or {}
+    units = units or {}
+    result_column = result_column or calculator
+
+    input_format = _file_format(input_path)
+    output_format = _file_format(output_path)
+
+    rows = 0
+    writer = _ChunkWriter(output_path, output_format)
+
+    # one pool for the whole file, each chunk split evenly between the workers
+    executor = ParallelExecutor(workers, chunk_size=-(-chunk_size // workers)) if workers > 1 else None
+
+    try:
+        for chunk in _read_chunks(input_path, input_format, chunk_size):
+            kwargs = _build_arguments(func, chunk, constants, column_map, units)
+
+            try:
+                if executor is None:
+                    result = func(**kwargs)
+                else:
+                    result = _run_parallel(executor, calculator, kwargs)
+            except ValueError as e:
+                raise ValueError(f"rows {rows}-{rows + len(chunk) - 1}: {e}") from e
+
+            out = chunk if keep_columns else chunk.iloc[:, :0]
+            out = out.assign(**_result_columns(result, result_column, len(chunk)))
+
+            writer.write(out)
+            rows += len(chunk)
+    finally:
+        writer.close()
+        if executor is not None:
+            executor.close()
+
+    return rows
+
+def _run_parallel(executor: ParallelExecutor, calculator: str, kwargs: dict):
+    # columns go to the workers through shared memory, everything else with each task
+    inputs, constants, units = {}, {}, {}
+
+    for name, value in kwargs.items():
+        if isinstance(value, Quantity):
+            units[name] = value.unit
+            value = value.value
+
+        if isinstance(value, np.ndarray):
+            if value.dtype.kind not in "biuf":
+                raise ValueError(f"--workers shares numeric columns only, '{name}' is not numeric")
+            inputs[name] = value
+        else:
+            constants[name] = value
+
+    if not inputs:
+        # every parameter was given with --set, there is a single case
+        return get_calculator(calculator)(**kwargs)
+
+    return executor.map(calculator, inputs, constants=constants, units=units)
+
+def _build_arguments(func, chunk, constants: dict, column_map: dict, units: dict) -> dict:
+    kwargs = {}
+    parameters = inspect.signature(func).parameters
+
+    for name in units:
+        if name not in parameters:
+            raise ValueError(f"--unit given for unknown parameter '{name}'")
+
+    for name, param in parameters.items():
+        if name in constants:
+            kwargs[name] = constants[name]
+        else:
+            column = column_map.get(name, name)
+
+            if column in chunk.columns:
+                kwargs[name] = _column_values(chunk[column])
+            elif param.default is inspect.Parameter.empty:
+                raise ValueError(f"No column or --set value for parameter '{name}'")
+
+        # the calculator converts the whole column with one precompiled factor
+        if name in units and name in kwargs:
+            kwargs[name] = Quantity(kwargs[name], units[name])
+
+    return kwargs
+
+def _column_values(series) -> np.ndarray:
+    # numbers as floats; text (e.g. amine names) is passed through for the calculator to look up
+    from pandas.api.types import is_numeric_dtype
+
+    if is_numeric_dtype(series):
+        return series.to_numpy(dtype=float)
+
+    return series.to_numpy()
+
+def _result_columns(result, result_column: str, n_rows: int) -> dict:
+    # calculators returning a NamedTuple get one output column per field
+    if hasattr(result, "_fields"):
+        return {
+            f"{result_column}_{field}": np.broadcast_to(value, (n_rows,))
+            for field, value in zip(result._fields, result)
+        }
+
+    return {result_column: np.broadcast_to(result, (n_rows,))}
+
+def _read_chunks(path: str, file_format: str, chunk_size: int):
+    match file_format:
+        case "csv":
+            import pandas as pd
+
+            yield from pd.read_csv(path, chunksize=chunk_size)
+
+        case "parquet":
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(path)
+            for batch in parquet_file.iter_batches(batch_size=chunk_size):
+                yield batch.to_pandas()
+
+class _ChunkWriter:
+    # appends chunks to the output file, opening it on the first write
+    def __init__(self, path: str, file_format: str):
+        self.path = path
+        self.file_format = file_format
+        self.parquet_writer = None
+        self.chunks_written = 0
+
+    def write(self, df) -> None:
+        match self.file_format:
+            case "csv":
+                first = self.chunks_written == 0
+                df.to_csv(self.path, mode="w" if first else "a", header=first, index=False)
+
+            case "parquet":
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                table = pa.Table.from_pandas(df, preserve_index=False)
+
+                if self.parquet_writer is None:
+                    self.parquet_writer = pq.ParquetWriter(self.path, table.schema)
+                self.parquet_writer.write_table(table)
+
+        self.chunks_written += 1
+
+    def close(self) -> None:
+        if self.parquet_writer is not None:
+            self.parquet_writer.close()
+
+def _file_format(path: str) -> str:
+    suffix = Path(path).suffix.lower()
+
+    if suffix == ".csv":
+        return "csv"
+    elif suffix in (".parquet", ".pq"):
+        return "parquet"
+    else:
+        raise ValueError(f"Unsupported file type '{suffix}', expected .csv or .parquet")
+
+def _parse_assignments(items: list[str], name: str) -> dict:
+    assignments = {}
+
+    for item in items:
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            raise ValueError(f"{name} values must be given as key=value, got '{item}'")
+        assignments[key] = value
+
+    return assignments
+
+def _parse_constant(value: str):
+    if value.lower() in ("true", "false"):
+        return value.lower() == "true"
+
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+def _validate_positive(value: float, name: str) -> None:
+    if value <= 0:
+        raise ValueError(f"{name} must be > 0")
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run a calculator over a CSV or Parquet file of cases.")
+    parser.add_argument("calculator", choices=sorted(CALCULATORS))
+    parser.add_argument("input", help="input .csv or .parquet file")
+    parser.add_argument("output", help="output .csv or .parquet file")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"rows per chunk (default {DEFAULT_CHUNK_SIZE:,})")
+    parser.add_argument("--set", action="append", default=[], metavar="PARAM=VALUE",
+                        help="value used for a parameter on every row")
+    parser.add_argument("--map", action="append", default=[], metavar="PARAM=COLUMN",
+                        help="input column to use for a parameter")
+    parser.add_argument("--unit", action="append", default=[], metavar="PARAM=UNIT",
+                        help="unit of a parameter's column or --set value, if not the one in its name")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes to spread each chunk over (default 1, no pool)")
+    parser.add_argument("--result-column", help="name of the output column (default: calculator name)")
+    parser.add_argument("--results-only", action="store_true",
+                        help="write only the result columns, not the input columns")
+    args = parser.parse_args(argv)
+
+    try:
+        constants = {k: _parse_constant(v) for k, v in _parse_assignments(args.set, "--set").items()}
+        column_map = _parse_assignments(args.map, "--map")
+        units = _parse_assignments(args.unit, "--unit")
+
+        for unit in units.values():
+            unit_conversion(unit, unit)
+
+        rows = run_batch(
+            calculator=args.calculator,
+            input_path=args.input,
+            output_path=args.output,
+            chunk_size=args.chunk_size,
+            constants=constants,
+            column_map=column_map,
+            result_column=args.result_column,
+            keep_columns=not args.results_only,
+            units=units,
+            workers=args.workers,
+        )
+
+    except (ValueError, TypeError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"{args.calculator}: {rows:,} rows written to {args.output}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
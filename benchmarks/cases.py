@@ -0,0 +1,426 @@
+import atexit
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+class BenchmarkCase(NamedTuple):
+    name: str
+    # setup(n, rng) builds the inputs for n cases and returns the call to time; n = 1
+    # passes plain floats so the scalar path is measured
+    setup: Callable
+    # largest size worth timing, for solvers whose cost per case is far above the ufunc ones
+    max_size: int = 10**6
+
+def _values(n: int, rng: np.random.Generator, low: float, high: float) -> float | np.ndarray:
+    if n == 1:
+        return float((low + high) / 2)
+
+    return rng.uniform(low, high, n)
+
+def _air_gas_flow_converter(n, rng):
+    from calculators.conversion.air_gas_flow_converter_calc import air_gas_flow_converter
+
+    flowrate = _values(n, rng, 10.0, 1000.0)
+    sg = _values(n, rng, 0.55, 0.9)
+
+    return lambda: air_gas_flow_converter(flowrate, sg)
+
+def _air_gas_conversion_table(n, rng):
+    from calculators.conversion.air_gas_flow_converter_calc import air_gas_conversion_table
+
+    # n table cells: up to 100 gases, each with its own temperature and compressibility
+    gases = min(n, 100)
+    flowrates = rng.uniform(10.0, 1000.0, n // gases)
+    sg = rng.uniform(0.55, 1.6, gases)
+    T = rng.uniform(260.0, 320.0, gases)
+    Z = rng.uniform(0.95, 1.0, gases)
+
+    return lambda: air_gas_conversion_table(flowrates, sg, gas_temperature_K=T, gas_compressibility=Z)
+
+def _gas_conditions_converter(calc_z_factor):
+    def setup(n, rng):
+        from calculators.conversion.gas_conditions_calc import gas_conditions_converter
+
+        P1 = _values(n, rng, 101325.0, 5e6)
+        T1 = _values(n, rng, 273.15, 330.0)
+        V1 = _values(n, rng, 1.0, 100.0)
+        P2 = _values(n, rng, 101325.0, 5e6)
+        T2 = _values(n, rng, 273.15, 330.0)
+
+        return lambda: gas_conditions_converter(P1, T1, 0.95, V1, P2, T2, 0.9, calc_z_factor,
+                                                specific_gravity_rel_air=0.65)
+
+    return setup
+
+def _standardize_gas_volumes(metered):
+    def setup(n, rng):
+        from calculators.conversion.gas_standardization_calc import RECORD_DTYPE, record_chunks, standardize_gas_volumes
+
+        records = np.empty(n, dtype=RECORD_DTYPE)
+        records["pressure_kPa"] = rng.uniform(2000.0, 4000.0, n)
+        records["temperature_K"] = rng.uniform(280.0, 300.0, n)
+        records["volume_m3"] = rng.uniform(1.0, 10.0, n)
+        records["specific_gravity"] = rng.uniform(0.55, 0.75, n)
+
+        if metered:
+            # readings at transmitter resolution from a few meters, so states repeat
+            records["pressure_kPa"] = np.round(records["pressure_kPa"], -1)
+            records["temperature_K"] = np.round(records["temperature_K"] * 2.0) / 2.0
+            records["specific_gravity"] = rng.choice([0.58, 0.62, 0.65, 0.68, 0.72], n)
+
+        chunks = list(record_chunks(records.tolist()))
+
+        # the last chunk carries the running totals
+        return lambda: list(standardize_gas_volumes(chunks))[-1]
+
+    return setup
+
+def _vessel_volume(vessel_type, head_type):
+    def setup(n, rng):
+        from calculators.geometry.vessel_volume_calc import vessel_volume
+
+        h = _values(n, rng, 0.0, 2.0)
+
+        return lambda: vessel_volume(vessel_type, head_type, 6.0, 2.0, h)
+
+    return setup
+
+def _vessel_class_volume(n, rng):
+    from calculators.geometry.vessel_volume_calc import Vessel
+
+    vessel = Vessel("Horizontal", "Elliptical", 6.0, 2.0)
+    h = _values(n, rng, 0.0, 2.0)
+
+    return lambda: vessel.volume(h)
+
+def _strapping_table_level(n, rng):
+    from calculators.geometry.vessel_strapping_calc import StrappingTable
+
+    table = StrappingTable("Horizontal", "Elliptical", 6.0, 2.0)
+    V = _values(n, rng, 0.0, table.max_volume_m3)
+
+    return lambda: table.level(V)
+
+def _erosional_velocity(n, rng):
+    from calculators.pipe_flow.erosional_velocity_calc import erosional_velocity
+
+    rho = _values(n, rng, 1.0, 60.0)
+
+    return lambda: erosional_velocity(100.0, rho)
+
+def _erosional_velocity_screening(n, rng):
+    from calculators.pipe_flow.erosional_velocity_calc import erosional_velocity_screening
+
+    D = _values(n, rng, 0.05, 0.3)
+    Q = _values(n, rng, 0.001, 0.1)
+    rho = _values(n, rng, 20.0, 900.0)
+
+    return lambda: erosional_velocity_screening(D, Q, rho)
+
+def _friction_factor(name):
+    def setup(n, rng):
+        from calculators.pipe_flow import friction_factor_calc
+
+        func = getattr(friction_factor_calc, name)
+        Re = _values(n, rng, 4e3, 1e7)
+        rr = _values(n, rng, 1e-6, 1e-2)
+
+        return lambda: func(Re, rr)
+
+    return setup
+
+def _segment_pressure_drop(n, rng):
+    from calculators.pipe_flow.piping_pressure_drop_calc import segment_pressure_drop
+
+    D = _values(n, rng, 0.025, 0.5)
+    L = _values(n, rng, 1.0, 500.0)
+
+    return lambda: segment_pressure_drop(0.01, 999.0, 1e-3, D, 4.572e-5, L, 1.5, 0.0)
+
+def _line_pressure_drop(n, rng):
+    from calculators.pipe_flow.piping_pressure_drop_calc import line_pressure_drop
+
+    line_id = rng.integers(0, max(n // 10, 1), n)
+    D = rng.uniform(0.025, 0.5, n)
+    L = rng.uniform(1.0, 500.0, n)
+
+    return lambda: line_pressure_drop(line_id, 0.01, 999.0, 1e-3, D, 4.572e-5, L)
+
+def _gas_network(n, rng):
+    from calculators.pipe_flow.gas_network_calc import solve_gas_network
+
+    # a tree of n + 1 nodes fed from node 0, each node joined to a random earlier one
+    n_nodes = n + 1
+    pipe_to = np.arange(1, n_nodes)
+    pipe_from = (rng.random(n) * pipe_to).astype(np.intp)
+
+    P = np.full(n_nodes, np.nan)
+    P[0] = 7000.0
+    demand = np.r_[0.0, rng.uniform(100.0, 1000.0, n)]
+    L = rng.uniform(500.0, 2000.0, n)
+
+    return lambda: solve_gas_network(P, demand, pipe_from, pipe_to, L, 0.3, 4.572e-5, 0.65, 288.15)
+
+def _npsh_simple(n, rng):
+    from calculators.pressure_changers.npsh_calc import npsh_simple
+
+    P = _values(n, rng, 101.325, 500.0)
+
+    return lambda: npsh_simple(P, 3.17, 999.0, 2.0, 1.5, 0.5)
+
+def _npsh_advanced(n, rng):
+    from calculators.pressure_changers.npsh_calc import npsh_advanced
+
+    P = _values(n, rng, 101.325, 500.0)
+    v = _values(n, rng, 0.5, 3.0)
+
+    return lambda: npsh_advanced(P, 3.17, 999.0, 2.0, v, 0.1, 1e-3, 4.572e-5, 50.0)
+
+def _parallel_npsh_advanced(n, rng):
+    from calculators.parallel import ParallelExecutor
+
+    inputs = {
+        "pressure1_kPa": np.atleast_1d(_values(n, rng, 101.325, 500.0)),
+        "velocity_m_s": np.atleast_1d(_values(n, rng, 0.5, 3.0)),
+    }
+    constants = dict(vapor_pressure_kPa=3.17, fluid_density_kg_m3=999.0, relative_height_m=2.0, pipe_diameter_m=0.1,
+                     viscosity_Pa_s=1e-3, pipe_roughness_m=4.572e-5, equivalent_length_m=50.0)
+
+    # the pool is started on the first call and kept for the rest, as batch.py does per file,
+    # then shut down with the run
+    executor = ParallelExecutor()
+    atexit.register(executor.close)
+
+    return lambda: executor.map("npsh_advanced", inputs, constants=constants)
+
+def _npsh_curve(n, rng):
+    from calculators.pressure_changers.npsh_calc import npsh_curve
+
+    # n flow points (at least 2), compared against a 4-point NPSHr curve
+    Q = np.linspace(1e-4, 0.02, max(n, 2))
+    Qr = np.array([0.0, 0.005, 0.01, 0.02])
+    Hr = np.array([1.0, 1.5, 2.5, 4.0])
+
+    return lambda: npsh_curve(Q, 103.0, 3.17, 999.0, 1.5, 0.1, 1e-3, 4.572e-5, 50.0,
+                              npshr_flowrate_m3_s=Qr, npshr_m=Hr, required_margin_m=1.0)
+
+def _pump_power(n, rng):
+    from calculators.pressure_changers.pump_compressor_power_calc import pump_power
+
+    Q = _values(n, rng, 0.001, 0.1)
+    dP = _values(n, rng, 100.0, 2000.0)
+
+    return lambda: pump_power(Q, dP, 0.7, 0.95)
+
+def _compressor_power(name, **kwargs):
+    def setup(n, rng):
+        from calculators.pressure_changers import pump_compressor_power_calc
+
+        func = getattr(pump_compressor_power_calc, name)
+        m = _values(n, rng, 5.0, 20.0)
+        P1 = _values(n, rng, 2000.0, 4000.0)
+        P2 = _values(n, rng, 6000.0, 10000.0)
+        T1 = _values(n, rng, 280.0, 320.0)
+
+        return lambda: func(m, P1, P2, T1, 0.65, 1.28, 0.78, **kwargs)
+
+    return setup
+
+def _liquid_valve_cv(n, rng):
+    from calculators.pressure_changers.control_valve_calc import liquid_valve_cv
+
+    Q = _values(n, rng, 0.001, 0.1)
+    P2 = _values(n, rng, 200.0, 800.0)
+
+    return lambda: liquid_valve_cv(Q, 1000.0, P2, 999.0, 3.17)
+
+def _gas_valve_cv(n, rng):
+    from calculators.pressure_changers.control_valve_calc import gas_valve_cv
+
+    m = _values(n, rng, 0.5, 5.0)
+    P2 = _values(n, rng, 500.0, 2500.0)
+    T1 = _values(n, rng, 280.0, 320.0)
+
+    return lambda: gas_valve_cv(m, 3000.0, P2, T1, 0.65)
+
+def _smallest_valve(n, rng):
+    from calculators.pressure_changers.control_valve_catalog_calc import load_valve_catalog
+
+    # n valves of 3 operating cases each
+    catalog = load_valve_catalog()
+    cv = rng.uniform(1.0, 500.0, (n, 3))
+
+    return lambda: catalog.smallest_valve(cv)
+
+def _reynolds_number(n, rng):
+    from calculators.thermo.reynolds_calc import reynolds_number
+
+    v = _values(n, rng, 0.1, 10.0)
+
+    return lambda: reynolds_number(999.0, v, 0.1, 1e-3)
+
+def _reynolds_regimes(n, rng):
+    from calculators.thermo.reynolds_calc import reynolds_regimes
+
+    # velocities down to zero, so some snapshots are flagged invalid
+    v = _values(n, rng, 0.0, 3.0)
+    mu = _values(n, rng, 1e-4, 1.0)
+
+    return lambda: reynolds_regimes(999.0, v, 0.1, mu)
+
+def _regime_counts(n, rng):
+    from calculators.thermo.reynolds_calc import regime_counts
+
+    regime = rng.integers(-1, 3, n, dtype=np.int8)
+    groups = rng.integers(0, 100, n)
+
+    return lambda: regime_counts(regime, groups, 100)
+
+def _bukacek_water_content(n, rng):
+    from calculators.unit_ops.glycol_dehy_calc import bukacek_water_content
+
+    P = _values(n, rng, 1000.0, 10000.0)
+    T = _values(n, rng, 273.15, 330.0)
+
+    return lambda: bukacek_water_content(P, T)
+
+def _water_content_table(method):
+    def setup(n, rng):
+        from calculators.unit_ops.glycol_dehy_calc import WATER_CONTENT_TABLE
+
+        P = _values(n, rng, 1000.0, 10000.0)
+
+        if method == "dew_point":
+            W = _values(n, rng, 50.0, 1000.0)
+            return lambda: WATER_CONTENT_TABLE.dew_point(W, P)
+
+        T = _values(n, rng, 273.15, 330.0)
+        return lambda: WATER_CONTENT_TABLE.water_content(P, T)
+
+    return setup
+
+def _teg_dehydration(n, rng):
+    from calculators.unit_ops.glycol_dehy_calc import teg_dehydration
+
+    Q = _values(n, rng, 1e5, 5e6)
+    P = _values(n, rng, 3000.0, 9000.0)
+    T = _values(n, rng, 293.15, 318.15)
+
+    return lambda: teg_dehydration(Q, P, T, 64.0)
+
+def _amine_circulation_rate(n, rng):
+    from calculators.unit_ops.amine_circ_rate_calc import amine_circulation_rate, AMINE_NAMES
+
+    Q = _values(n, rng, 1e5, 5e6)
+    y_H2S = _values(n, rng, 0.0, 0.02)
+    y_CO2 = _values(n, rng, 0.0, 0.05)
+    amine = "MDEA" if n == 1 else rng.choice(AMINE_NAMES, n)
+
+    return lambda: amine_circulation_rate(Q, y_H2S, y_CO2, amine)
+
+def _barometric_pressure(**kwargs):
+    def setup(n, rng):
+        from calculators.utilities.barometric_pressure_calc import barometric_pressure
+
+        z = _values(n, rng, 0.0, 5000.0)
+
+        return lambda: barometric_pressure(z, **kwargs)
+
+    return setup
+
+# C1, C2, C3, nC4, nC5, nC6, CO2, N2
+_FLASH_FEED = np.array([0.70, 0.10, 0.07, 0.05, 0.03, 0.03, 0.01, 0.01])
+_FLASH_COMPONENTS = ["Methane", "Ethane", "Propane", "n-Butane", "n-Pentane", "n-Hexane", "Carbon Dioxide", "Nitrogen"]
+
+def _pr(name):
+    def setup(n, rng):
+        from calculators.thermo import pr_flash_calc
+        from utilities.components import component_ids, component_properties
+
+        func = getattr(pr_flash_calc, name)
+        props = component_properties(component_ids(_FLASH_COMPONENTS))
+        P = _values(n, rng, 500.0, 8000.0)
+        T = _values(n, rng, 200.0, 350.0)
+
+        if name == "pr_flash_sweep":
+            P = np.sort(np.atleast_1d(P))
+
+        return lambda: func(P, T, _FLASH_FEED, props.critical_temperature_K, props.critical_pressure_kPa,
+                            props.acentric_factor, kij=props.kij)
+
+    return setup
+
+def _z_factor_gpsa(n, rng):
+    from utilities.thermo_utils import z_factor_GPSA
+
+    P = _values(n, rng, 101.325, 10000.0)
+    T = _values(n, rng, 260.0, 340.0)
+
+    return lambda: z_factor_GPSA(P, T, 0.65)
+
+def _gpsa_z_coefficient(n, rng):
+    from utilities.thermo_utils import gpsa_z_coefficient
+
+    T = _values(n, rng, 260.0, 340.0)
+    sg = _values(n, rng, 0.55, 0.9)
+
+    return lambda: gpsa_z_coefficient(T, sg)
+
+CASES = [
+    # conversion
+    BenchmarkCase("air_gas_flow_converter", _air_gas_flow_converter),
+    BenchmarkCase("air_gas_conversion_table", _air_gas_conversion_table),
+    BenchmarkCase("gas_conditions_converter", _gas_conditions_converter(False)),
+    BenchmarkCase("gas_conditions_converter[z_factor]", _gas_conditions_converter(True)),
+    BenchmarkCase("standardize_gas_volumes", _standardize_gas_volumes(False)),
+    BenchmarkCase("standardize_gas_volumes[metered]", _standardize_gas_volumes(True)),
+
+    # geometry
+    BenchmarkCase("vessel_volume[horizontal]", _vessel_volume("Horizontal", "Elliptical")),
+    BenchmarkCase("vessel_volume[vertical]", _vessel_volume("Vertical", "Hemispherical")),
+    BenchmarkCase("Vessel.volume", _vessel_class_volume),
+    BenchmarkCase("StrappingTable.level", _strapping_table_level),
+
+    # pipe_flow
+    BenchmarkCase("erosional_velocity", _erosional_velocity),
+    BenchmarkCase("erosional_velocity_screening", _erosional_velocity_screening),
+    BenchmarkCase("friction_factor_serghides", _friction_factor("friction_factor_serghides")),
+    BenchmarkCase("friction_factor_colebrook", _friction_factor("friction_factor_colebrook")),
+    BenchmarkCase("segment_pressure_drop", _segment_pressure_drop),
+    BenchmarkCase("line_pressure_drop", _line_pressure_drop),
+    BenchmarkCase("solve_gas_network", _gas_network, max_size=10**4),
+
+    # pressure_changers
+    BenchmarkCase("npsh_simple", _npsh_simple),
+    BenchmarkCase("npsh_advanced", _npsh_advanced),
+    BenchmarkCase("ParallelExecutor.map[npsh_advanced]", _parallel_npsh_advanced),
+    BenchmarkCase("npsh_curve", _npsh_curve),
+    BenchmarkCase("pump_power", _pump_power),
+    BenchmarkCase("compressor_adiabatic_power", _compressor_power("compressor_adiabatic_power")),
+    BenchmarkCase("compressor_polytropic_power[steps=20]", _compressor_power("compressor_polytropic_power", steps=20)),
+    BenchmarkCase("liquid_valve_cv", _liquid_valve_cv),
+    BenchmarkCase("gas_valve_cv", _gas_valve_cv),
+    BenchmarkCase("ValveCatalog.smallest_valve", _smallest_valve),
+
+    # thermo
+    BenchmarkCase("reynolds_number", _reynolds_number),
+    BenchmarkCase("reynolds_regimes", _reynolds_regimes),
+    BenchmarkCase("regime_counts[groups=100]", _regime_counts),
+    BenchmarkCase("pr_flash", _pr("pr_flash"), max_size=10**4),
+    BenchmarkCase("pr_flash_sweep", _pr("pr_flash_sweep"), max_size=10**3),
+    BenchmarkCase("pr_z_factor", _pr("pr_z_factor")),
+
+    # unit_ops
+    BenchmarkCase("bukacek_water_content", _bukacek_water_content),
+    BenchmarkCase("WaterContentTable.water_content", _water_content_table("water_content")),
+    BenchmarkCase("WaterContentTable.dew_point", _water_content_table("dew_point")),
+    BenchmarkCase("teg_dehydration", _teg_dehydration),
+    BenchmarkCase("amine_circulation_rate", _amine_circulation_rate),
+
+    # utilities
+    BenchmarkCase("barometric_pressure", _barometric_pressure()),
+    BenchmarkCase("barometric_pressure[isothermal]", _barometric_pressure(isothermal=True)),
+    BenchmarkCase("barometric_pressure[use_table]", _barometric_pressure(use_table=True)),
+    BenchmarkCase("z_factor_GPSA", _z_factor_gpsa),
+    BenchmarkCase("gpsa_z_coefficient", _gpsa_z_coefficient),
+]
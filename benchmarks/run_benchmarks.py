@@ -0,0 +1,220 @@
+# time every calculator at 1, 1e3 and 1e6 cases with:
+#   python -m benchmarks.run_benchmarks
+#
+# each run is appended to benchmarks/history.json; with --save-baseline it also becomes the
+# baseline (benchmarks/baseline.json) that later runs are compared against. Neither file is
+# committed: timings are machine-specific, so save a baseline locally before a change
+#   python -m benchmarks.run_benchmarks --save-baseline          (before a change)
+#   python -m benchmarks.run_benchmarks --filter pr_             (after it)
+# A case more than --threshold slower than its baseline is re-timed (--retries) and reported
+# as a regression (exit code 1) if it stays that slow. A baseline timed on another machine,
+# Python or numpy is not compared against; the run warns and records the timings only.
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.cases import CASES
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+DEFAULT_HISTORY = BENCHMARK_DIR / "history.json"
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+
+DEFAULT_SIZES = (1, 10**3, 10**6)
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.5
+DEFAULT_RETRIES = 2
+
+# smallest total time of one timing sample, so fast calls are looped enough to be measurable
+MIN_SAMPLE_S = 0.05
+
+def run_benchmarks(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    name_filter: str | None = None,
+    repeat: int = DEFAULT_REPEAT,
+    seed: int = 0,
+) -> dict:
+    # returns {"<case>[<size>]": seconds per call}, the best of repeat samples
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+
+    results = {}
+
+    for key, case, n in _selected_cases(sizes, name_filter):
+        results[key] = _time_case(case, n, repeat, seed)
+
+    return results
+
+def confirm_regressions(
+    results: dict,
+    baseline: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    repeat: int = DEFAULT_REPEAT,
+    seed: int = 0,
+    retries: int = DEFAULT_RETRIES,
+) -> dict:
+    # re-times the cases find_regressions reports, up to retries more times, keeping the best
+    # time of each in results: a burst of load on the machine while one case ran is not a
+    # regression, a case that stays slower than its baseline every time is
+    cases = {key: (case, n) for key, case, n in _selected_cases()}
+    regressions = find_regressions(results, baseline, threshold)
+
+    for _ in range(retries):
+        if not regressions:
+            break
+
+        for key in regressions:
+            if key in cases:
+                results[key] = min(results[key], _time_case(*cases[key], repeat, seed))
+
+        regressions = find_regressions(results, baseline, threshold)
+
+    return regressions
+
+def time_call(call, repeat: int = DEFAULT_REPEAT) -> float:
+    # warm up once (imports, caches), then size the loop to at least MIN_SAMPLE_S
+    call()
+    timer = timeit.Timer(call)
+
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= MIN_SAMPLE_S or number >= 10**6:
+            break
+        number *= 10
+
+    samples = [elapsed] + timer.repeat(repeat=repeat - 1, number=number)
+
+    return min(samples) / number
+
+def _selected_cases(sizes: tuple[int, ...] = DEFAULT_SIZES, name_filter: str | None = None):
+    # ("<case>[<size>]", case, size) of every case and size to time
+    for case in CASES:
+        if name_filter and name_filter not in case.name:
+            continue
+
+        for n in sizes:
+            if n <= case.max_size:
+                yield f"{case.name}[{n}]", case, n
+
+def _time_case(case, n: int, repeat: int, seed: int) -> float:
+    return time_call(case.setup(n, np.random.default_rng(seed)), repeat)
+
+def find_regressions(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> dict:
+    # {"<case>[<size>]": current / baseline} for cases slower than (1 + threshold) x baseline
+    return {key: seconds / baseline[key]
+            for key, seconds in results.items()
+            if key in baseline and seconds > (1 + threshold) * baseline[key]}
+
+def make_record(results: dict) -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.node(),
+        "results": results,
+    }
+
+def environment_mismatch(record: dict, baseline_record: dict) -> list[str]:
+    # the machine, python and numpy entries that differ between two records
+    return [f"{field} {baseline_record.get(field)} != {record[field]}"
+            for field in ("machine", "python", "numpy")
+            if baseline_record.get(field) != record[field]]
+
+def append_history(record: dict, path: Path = DEFAULT_HISTORY) -> None:
+    history = json.loads(path.read_text()) if path.exists() else []
+    history.append(record)
+    path.write_text(json.dumps(history, indent=1))
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCHMARK_DIR,
+                                   capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return completed.stdout.strip()
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+
+    return f"{seconds / 1e-9:8.2f} ns"
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Time every calculator and compare against a stored baseline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="numbers of cases per call")
+    parser.add_argument("--filter", dest="name_filter", help="only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timing samples per case, the best is kept")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown reported as a regression (default 0.5 = 50%%)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help="times a case reported as a regression is re-timed before it counts")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    if any(n < 1 for n in args.sizes):
+        parser.error("sizes must be at least 1")
+    if args.retries < 0:
+        parser.error("retries must be >= 0")
+
+    start = time.perf_counter()
+    results = run_benchmarks(tuple(args.sizes), args.name_filter, args.repeat)
+
+    if not results:
+        print("No benchmark cases matched", file=sys.stderr)
+        return 1
+
+    record = make_record(results)
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline_record = json.loads(args.baseline.read_text())
+        mismatch = environment_mismatch(record, baseline_record)
+        if mismatch:
+            print(f"Baseline not compared, it was timed elsewhere ({', '.join(mismatch)}); "
+                  "save a local one with --save-baseline", file=sys.stderr)
+        else:
+            baseline = baseline_record["results"]
+
+    if args.save_baseline:
+        regressions = find_regressions(results, baseline, args.threshold)
+    else:
+        regressions = confirm_regressions(results, baseline, args.threshold, args.repeat, retries=args.retries)
+
+    append_history(record, args.history)
+
+    width = max(len(key) for key in results)
+    for key, seconds in results.items():
+        line = f"{key:<{width}}  {_format_seconds(seconds)}"
+        if key in baseline:
+            line += f"  {seconds / baseline[key]:6.2f}x baseline"
+            if key in regressions:
+                line += "  REGRESSION"
+        print(line)
+
+    print(f"{len(results)} cases in {time.perf_counter() - start:.1f} s, recorded in {args.history}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(record, indent=1))
+        print(f"Saved baseline to {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} case(s) more than {args.threshold:.0%} slower than the baseline", file=sys.stderr)
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,125 @@
-import math
+from typing import NamedTuple
+
+import numpy as np
+
+from utilities.units import in_units
+
+FLOW_BASES = ("actual", "standard")
+
+class AirGasTable(NamedTuple):
+    # gas_flowrate[i, j] is the gas capacity of air rating i for gas j
+    gas_flowrate: np.ndarray
+    correction_factor: np.ndarray
 
 def air_gas_flow_converter(
-    flowrate: float,
-    specific_gravity: float,
-) -> float:
-    #TODO: add validation
-    
-    Q1 = flowrate
-    SG = specific_gravity
-    
-    Q2 = Q1 / math.sqrt(SG)
-
-    return Q2
\ No newline at end of file
+    flowrate: float | np.ndarray,
+    specific_gravity: float | np.ndarray,
+    gas_temperature_K: float | np.ndarray | None = None,
+    air_temperature_K: float | np.ndarray = 288.15,
+    gas_compressibility: float | np.ndarray = 1.0,
+    air_compressibility: float | np.ndarray = 1.0,
+    flow_basis: str = "actual",
+) -> float | np.ndarray:
+    # gas flow through the same device (orifice, relief valve, regulator) as a rated air flow, at
+    # the same upstream pressure. gas_temperature_K=None takes the gas at the air temperature.
+    Q1 = np.asarray(flowrate, dtype=float)
+
+    if gas_temperature_K is None and _is_unity(gas_compressibility) and _is_unity(air_compressibility):
+        # same temperature and ideal gas: the plain conversion, whatever the flow basis
+        if flow_basis not in FLOW_BASES:
+            raise ValueError(f"flow_basis must be one of {', '.join(FLOW_BASES)}")
+
+        SG = np.asarray(specific_gravity, dtype=float)
+        _validate_inputs(Q1, SG)
+
+        Q2 = Q1 / np.sqrt(SG)
+
+        return Q2[()]
+
+    correction = _correction_factor(specific_gravity, gas_temperature_K, air_temperature_K,
+                                    gas_compressibility, air_compressibility, flow_basis)
+
+    _validate_inputs(Q1)
+
+    Q2 = Q1 * correction
+
+    return Q2[()]
+
+def air_gas_conversion_table(
+    flowrates: float | np.ndarray,
+    specific_gravity: float | np.ndarray,
+    gas_temperature_K: float | np.ndarray | None = None,
+    air_temperature_K: float = 288.15,
+    gas_compressibility: float | np.ndarray = 1.0,
+    air_compressibility: float = 1.0,
+    flow_basis: str = "actual",
+) -> AirGasTable:
+    # capacity table of many air ratings (rows) for many gases (columns) in one call. The gas
+    # temperature and compressibility are one value per gas (or shared); the correction factor
+    # is evaluated once per gas and applied to every rating as an outer product.
+    flowrates = np.atleast_1d(np.asarray(flowrates, dtype=float))
+    SG = np.atleast_1d(np.asarray(specific_gravity, dtype=float))
+
+    if flowrates.ndim != 1 or SG.ndim != 1:
+        raise ValueError("flowrates and specific_gravity must be 1-D arrays")
+
+    _validate_inputs(flowrates)
+
+    correction = _correction_factor(SG, gas_temperature_K, air_temperature_K,
+                                    gas_compressibility, air_compressibility, flow_basis)
+    correction = np.broadcast_to(correction, SG.shape)
+
+    return AirGasTable(np.multiply.outer(flowrates, correction), correction)
+
+def _correction_factor(specific_gravity, gas_temperature_K, air_temperature_K,
+                       gas_compressibility, air_compressibility, flow_basis: str) -> np.ndarray:
+    # the mass flow through a device at a given upstream pressure goes as sqrt(MW / (Z T)), so
+    # its actual volume flow goes as sqrt(Z T / MW) and its standard volume flow as
+    # sqrt(1 / (MW Z T)), relative to air in both cases
+    if flow_basis not in FLOW_BASES:
+        raise ValueError(f"flow_basis must be one of {', '.join(FLOW_BASES)}")
+
+    air_temperature_K = in_units(air_temperature_K, "K")
+    if gas_temperature_K is not None:
+        gas_temperature_K = in_units(gas_temperature_K, "K")
+
+    positive = {
+        "specific_gravity": np.asarray(specific_gravity, dtype=float),
+        "air_temperature_K": np.asarray(air_temperature_K, dtype=float),
+        "gas_compressibility": np.asarray(gas_compressibility, dtype=float),
+        "air_compressibility": np.asarray(air_compressibility, dtype=float),
+    }
+    if gas_temperature_K is not None:
+        positive["gas_temperature_K"] = np.asarray(gas_temperature_K, dtype=float)
+
+    _validate_positive(positive)
+
+    SG = positive["specific_gravity"]
+    ZT_ratio = positive["gas_compressibility"] / positive["air_compressibility"]
+
+    if gas_temperature_K is not None:
+        ZT_ratio = ZT_ratio * positive["gas_temperature_K"] / positive["air_temperature_K"]
+
+    if flow_basis == "actual":
+        return np.sqrt(ZT_ratio / SG)
+
+    return 1 / np.sqrt(ZT_ratio * SG)
+
+def _validate_inputs(flowrate: np.ndarray, specific_gravity: np.ndarray | None = None) -> None:
+    if (flowrate < 0.0).any():
+        raise ValueError("flowrate must be >= 0")
+
+    if specific_gravity is not None and (specific_gravity <= 0.0).any():
+        raise ValueError("specific_gravity must be > 0")
+
+def _validate_positive(values: dict[str, np.ndarray]) -> None:
+    # every input checked in one pass; the offending one is only looked for once the check fails
+    if (np.concatenate([value.ravel() for value in values.values()]) > 0.0).all():
+        return
+
+    for name, value in values.items():
+        if (value <= 0.0).any():
+            raise ValueError(f"{name} must be > 0")
+
+def _is_unity(value) -> bool:
+    return isinstance(value, (int, float)) and value == 1.0
@@ -1,16 +1,25 @@
+import numpy as np
+
 from utilities.thermo_utils import z_factor_GPSA
+from utilities.units import convert, in_units
 
 def gas_conditions_converter (
-    pressure1_Pa: float,
-    temperature1_K: float,
-    compressibility1: float,
-    volume1_m3: float,
-    pressure2_Pa: float,
-    temperature2_K: float,
-    compressibility2: float,
+    pressure1_Pa: float | np.ndarray,
+    temperature1_K: float | np.ndarray,
+    compressibility1: float | np.ndarray,
+    volume1_m3: float | np.ndarray,
+    pressure2_Pa: float | np.ndarray,
+    temperature2_K: float | np.ndarray,
+    compressibility2: float | np.ndarray,
     calc_z_factor: bool,
     specific_gravity_rel_air = None  
-) -> float:
+) -> float | np.ndarray:
+    pressure1_Pa = in_units(pressure1_Pa, "Pa")
+    temperature1_K = in_units(temperature1_K, "K")
+    volume1_m3 = in_units(volume1_m3, "m3")
+    pressure2_Pa = in_units(pressure2_Pa, "Pa")
+    temperature2_K = in_units(temperature2_K, "K")
+
     _validate_positive(pressure1_Pa, "pressure1")
     _validate_positive(temperature1_K, "temperature1")
     _validate_positive(compressibility1, "compressibility1")
@@ -19,28 +28,28 @@ def gas_conditions_converter (
     _validate_positive(temperature2_K, "temperature2")
     _validate_positive(compressibility2, "compressibility2")
 
-    P1 = pressure1_Pa
-    T1 = temperature1_K
-    V1 = volume1_m3
-    P2 = pressure2_Pa
-    T2 = temperature2_K
+    P1 = np.asarray(pressure1_Pa, dtype=float)
+    T1 = np.asarray(temperature1_K, dtype=float)
+    V1 = np.asarray(volume1_m3, dtype=float)
+    P2 = np.asarray(pressure2_Pa, dtype=float)
+    T2 = np.asarray(temperature2_K, dtype=float)
     y = specific_gravity_rel_air
     
     if calc_z_factor:
-        if y:
-            Z1 = z_factor_GPSA(P1/1000, T1, y)
-            Z2 = z_factor_GPSA(P2/1000, T2, y)
+        if y is not None and np.all(np.asarray(y) > 0.0):
+            Z1 = z_factor_GPSA(convert(P1, "Pa", "kPa"), T1, y)
+            Z2 = z_factor_GPSA(convert(P2, "Pa", "kPa"), T2, y)
         else:
             raise TypeError("The option to calculate the Z factor was selected, but a valid specific gravity was not provided.")
     
     else:
-        Z1 = compressibility1
-        Z2 = compressibility2
+        Z1 = np.asarray(compressibility1, dtype=float)
+        Z2 = np.asarray(compressibility2, dtype=float)
         
     V2 = V1 * (Z2/Z1) * (T2/T1) * (P1/P2)
     
     return V2
     
-def _validate_positive(value: float, name: str) -> None:
-       if value <= 0.0:
-        raise ValueError(f"{name} must be > 0")    
\ No newline at end of file
+def _validate_positive(value: float | np.ndarray, name: str) -> None:
+       if np.any(np.asarray(value) <= 0.0):
+        raise ValueError(f"{name} must be > 0")    
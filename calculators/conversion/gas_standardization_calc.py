@@ -0,0 +1,164 @@
+import itertools
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+import numpy as np
+
+from utilities.thermo_utils import z_factor_GPSA
+
+# one meter record: actual pressure, temperature and volume, and gas specific gravity
+RECORD_DTYPE = np.dtype([
+    ("pressure_kPa", float),
+    ("temperature_K", float),
+    ("volume_m3", float),
+    ("specific_gravity", float),
+])
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+# one (P, T, SG) state as raw bytes, the ZFactorCache key
+STATE_DTYPE = np.dtype((np.void, 3 * np.dtype(float).itemsize))
+
+class StandardizedChunk(NamedTuple):
+    # per-record results of one chunk, and running totals over every chunk so far
+    standard_volume_m3: np.ndarray
+    compressibility: np.ndarray
+    records: int
+    total_volume_m3: float
+    total_standard_volume_m3: float
+
+class ZFactorCache:
+    # compressibility factors of (P, T, SG) states already evaluated, kept across chunks so that
+    # a state repeated anywhere in the stream is evaluated once. Each chunk is reduced to its
+    # distinct states with np.unique; those already stored are read back and only the rest go
+    # to z_factor, one call per chunk. Beyond maxsize states the oldest are dropped.
+    def __init__(
+        self,
+        z_factor: Callable = z_factor_GPSA,
+        maxsize: int = 100_000
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.z_factor = z_factor
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = {}
+
+    def __call__(self, pressure_kPa: np.ndarray, temperature_K: np.ndarray, specific_gravity: np.ndarray) -> np.ndarray:
+        states = np.stack(np.broadcast_arrays(pressure_kPa, temperature_K, specific_gravity), axis=-1).astype(float)
+
+        # each (P, T, SG) row viewed as one 24-byte item: np.unique then sorts a single column
+        # instead of comparing rows (as with axis=0), and the bytes are the cache key
+        rows = np.ascontiguousarray(states.reshape(-1, 3)).view(STATE_DTYPE).ravel()
+        unique, inverse = np.unique(rows, return_inverse=True)
+        keys = unique.tolist()
+
+        # states not stored come back as None, that is NaN
+        Z_unique = np.array(list(map(self._cache.get, keys)), dtype=float)
+        missing = np.flatnonzero(np.isnan(Z_unique))
+
+        if len(missing):
+            new = unique[missing].view(float).reshape(-1, 3)
+            Z_unique[missing] = self.z_factor(new[:, 0], new[:, 1], new[:, 2])
+
+            self._cache.update(zip([keys[j] for j in missing], Z_unique[missing].tolist()))
+            excess = len(self._cache) - self.maxsize
+            if excess > 0:
+                for key in list(itertools.islice(self._cache, excess)):
+                    del self._cache[key]
+
+        # counted per distinct state of the chunk
+        self.hits += len(unique) - len(missing)
+        self.misses += len(missing)
+
+        return Z_unique[inverse.ravel()].reshape(states.shape[:-1])
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+def record_chunks(
+    records: Iterable[tuple],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[np.ndarray]:
+    # groups a stream of (P [kPa], T [K], V [m3], SG) records into RECORD_DTYPE arrays of
+    # chunk_size records (the last one shorter), without holding more than one chunk
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    return _record_chunks(iter(records), chunk_size)
+
+def _record_chunks(records: Iterator[tuple], chunk_size: int) -> Iterator[np.ndarray]:
+    while True:
+        chunk = np.fromiter(itertools.islice(records, chunk_size), dtype=RECORD_DTYPE)
+        if len(chunk) == 0:
+            return
+
+        yield chunk
+
+def standardize_gas_volumes(
+    chunks: Iterable,
+    base_pressure_kPa: float = 101.325,
+    base_temperature_K: float = 288.15,
+    z_factor: Callable = z_factor_GPSA,
+    z_cache: ZFactorCache | bool | None = None,
+) -> Iterator[StandardizedChunk]:
+    # converts chunks of meter records to standard conditions, one chunk at a time. A chunk is
+    # anything indexable by the RECORD_DTYPE field names: a structured array from record_chunks,
+    # a dict of arrays or a pandas DataFrame read with chunksize. The compressibility factors at
+    # actual and base conditions come from z_cache: a ZFactorCache of z_factor made for this
+    # call by default, a shared one to reuse Z across calls, or False to evaluate
+    # z_factor on every record.
+    _validate_positive(base_pressure_kPa, "base_pressure_kPa")
+    _validate_positive(base_temperature_K, "base_temperature_K")
+
+    if z_cache is None or z_cache is True:
+        z_cache = ZFactorCache(z_factor)
+
+    evaluate_z = z_factor if z_cache is False else z_cache
+
+    return _standardize(chunks, base_pressure_kPa, base_temperature_K, evaluate_z)
+
+def _standardize(chunks: Iterable, base_pressure_kPa: float, base_temperature_K: float,
+                 evaluate_z: Callable) -> Iterator[StandardizedChunk]:
+    records = 0
+    total_volume = 0.0
+    total_standard_volume = 0.0
+
+    for chunk in chunks:
+        P, T, V, y = (np.asarray(chunk[name], dtype=float) for name in RECORD_DTYPE.names)
+
+        # one vectorized check per chunk instead of one per record
+        _validate_positive(P, "pressure_kPa")
+        _validate_positive(T, "temperature_K")
+        _validate_positive(y, "specific_gravity")
+        if np.any(V < 0.0):
+            raise ValueError("volume_m3 must be >= 0")
+
+        Z = evaluate_z(P, T, y)
+        Z_base = evaluate_z(np.full_like(P, base_pressure_kPa), np.full_like(T, base_temperature_K), y)
+
+        V_std = V * (P / base_pressure_kPa) * (base_temperature_K / T) * (Z_base / Z)
+
+        records += len(V)
+        total_volume += float(V.sum())
+        total_standard_volume += float(V_std.sum())
+
+        yield StandardizedChunk(V_std, Z, records, total_volume, total_standard_volume)
+
+def standardize_records(
+    records: Iterable[tuple],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs,
+) -> Iterator[StandardizedChunk]:
+    # standardize_gas_volumes over a stream of (P, T, V, SG) records
+    return standardize_gas_volumes(record_chunks(records, chunk_size), **kwargs)
+
+def _validate_positive(value: float | np.ndarray, name: str) -> None:
+    if np.any(np.asarray(value) <= 0.0):
+        raise ValueError(f"{name} must be > 0")
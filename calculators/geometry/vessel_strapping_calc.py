@@ -0,0 +1,45 @@
+import numpy as np
+
+from calculators.geometry.vessel_volume_calc import Vessel
+
+class StrappingTable:
+    # level -> volume table for one vessel, built once from its Vessel geometry and then
+    # read in either direction by linear interpolation
+    def __init__(
+        self,
+        vessel_type: str,
+        head_type: str,
+        length_m: float,
+        diameter_m: float,
+        points: int = 4001
+    ):
+        if points < 2:
+            raise ValueError("points must be at least 2")
+
+        self.vessel = Vessel(vessel_type, head_type, length_m, diameter_m)
+
+        self.levels_m = np.linspace(0.0, self.vessel.max_liquid_height_m, points)
+        self.volumes_m3 = self.vessel.volume(self.levels_m)
+
+        self.max_level_m = self.vessel.max_liquid_height_m
+        self.max_volume_m3 = float(self.volumes_m3[-1])
+
+    def volume(self, liquid_height_m: float | np.ndarray) -> float | np.ndarray:
+        h = np.asarray(liquid_height_m, dtype=float)
+        _validate_within(h, self.max_level_m, "liquid_height_m")
+
+        V = np.interp(h, self.levels_m, self.volumes_m3)
+
+        return V
+
+    def level(self, volume_m3: float | np.ndarray) -> float | np.ndarray:
+        V = np.asarray(volume_m3, dtype=float)
+        _validate_within(V, self.max_volume_m3, "volume_m3")
+
+        h = np.interp(V, self.volumes_m3, self.levels_m)
+
+        return h
+
+def _validate_within(value: np.ndarray, maximum: float, name: str) -> None:
+    if np.any((value < 0.0) | (value > maximum)):
+        raise ValueError(f"{name} must be between 0 and {maximum:.3f}")
@@ -1,12 +1,20 @@
-import math
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from utilities.units import in_units
 
 def vessel_volume(
     vessel_type: str,
     head_type: str,
-    length_m: float,
-    diameter_m: float,
-    liquid_height_m: float
-) -> float:
+    length_m: float | np.ndarray,
+    diameter_m: float | np.ndarray,
+    liquid_height_m: float | np.ndarray
+) -> float | np.ndarray:
+    length_m = in_units(length_m, "m")
+    diameter_m = in_units(diameter_m, "m")
+    liquid_height_m = in_units(liquid_height_m, "m")
+
     _validate_positive_(length_m, "length_m")
     _validate_positive_(diameter_m, "diameter_m")
     _validate_positive_(liquid_height_m, "liquid_height_m")
@@ -14,9 +22,9 @@ def vessel_volume(
     
     vessel_type = vessel_type
     head_type = head_type
-    L = length_m
-    Di = diameter_m
-    h = liquid_height_m
+    L = np.asarray(length_m, dtype=float)
+    Di = np.asarray(diameter_m, dtype=float)
+    h = np.asarray(liquid_height_m, dtype=float)
     
     match vessel_type:
         case "Horizontal":
@@ -49,11 +57,11 @@ def vessel_volume(
             else:
                 z = Di / 2
 
-            hb = min(h, z)
-            ht = z - max(0, h - (L + z))
+            hb = np.minimum(h, z)
+            ht = z - np.maximum(0, h - (L + z))
 
             if head_type != "Flat":
-                h = min(max(0, h - z), L)
+                h = np.minimum(np.maximum(0, h - z), L)
             
             Vps = shell_volume(
                 vessel_type=vessel_type,
@@ -96,88 +104,209 @@ def vessel_volume(
     
 def shell_volume(
     vessel_type: str,
-    diameter_m: float,
-    length_m: float,
-    liquid_height_m: float
-) -> float:
+    diameter_m: float | np.ndarray,
+    length_m: float | np.ndarray,
+    liquid_height_m: float | np.ndarray
+) -> float | np.ndarray:
     vessel_type = vessel_type
-    Di = diameter_m
-    L = length_m
-    h = liquid_height_m
+    Di = np.asarray(diameter_m, dtype=float)
+    L = np.asarray(length_m, dtype=float)
+    h = np.asarray(liquid_height_m, dtype=float)
     
     match vessel_type:
         case "Horizontal":
-            Vp = L * Di**2 * (0.25) * math.acos(1 - 2*h/Di) - (0.5 - h/Di) * math.sqrt(h/Di - (h/Di)**2)
+            Vp = L * Di**2 * ((0.25) * np.arccos(1 - 2*h/Di) - (0.5 - h/Di) * np.sqrt(h/Di - (h/Di)**2))
         
         case "Vertical":
-            Vp = math.pi / 4 * Di**2 * h
+            Vp = np.pi / 4 * Di**2 * h
         
         case "Spherical":
-            Vp = (math.pi * h**2 * Di/2) - (math.pi * h**3 / 3)
+            Vp = (np.pi * h**2 * Di/2) - (np.pi * h**3 / 3)
 
     return Vp
 
 def head_volume(
     vessel_type: str,
     head_type: str,
-    diameter_m: float,
-    liquid_height_m: float,
-) -> float:
+    diameter_m: float | np.ndarray,
+    liquid_height_m: float | np.ndarray,
+) -> float | np.ndarray:
     vessel_type = vessel_type
     head_type = head_type
-    Di = diameter_m
-    h = liquid_height_m
+    Di = np.asarray(diameter_m, dtype=float)
+    h = np.asarray(liquid_height_m, dtype=float)
     
     match head_type:
         case "Flat":
-            Vp = 0.0
+            Vp = np.zeros_like(h * Di)
         
         case "Elliptical":
             if vessel_type == "Horizontal":
                 C = 0.5
-                Vp = Di**3 * C * math.pi / 12 * (3*(h/Di)**2 - 2*(h/Di)**3)
+                Vp = Di**3 * C * np.pi / 12 * (3*(h/Di)**2 - 2*(h/Di)**3)
             elif vessel_type == "Vertical":
                 z = Di/4
                 C = 0.5
-                Vp = Di**3 * C * math.pi / 24 * (3*(h/z)**2 - (h/z)**3)
+                Vp = Di**3 * C * np.pi / 24 * (3*(h/z)**2 - (h/z)**3)
         
         case "Hemispherical":
             if vessel_type == "Horizontal":
-                Vp = Di**3 * math.pi / 12 * (3 * (h/Di)**2 - 2*(h/Di)**3)
+                Vp = Di**3 * np.pi / 12 * (3 * (h/Di)**2 - 2*(h/Di)**3)
             elif vessel_type == "Vertical":
                 Rc = Di/2
-                Vp  = math.pi / 3 * h**2 * (3*Rc - h)
+                Vp  = np.pi / 3 * h**2 * (3*Rc - h)
                 
     return Vp
 
-def _validate_positive_(value: float, name:str) -> None:
-    if value <= 0.0:
+@dataclass(frozen=True, slots=True)
+class Vessel:
+    # vessel geometry resolved once: the formula branch for the vessel/head type and
+    # its constants are picked at construction, so volume() only evaluates arithmetic
+    vessel_type: str
+    head_type: str
+    length_m: float
+    diameter_m: float
+    max_liquid_height_m: float = field(init=False)
+    _volume: object = field(init=False, repr=False, compare=False)
+    _constants: tuple = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        _validate_positive_(self.length_m, "length_m")
+        _validate_positive_(self.diameter_m, "diameter_m")
+        
+        L = float(self.length_m)
+        Di = float(self.diameter_m)
+        
+        match self.vessel_type:
+            case "Horizontal":
+                # both heads together, as a multiple of 3(h/Di)**2 - 2(h/Di)**3
+                match self.head_type:
+                    case "Flat":
+                        C_heads = 0.0
+                    case "Elliptical":
+                        C_heads = Di**3 * np.pi / 12
+                    case "Hemispherical":
+                        C_heads = Di**3 * np.pi / 6
+                    case _:
+                        raise ValueError(f"Unknown head type '{self.head_type}'")
+                
+                volume = Vessel._horizontal_volume
+                constants = (Di, L * Di**2, C_heads)
+            
+            case "Vertical":
+                # each head volume written as h**2 * (a - b*h), with dish depth z
+                match self.head_type:
+                    case "Flat":
+                        z, a, b = 0.0, 0.0, 0.0
+                    case "Elliptical":
+                        z = Di / 4
+                        a = Di**3 * np.pi / 16 / z**2
+                        b = Di**3 * np.pi / 48 / z**3
+                    case "Hemispherical":
+                        z = Di / 2
+                        a = np.pi * z
+                        b = np.pi / 3
+                    case _:
+                        raise ValueError(f"Unknown head type '{self.head_type}'")
+                
+                volume = Vessel._vertical_volume
+                constants = (np.pi / 4 * Di**2, L, z, a, b, z**2 * (a - b*z))
+            
+            case "Spherical":
+                volume = Vessel._spherical_volume
+                constants = (np.pi * Di / 2, np.pi / 3)
+            
+            case _:
+                raise ValueError(f"Unknown vessel type '{self.vessel_type}'")
+        
+        h_max = float(max_liquid_height(self.vessel_type, self.head_type, Di, L))
+        
+        object.__setattr__(self, "max_liquid_height_m", h_max)
+        object.__setattr__(self, "_volume", volume)
+        object.__setattr__(self, "_constants", constants)
+    
+    def volume(self, liquid_height_m: float | np.ndarray) -> float | np.ndarray:
+        h = np.asarray(liquid_height_m, dtype=float)
+        
+        if h.ndim == 0:
+            # plain float arithmetic is much cheaper than 0-d array operations
+            h = float(h)
+            out_of_range = not 0.0 <= h <= self.max_liquid_height_m
+        else:
+            out_of_range = np.any((h < 0.0) | (h > self.max_liquid_height_m))
+        
+        if out_of_range:
+            raise ValueError(f"Liquid height must be between 0 and {self.max_liquid_height_m:.3f} m")
+        
+        return self._volume(self, h)
+    
+    def _horizontal_volume(self, h: np.ndarray) -> float | np.ndarray:
+        Di, C_shell, C_heads = self._constants
+        x = h / Di
+        
+        Vp = C_shell * (0.25 * np.arccos(1 - 2*x) - (0.5 - x) * np.sqrt(x - x*x)) + C_heads * x*x * (3 - 2*x)
+        
+        return Vp
+    
+    def _vertical_volume(self, h: np.ndarray) -> float | np.ndarray:
+        A, L, z, a, b, V_head = self._constants
+        
+        hs = np.minimum(np.maximum(h - z, 0.0), L)
+        hb = np.minimum(h, z)
+        ht = z - np.maximum(h - (L + z), 0.0)
+        
+        Vp = A * hs + hb*hb * (a - b*hb) + V_head - ht*ht * (a - b*ht)
+        
+        return Vp
+    
+    def _spherical_volume(self, h: np.ndarray) -> float | np.ndarray:
+        a, b = self._constants
+        
+        Vp = h*h * (a - b*h)
+        
+        return Vp
+
+def _validate_positive_(value: float | np.ndarray, name:str) -> None:
+    if np.any(np.asarray(value) <= 0.0):
         raise ValueError(f"{name} must be > 0")
 
+def max_liquid_height(
+    vessel_type: str,
+    head_type: str,
+    diameter_m: float | np.ndarray,
+    length_m: float | np.ndarray
+) -> float | np.ndarray:
+    Di = np.asarray(diameter_m, dtype=float)
+    L = np.asarray(length_m, dtype=float)
+    
+    if vessel_type == "Horizontal":
+        h_max = Di
+    
+    elif vessel_type == "Vertical":
+        if head_type == "Flat":
+            h_max = L
+        elif head_type =="Elliptical":
+            h_max = L + 2*(Di/4)
+        elif head_type == "Hemispherical":
+            h_max = L + 2*(Di/2)
+    
+    elif vessel_type == "Spherical":
+        h_max = Di
+    
+    return h_max
+
 def _validate_liquid_height_(
     vessel_type: str,
     head_type: str, 
-    diameter_m: float, 
-    length_m: float, 
-    liquid_height_m: float
+    diameter_m: float | np.ndarray, 
+    length_m: float | np.ndarray, 
+    liquid_height_m: float | np.ndarray
     ) -> None:
-        Di = diameter_m
-        L = length_m
-        h = liquid_height_m
-        
-        if vessel_type == "Horizontal":
-            h_max = Di
-        
-        elif vessel_type == "Vertical":
-            if head_type == "Flat":
-                h_max = L
-            elif head_type =="Elliptical":
-                h_max = L + 2*(Di/4)
-            elif head_type == "Hemispherical":
-                h_max = L + 2*(Di/2)
-        
-        elif vessel_type == "Spherical":
-            h_max = Di
+        h = np.asarray(liquid_height_m, dtype=float)
+        h_max = max_liquid_height(vessel_type, head_type, diameter_m, length_m)
             
-        if h > h_max:
-            raise ValueError(f"Liquid height must be below {h_max:.3f} m")
\ No newline at end of file
+        h_max = np.broadcast_to(h_max, np.broadcast_shapes(np.shape(h_max), h.shape))
+        over = h > h_max
+        
+        if np.any(over):
+            raise ValueError(f"Liquid height must be below {np.min(h_max[over]):.3f} m")
\ No newline at end of file
@@ -0,0 +1,199 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable
+
+import numpy as np
+
+from calculators.registry import get_calculator
+from utilities.units import Quantity
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+class ParallelExecutor:
+    # runs a calculator over a batch of cases on a pool of worker processes. The per-case inputs
+    # are copied once into a shared memory block that every worker reads its chunk from, so only
+    # the chunk bounds (and the calculator name and constants) are sent with each task; results
+    # come back one array per chunk and are put back together in case order.
+    # The pool is started on first use and kept until close(), so one executor can serve many
+    # batches (e.g. every chunk read by batch.py) without restarting the workers.
+    def __init__(
+        self,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        mp_context=None
+    ):
+        workers = os.cpu_count() if workers is None else workers
+
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.mp_context = mp_context
+        self._pool = None
+
+    def map(
+        self,
+        calculator: str | Callable,
+        inputs: dict[str, np.ndarray],
+        constants: dict | None = None,
+        units: dict | None = None,
+        vectorized: bool = True,
+    ):
+        # calculator is a registry name (or a module-level function). inputs holds one array of
+        # case values per parameter, constants the values shared by every case, and units the
+        # unit of any input not in the unit of its parameter name. vectorized=False calls the
+        # calculator once per case, for calculators that only take scalars.
+        constants = constants or {}
+        units = units or {}
+
+        names = tuple(inputs)
+        columns = [np.asarray(inputs[name], dtype=float) for name in names]
+        n = _validate_columns(names, columns)
+
+        for name in units:
+            if name not in inputs and name not in constants:
+                raise ValueError(f"units given for unknown input '{name}'")
+
+        chunks = [(start, min(start + self.chunk_size, n)) for start in range(0, n, self.chunk_size)]
+
+        if self.workers == 1 or len(chunks) <= 1:
+            # not worth a round trip through the pool
+            data = np.stack(columns)
+            results = [_run_chunk(calculator, data, names, constants, units, vectorized, start, stop)
+                       for start, stop in chunks]
+
+            return _join_results(results)
+
+        shm = shared_memory.SharedMemory(create=True, size=max(len(names) * n * 8, 1))
+
+        try:
+            data = np.ndarray((len(names), n), dtype=float, buffer=shm.buf)
+            for row, column in zip(data, columns):
+                row[:] = column
+            del data
+
+            tasks = [(shm.name, (len(names), n), names, calculator, constants, units, vectorized, start, stop)
+                     for start, stop in chunks]
+
+            # map yields results in task order, whichever worker finishes first
+            results = list(self._get_pool().map(_run_shared_chunk, tasks))
+
+        finally:
+            shm.close()
+            shm.unlink()
+
+        return _join_results(results)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "ParallelExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=self.mp_context)
+
+        return self._pool
+
+def parallel_map(
+    calculator: str | Callable,
+    inputs: dict[str, np.ndarray],
+    constants: dict | None = None,
+    units: dict | None = None,
+    vectorized: bool = True,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+):
+    # one batch on a pool started and shut down for it
+    with ParallelExecutor(workers=workers, chunk_size=chunk_size) as executor:
+        return executor.map(calculator, inputs, constants=constants, units=units, vectorized=vectorized)
+
+# shared memory block each worker process is attached to, kept between tasks of the same batch
+_attached = {}
+
+def _run_shared_chunk(task: tuple):
+    shm_name, shape, names, calculator, constants, units, vectorized, start, stop = task
+
+    if _attached.get("name") != shm_name:
+        _detach()
+        shm = shared_memory.SharedMemory(name=shm_name)
+        data = np.ndarray(shape, dtype=float, buffer=shm.buf)
+        # the block is shared with every other worker: calculators only get read-only views
+        data.flags.writeable = False
+        _attached.update(name=shm_name, shm=shm, data=data)
+
+    return _run_chunk(calculator, _attached["data"], names, constants, units, vectorized, start, stop)
+
+def _detach() -> None:
+    if "shm" in _attached:
+        shm = _attached["shm"]
+        _attached.clear()
+        shm.close()
+
+def _run_chunk(calculator: str | Callable, data: np.ndarray, names: tuple, constants: dict,
+               units: dict, vectorized: bool, start: int, stop: int):
+    func = get_calculator(calculator) if isinstance(calculator, str) else calculator
+
+    def arguments(values) -> dict:
+        kwargs = dict(zip(names, values), **constants)
+        for name, unit in units.items():
+            kwargs[name] = Quantity(kwargs[name], unit)
+        return kwargs
+
+    try:
+        if vectorized:
+            result = func(**arguments(data[:, start:stop]))
+            return _broadcast_result(result, stop - start)
+
+        results = [func(**arguments(values)) for values in data[:, start:stop].T.tolist()]
+        return _stack_results(results)
+
+    except ValueError as e:
+        raise ValueError(f"cases {start}-{stop - 1}: {e}") from e
+
+def _broadcast_result(result, n_cases: int):
+    # calculators return scalars for inputs that are all constants
+    if hasattr(result, "_fields"):
+        return result._make(np.broadcast_to(value, (n_cases,)) for value in result)
+
+    return np.broadcast_to(result, (n_cases,))
+
+def _stack_results(results: list):
+    if results and hasattr(results[0], "_fields"):
+        return results[0]._make(np.array(field) for field in zip(*results))
+
+    return np.array(results)
+
+def _join_results(results: list):
+    if not results:
+        return np.empty(0)
+
+    if hasattr(results[0], "_fields"):
+        return results[0]._make(np.concatenate(field) for field in zip(*results))
+
+    return np.concatenate(results)
+
+def _validate_columns(names: tuple, columns: list[np.ndarray]) -> int:
+    if not columns:
+        raise ValueError("inputs must hold at least one array of case values")
+
+    for name, column in zip(names, columns):
+        if column.ndim != 1:
+            raise ValueError(f"input '{name}' must be a 1-D array of case values; give shared values in constants")
+
+    n = len(columns[0])
+    for name, column in zip(names, columns):
+        if len(column) != n:
+            raise ValueError(f"input '{name}' has {len(column)} cases, expected {n}")
+
+    return n
@@ -1,15 +1,75 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from utilities.units import in_units, unit_conversion
+
+class ErosionalScreening(NamedTuple):
+    velocity_m_s: np.ndarray
+    erosional_velocity_m_s: np.ndarray
+    velocity_ratio: np.ndarray
+    # lines over the limit, worst (highest velocity ratio) first
+    violations: np.ndarray
+
 def erosional_velocity(
-    service_factor: float,
-    mixture_density_lb_ft3: float
+    service_factor: float | np.ndarray,
+    mixture_density_lb_ft3: float | np.ndarray
     
-) -> float:
-    #TODO: add validation
+) -> float | np.ndarray:
+    # the bare API RP 14E limit, left unvalidated so single lines stay cheap;
+    # erosional_velocity_screening validates whole line lists
     
-    C = service_factor
-    rho_m = mixture_density_lb_ft3
+    mixture_density_lb_ft3 = in_units(mixture_density_lb_ft3, "lb/ft3")
+    
+    C = np.asarray(service_factor, dtype=float)
+    rho_m = np.asarray(mixture_density_lb_ft3, dtype=float)
     
     # calculate erosional velocity
-    Ve = C / rho_m**0.5
+    Ve = C / np.sqrt(rho_m)
     
-    return Ve
+    return Ve[()]
+
+def erosional_velocity_screening(
+    inside_diameter_m: float | np.ndarray,
+    flowrate_m3_s: float | np.ndarray,
+    mixture_density_kg_m3: float | np.ndarray,
+    service_factor: float | np.ndarray = 100.0,
+    limit_fraction: float = 1.0,
+) -> ErosionalScreening:
+    # screens a line list against API RP 14E: one value per line of the inside diameter, the
+    # actual mixture flow rate and density (service_factor may also differ per line). A line is
+    # in violation when its velocity exceeds limit_fraction times its erosional velocity.
+    inside_diameter_m = in_units(inside_diameter_m, "m")
+    flowrate_m3_s = in_units(flowrate_m3_s, "m3/s")
+    mixture_density_kg_m3 = in_units(mixture_density_kg_m3, "kg/m3")
+
+    _validate_positive(inside_diameter_m, "inside_diameter")
+    _validate_positive(mixture_density_kg_m3, "mixture_density")
+    _validate_positive(service_factor, "service_factor")
+    _validate_positive(limit_fraction, "limit_fraction")
+    if np.any(np.asarray(flowrate_m3_s) < 0.0):
+        raise ValueError("flowrate must be >= 0")
+
+    D = np.asarray(inside_diameter_m, dtype=float)
+    Q = np.asarray(flowrate_m3_s, dtype=float)
+    rho_m = np.asarray(mixture_density_kg_m3, dtype=float)
+    C = np.asarray(service_factor, dtype=float)
+
+    V = Q / (np.pi / 4 * D**2)
+
+    # API RP 14E in US units, folded into one factor: Ve [m/s] = C * k / sqrt(rho [kg/m3])
+    k = unit_conversion("ft/s", "m/s").scale / np.sqrt(unit_conversion("kg/m3", "lb/ft3").scale)
+    Ve = C * k / np.sqrt(rho_m)
+
+    ratio = V / Ve
+    V, Ve, ratio = np.broadcast_arrays(V, Ve, ratio)
+
+    # only the few lines over the limit are sorted
+    violations = np.flatnonzero(ratio > limit_fraction)
+    violations = violations[np.argsort(-ratio.ravel()[violations], kind="stable")]
+
+    return ErosionalScreening(V[()], Ve[()], ratio[()], violations)
 
+def _validate_positive(value: float | np.ndarray, name: str) -> None:
+    if np.any(np.asarray(value) <= 0.0):
+        raise ValueError(f"{name} must be > 0")
@@ -0,0 +1,69 @@
+import numpy as np
+
+_LN10 = np.log(10)
+
+def friction_factor_serghides(
+    reynolds_number: float | np.ndarray,
+    relative_roughness: float | np.ndarray
+) -> float | np.ndarray:
+    _validate_positive(reynolds_number, "reynolds_number")
+    _validate_non_negative(relative_roughness, "relative_roughness")
+
+    Re = np.asarray(reynolds_number, dtype=float)
+    e = np.asarray(relative_roughness, dtype=float) / 3.7
+
+    # calculate Darcy friction factor via Serghides' solution
+    A = -2 * np.log10(e + 12/Re)
+    B = -2 * np.log10(e + 2.51*A/Re)
+    C = -2 * np.log10(e + 2.51*B/Re)
+    f_inv = A - ((B-A)**2 / (C - 2*B + A))
+    f = f_inv**-2
+
+    return f
+
+def friction_factor_colebrook(
+    reynolds_number: float | np.ndarray,
+    relative_roughness: float | np.ndarray,
+    tolerance: float = 1e-12,
+    max_iterations: int = 20
+) -> float | np.ndarray:
+    # solve 1/sqrt(f) = -2 log10(e/3.7 + 2.51/(Re sqrt(f))) by Newton's method on
+    # x = 1/sqrt(f), started from Serghides' solution; converged elements drop out
+    f0 = friction_factor_serghides(reynolds_number, relative_roughness)
+
+    Re, e = np.broadcast_arrays(
+        np.asarray(reynolds_number, dtype=float),
+        np.asarray(relative_roughness, dtype=float) / 3.7
+    )
+    shape = Re.shape
+    a = (2.51 / Re).ravel()
+    e = e.ravel()
+    x = np.broadcast_to(f0**-0.5, shape).ravel().copy()
+
+    active = np.arange(x.size)
+
+    for _ in range(max_iterations):
+        xa = x[active]
+        arg = e[active] + a[active] * xa
+        F = xa + 2 * np.log10(arg)
+        dF = 1 + 2 / _LN10 * a[active] / arg
+        dx = F / dF
+        x[active] = xa - dx
+
+        active = active[np.abs(dx) > tolerance * np.abs(xa)]
+        if active.size == 0:
+            break
+    else:
+        raise ValueError(f"Colebrook-White solution did not converge for {active.size} value(s)")
+
+    f = x.reshape(shape)**-2
+
+    return f[()]
+
+def _validate_positive(value: float | np.ndarray, name: str) -> None:
+    if np.any(np.asarray(value) <= 0.0):
+        raise ValueError(f"{name} must be > 0")
+
+def _validate_non_negative(value: float | np.ndarray, name: str) -> None:
+    if np.any(np.asarray(value) < 0.0):
+        raise ValueError(f"{name} must be >= 0")
@@ -0,0 +1,244 @@
+import warnings
+from typing import NamedTuple
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from utilities.thermo_utils import z_factor_GPSA
+from calculators.pipe_flow.friction_factor_calc import friction_factor_serghides
+
+# standard (base) conditions for flows in Sm3
+BASE_PRESSURE_kPa = 101.325
+BASE_TEMPERATURE_K = 288.15
+
+R_UNIVERSAL = 8314.46   # J/kmol/K
+MW_AIR = 28.9644        # kg/kmol
+
+# relative node imbalance below which the solver takes full Newton steps
+NEWTON_SWITCH_IMBALANCE = 0.1
+
+class GasNetworkSolution(NamedTuple):
+    pressure_kPa: np.ndarray
+    pipe_flow_sm3_d: np.ndarray
+    compressor_flow_sm3_d: np.ndarray
+    supply_sm3_d: np.ndarray
+    iterations: int
+
+def solve_gas_network(
+    node_pressure_kPa: np.ndarray,
+    node_demand_sm3_d: np.ndarray,
+    pipe_from: np.ndarray,
+    pipe_to: np.ndarray,
+    pipe_length_m: np.ndarray,
+    pipe_diameter_m: np.ndarray,
+    pipe_roughness_m: float | np.ndarray,
+    specific_gravity: float,
+    temperature_K: float,
+    viscosity_Pa_s: float = 1.1e-5,
+    compressor_from: np.ndarray = (),
+    compressor_to: np.ndarray = (),
+    compressor_ratio: np.ndarray = (),
+    tolerance: float = 1e-6,
+    max_iterations: int = 100,
+) -> GasNetworkSolution:
+    # node_pressure_kPa holds the absolute pressure of fixed-pressure nodes (sources/delivery
+    # points) and NaN for nodes to be solved; node_demand_sm3_d is the withdrawal at each node
+    # (negative for a fixed-rate supply) and is ignored at fixed-pressure nodes.
+    # Compressors raise pressure from their from (suction) node to their to (discharge)
+    # node by a fixed ratio and carry whatever flow the network needs.
+    P_fixed = np.asarray(node_pressure_kPa, dtype=float)
+    d = np.asarray(node_demand_sm3_d, dtype=float) / 86400
+    n_nodes = P_fixed.size
+
+    pipe_from = np.asarray(pipe_from, dtype=np.intp)
+    pipe_to = np.asarray(pipe_to, dtype=np.intp)
+    n_pipes = pipe_from.size
+    L = np.broadcast_to(np.asarray(pipe_length_m, dtype=float), (n_pipes,))
+    D = np.broadcast_to(np.asarray(pipe_diameter_m, dtype=float), (n_pipes,))
+    epsilon = np.broadcast_to(np.asarray(pipe_roughness_m, dtype=float), (n_pipes,))
+
+    comp_from = np.asarray(compressor_from, dtype=np.intp)
+    comp_to = np.asarray(compressor_to, dtype=np.intp)
+    n_comp = comp_from.size
+    ratio = np.broadcast_to(np.asarray(compressor_ratio, dtype=float), (n_comp,))
+
+    fixed = ~np.isnan(P_fixed)
+    free = np.flatnonzero(~fixed)
+    n_free = free.size
+
+    _validate_network(n_nodes, d, fixed, P_fixed, pipe_from, pipe_to, L, D, epsilon,
+                      comp_from, comp_to, ratio, specific_gravity, temperature_K, viscosity_Pa_s)
+
+    r2 = ratio**2
+
+    y = specific_gravity
+    T = temperature_K
+    mu = viscosity_Pa_s
+
+    # gas density at base conditions, kg/Sm3
+    rho_b = BASE_PRESSURE_kPa * 1000 * y * MW_AIR / (R_UNIVERSAL * BASE_TEMPERATURE_K)
+
+    # K such that P1**2 - P2**2 = K * Z * f * Q|Q| [kPa**2, Sm3/s], from the isothermal
+    # general flow equation
+    A_pipe = np.pi / 4 * D**2
+    K_geom = L * R_UNIVERSAL * T * rho_b**2 / (D * A_pipe**2 * y * MW_AIR) / 1e6
+
+    # node-branch incidence: +1 where a branch leaves a node, -1 where it enters
+    A = _incidence(pipe_from, pipe_to, n_nodes)
+    B = _incidence(comp_from, comp_to, n_nodes)
+    A_free = A[free]
+    B_free = B[free]
+
+    # unknowns are squared pressures (kPa**2) of free nodes, then compressor flows (Sm3/s)
+    pi_ref = np.nanmax(P_fixed)**2
+    pi = np.where(fixed, P_fixed**2, pi_ref)
+    q = np.zeros(n_comp)
+    Q = np.zeros(n_pipes)
+
+    # compressor equations pi_d - r**2 pi_s = 0, scaled to the order of 1
+    C_all = (sp.csr_matrix((np.ones(n_comp), (np.arange(n_comp), comp_to)), shape=(n_comp, n_nodes))
+             - sp.csr_matrix((r2, (np.arange(n_comp), comp_from)), shape=(n_comp, n_nodes))) / pi_ref
+    C_free = C_all[:, free]
+
+    # flow at Re = 2000, Sm3/s
+    Q_lam = 2000 * np.pi * D * mu / (4 * rho_b)
+
+    flow_scale = max(np.sum(np.abs(d[free])), 1e-12)
+
+    for iteration in range(1, max_iterations + 1):
+        dpi = pi[pipe_from] - pi[pipe_to]
+
+        # friction factor and Z-factor lagged at the current flows and pressures
+        P = np.sqrt(pi)
+        P1 = P[pipe_from]
+        P2 = P[pipe_to]
+        P_avg = 2 / 3 * (P1 + P2 - P1 * P2 / (P1 + P2))
+        Z = z_factor_GPSA(P_avg, T, y)
+        Re = np.maximum(4 * rho_b * np.abs(Q) / (np.pi * D * mu), 4000.0)
+        f = friction_factor_serghides(Re, epsilon / D)
+        K = K_geom * Z * f
+
+        # P1**2 - P2**2 = K Q|Q|, made linear below the laminar transition flow
+        # (dpi_lam) so that dQ/d(dpi) stays finite through zero flow
+        dpi_lam = K * Q_lam**2
+        dpi_abs = np.abs(dpi)
+        denom = np.sqrt(K * (dpi_abs + dpi_lam))
+        Q_new = dpi / denom
+
+        # f and Z lag one iteration behind, so the flows must have settled as well
+        settled = np.max(np.abs(Q_new - Q), initial=0.0) <= tolerance * max(np.max(np.abs(Q_new), initial=0.0), flow_scale)
+        Q = Q_new
+
+        F_node = A_free @ Q + B_free @ q + d[free]
+        F_comp = C_all @ pi
+
+        imbalance = np.max(np.abs(F_node), initial=0.0) / flow_scale
+
+        if settled and imbalance <= tolerance and np.max(np.abs(F_comp), initial=0.0) <= tolerance:
+            break
+
+        if n_free == 0:
+            # every pressure is fixed (and so no compressor is allowed), only the flows are iterated
+            continue
+
+        # branch conductances dQ/d(dpi): far from the solution use the secant Q/dpi
+        # (linear theory method), which does not overshoot like Newton does on the
+        # square-root flow law; switch to the exact Newton derivative once close.
+        # Every free node starts at the same pressure, so the first pass assumes a drop.
+        if iteration == 1:
+            g = 1 / np.sqrt(K * (1e-2 * pi_ref + dpi_lam))
+        elif imbalance > NEWTON_SWITCH_IMBALANCE:
+            g = 1 / denom
+        else:
+            g = (dpi_abs / 2 + dpi_lam) / (denom * (dpi_abs + dpi_lam))
+
+        J_pp = A_free @ sp.diags(g) @ A_free.T
+        if n_comp:
+            J = sp.bmat([[J_pp, B_free], [C_free, None]], format="csc")
+            F = np.concatenate([F_node, F_comp])
+        else:
+            J = J_pp.tocsc()
+            F = F_node
+
+        with warnings.catch_warnings():
+            # a singular Jacobian is reported below as a disconnected network
+            warnings.simplefilter("ignore", spla.MatrixRankWarning)
+            dx = spla.spsolve(J, -F, permc_spec="MMD_AT_PLUS_A")
+
+        if not np.all(np.isfinite(dx)):
+            raise ValueError("Network could not be solved, check that every part of it is connected to a fixed-pressure node")
+
+        dpi_free = dx[:n_free]
+
+        # damp the step so that no squared pressure goes below 1% of its current value
+        shrinking = dpi_free < 0
+        alpha = min(1.0, np.min(0.99 * pi[free][shrinking] / -dpi_free[shrinking], initial=1.0))
+
+        pi[free] += alpha * dpi_free
+        q += alpha * dx[n_free:]
+    else:
+        raise ValueError(f"Network solution did not converge in {max_iterations} iterations")
+
+    supply = A @ Q + B @ q
+    supply[~fixed] = 0.0
+
+    return GasNetworkSolution(
+        pressure_kPa=np.sqrt(pi),
+        pipe_flow_sm3_d=Q * 86400,
+        compressor_flow_sm3_d=q * 86400,
+        supply_sm3_d=supply * 86400,
+        iterations=iteration,
+    )
+
+def _incidence(branch_from: np.ndarray, branch_to: np.ndarray, n_nodes: int) -> sp.csr_matrix:
+    n = branch_from.size
+    rows = np.concatenate([branch_from, branch_to])
+    cols = np.concatenate([np.arange(n), np.arange(n)])
+    vals = np.concatenate([np.ones(n), -np.ones(n)])
+
+    return sp.csr_matrix((vals, (rows, cols)), shape=(n_nodes, n))
+
+def _validate_network(
+    n_nodes, d, fixed, P_fixed, pipe_from, pipe_to, L, D, epsilon,
+    comp_from, comp_to, ratio, specific_gravity, temperature_K, viscosity_Pa_s
+) -> None:
+    if d.shape != (n_nodes,):
+        raise ValueError("node_demand_sm3_d must have one value per node")
+
+    if not np.any(fixed):
+        raise ValueError("At least one node must have a fixed pressure")
+
+    if np.any(P_fixed[fixed] <= 0.0):
+        raise ValueError("Fixed node pressures must be > 0")
+
+    for name, index in (("pipe_from", pipe_from), ("pipe_to", pipe_to),
+                        ("compressor_from", comp_from), ("compressor_to", comp_to)):
+        if np.any((index < 0) | (index >= n_nodes)):
+            raise ValueError(f"{name} must contain node indices between 0 and {n_nodes - 1}")
+
+    if pipe_to.size != pipe_from.size or comp_to.size != comp_from.size:
+        raise ValueError("Branch from/to arrays must be the same length")
+
+    if np.any(pipe_from == pipe_to):
+        raise ValueError("Pipes must connect two different nodes")
+
+    if np.any(fixed[comp_from] & fixed[comp_to]):
+        raise ValueError("A compressor cannot connect two fixed-pressure nodes")
+
+    _validate_positive(L, "pipe_length_m")
+    _validate_positive(D, "pipe_diameter_m")
+    _validate_positive(specific_gravity, "specific_gravity")
+    _validate_positive(temperature_K, "temperature_K")
+    _validate_positive(viscosity_Pa_s, "viscosity_Pa_s")
+
+    if np.any(epsilon < 0.0):
+        raise ValueError("pipe_roughness_m must be >= 0")
+
+    # compressors only boost, a ratio below 1 is a pressure reduction
+    if np.any(ratio < 1.0):
+        raise ValueError("compressor_ratio must be >= 1")
+
+def _validate_positive(value: float | np.ndarray, name: str) -> None:
+    if np.any(np.asarray(value) <= 0.0):
+        raise ValueError(f"{name} must be > 0")
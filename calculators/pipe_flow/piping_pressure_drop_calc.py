@@ -0,0 +1,105 @@
+import numpy as np
+
+from utilities.constants import constants
+from calculators.pipe_flow.friction_factor_calc import friction_factor_serghides
+from calculators.thermo.reynolds_calc import LAMINAR_LIMIT
+from utilities.units import in_units
+
+def segment_pressure_drop(
+    flowrate_m3_s: float | np.ndarray,
+    fluid_density_kg_m3: float | np.ndarray,
+    viscosity_Pa_s: float | np.ndarray,
+    pipe_diameter_m: float | np.ndarray,
+    pipe_roughness_m: float | np.ndarray,
+    length_m: float | np.ndarray,
+    fittings_k: float | np.ndarray = 0.0,
+    elevation_change_m: float | np.ndarray = 0.0,
+) -> float | np.ndarray:
+    flowrate_m3_s = in_units(flowrate_m3_s, "m3/s")
+    fluid_density_kg_m3 = in_units(fluid_density_kg_m3, "kg/m3")
+    viscosity_Pa_s = in_units(viscosity_Pa_s, "Pa.s")
+    pipe_diameter_m = in_units(pipe_diameter_m, "m")
+    pipe_roughness_m = in_units(pipe_roughness_m, "m")
+    length_m = in_units(length_m, "m")
+    elevation_change_m = in_units(elevation_change_m, "m")
+
+    _validate_positive(flowrate_m3_s, "flowrate_m3_s")
+    _validate_positive(fluid_density_kg_m3, "fluid_density_kg_m3")
+    _validate_positive(viscosity_Pa_s, "viscosity_Pa_s")
+    _validate_positive(pipe_diameter_m, "pipe_diameter_m")
+    _validate_non_negative(pipe_roughness_m, "pipe_roughness_m")
+    _validate_non_negative(length_m, "length_m")
+    _validate_non_negative(fittings_k, "fittings_k")
+
+    Q = np.asarray(flowrate_m3_s, dtype=float)
+    rho = np.asarray(fluid_density_kg_m3, dtype=float)
+    mu = np.asarray(viscosity_Pa_s, dtype=float)
+    d = np.asarray(pipe_diameter_m, dtype=float)
+    epsilon = np.asarray(pipe_roughness_m, dtype=float)
+    L = np.asarray(length_m, dtype=float)
+    K = np.asarray(fittings_k, dtype=float)
+    dz = np.asarray(elevation_change_m, dtype=float)
+    g = constants['g']
+
+    # calculate velocity and Reynolds Number
+    V = Q / (np.pi / 4 * d**2)
+    Re = rho * V * d / mu
+
+    # calculate Darcy friction factor, 64/Re for laminar flow (as classified by reynolds_regimes),
+    # else Serghides' solution
+    f = np.where(Re < LAMINAR_LIMIT, 64 / Re, friction_factor_serghides(Re, epsilon/d))
+
+    # calculate frictional + fittings losses via Darcy-Weisbach, plus static head
+    dP_Pa = (f * L / d + K) * rho * V**2 / 2 + rho * g * dz
+
+    dP_kPa = dP_Pa / 1000
+
+    return dP_kPa[()]
+
+def line_pressure_drop(
+    line_id: np.ndarray,
+    flowrate_m3_s: float | np.ndarray,
+    fluid_density_kg_m3: float | np.ndarray,
+    viscosity_Pa_s: float | np.ndarray,
+    pipe_diameter_m: np.ndarray,
+    pipe_roughness_m: float | np.ndarray,
+    length_m: np.ndarray,
+    fittings_k: float | np.ndarray = 0.0,
+    elevation_change_m: float | np.ndarray = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    # segment properties are 1-D arrays along the segment axis (the last axis);
+    # a leading axis on the flow/fluid inputs evaluates several flow cases at once
+    line_id = np.asarray(line_id)
+
+    if line_id.ndim != 1:
+        raise ValueError("line_id must be a 1-D array with one entry per segment")
+
+    dP_kPa = segment_pressure_drop(
+        flowrate_m3_s=flowrate_m3_s,
+        fluid_density_kg_m3=fluid_density_kg_m3,
+        viscosity_Pa_s=viscosity_Pa_s,
+        pipe_diameter_m=pipe_diameter_m,
+        pipe_roughness_m=pipe_roughness_m,
+        length_m=length_m,
+        fittings_k=fittings_k,
+        elevation_change_m=elevation_change_m,
+    )
+    dP_kPa = np.broadcast_to(dP_kPa, np.broadcast_shapes(np.shape(dP_kPa), line_id.shape))
+
+    # sum segments per line: sort segments by line, then reduce each contiguous run
+    order = np.argsort(line_id, kind="stable")
+    sorted_ids = line_id[order]
+    starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+
+    lines = sorted_ids[starts]
+    line_dP_kPa = np.add.reduceat(dP_kPa[..., order], starts, axis=-1)
+
+    return lines, line_dP_kPa
+
+def _validate_positive(value: float | np.ndarray, name: str) -> None:
+    if np.any(np.asarray(value) <= 0.0):
+        raise ValueError(f"{name} must be > 0")
+
+def _validate_non_negative(value: float | np.ndarray, name: str) -> None:
+    if np.any(np.asarray(value) < 0.0):
+        raise ValueError(f"{name} must be >= 0")
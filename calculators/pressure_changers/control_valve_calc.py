@@ -0,0 +1,179 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from utilities.thermo_utils import z_factor_GPSA
+from utilities.units import in_units
+
+# IEC 60534-2-1 numerical constants for Cv with flow in m3/h or kg/h, pressure in kPa and T in K
+N1 = 0.0865
+N8 = 0.948
+
+RHO_WATER = 1000.0      # kg/m3, reference density of the liquid specific gravity
+MW_AIR = 28.9644        # kg/kmol
+
+CHARACTERISTICS = ("Equal Percentage", "Linear")
+
+class ValveCv(NamedTuple):
+    cv: float | np.ndarray
+    choked: bool | np.ndarray
+
+def liquid_valve_cv(
+    flowrate_m3_s: float | np.ndarray,
+    inlet_pressure_kPa: float | np.ndarray,
+    outlet_pressure_kPa: float | np.ndarray,
+    fluid_density_kg_m3: float | np.ndarray,
+    vapor_pressure_kPa: float | np.ndarray,
+    critical_pressure_kPa: float | np.ndarray = 22064.0,
+    liquid_recovery_factor: float | np.ndarray = 0.9,
+) -> ValveCv:
+    # IEC 60534-2-1 (ISA-75.01.01) turbulent liquid sizing without attached fittings (Fp = 1).
+    # Every input may be an array of operating cases.
+    flowrate_m3_s = in_units(flowrate_m3_s, "m3/s")
+    inlet_pressure_kPa = in_units(inlet_pressure_kPa, "kPa")
+    outlet_pressure_kPa = in_units(outlet_pressure_kPa, "kPa")
+    fluid_density_kg_m3 = in_units(fluid_density_kg_m3, "kg/m3")
+    vapor_pressure_kPa = in_units(vapor_pressure_kPa, "kPa")
+    critical_pressure_kPa = in_units(critical_pressure_kPa, "kPa")
+
+    _validate_positive(flowrate_m3_s, "flowrate_m3_s")
+    _validate_positive(fluid_density_kg_m3, "fluid_density_kg_m3")
+    _validate_positive(critical_pressure_kPa, "critical_pressure_kPa")
+    _validate_fraction(liquid_recovery_factor, "liquid_recovery_factor")
+
+    if np.any(np.asarray(vapor_pressure_kPa) < 0.0):
+        raise ValueError("vapor_pressure_kPa must be >= 0")
+
+    Q, P1, P2, rho, Pv, Pc, FL = (np.asarray(value, dtype=float) for value in (
+        flowrate_m3_s, inlet_pressure_kPa, outlet_pressure_kPa, fluid_density_kg_m3,
+        vapor_pressure_kPa, critical_pressure_kPa, liquid_recovery_factor))
+
+    _validate_pressure_drop(P1, P2)
+
+    # liquid critical pressure ratio factor and the choked (flashing/cavitating) pressure drop
+    FF = 0.96 - 0.28 * np.sqrt(Pv / Pc)
+    dP_choked = FL**2 * (P1 - FF * Pv)
+
+    if np.any(dP_choked <= 0.0):
+        raise ValueError("vapor_pressure_kPa is too high for the inlet pressure")
+
+    dP = P1 - P2
+    choked = dP >= dP_choked
+    dP_sizing = np.minimum(dP, dP_choked)
+
+    cv = Q * 3600 / N1 * np.sqrt(rho / RHO_WATER / dP_sizing)
+
+    return ValveCv(cv[()], choked[()])
+
+def gas_valve_cv(
+    mass_flowrate_kg_s: float | np.ndarray,
+    inlet_pressure_kPa: float | np.ndarray,
+    outlet_pressure_kPa: float | np.ndarray,
+    inlet_temperature_K: float | np.ndarray,
+    specific_gravity: float | np.ndarray,
+    heat_capacity_ratio: float | np.ndarray = 1.3,
+    pressure_drop_ratio_factor: float | np.ndarray = 0.7,
+    compressibility_factor: float | np.ndarray | None = None,
+) -> ValveCv:
+    # IEC 60534-2-1 (ISA-75.01.01) turbulent gas sizing without attached fittings (Fp = 1).
+    # The inlet compressibility factor comes from the GPSA chart fit unless given.
+    mass_flowrate_kg_s = in_units(mass_flowrate_kg_s, "kg/s")
+    inlet_pressure_kPa = in_units(inlet_pressure_kPa, "kPa")
+    outlet_pressure_kPa = in_units(outlet_pressure_kPa, "kPa")
+    inlet_temperature_K = in_units(inlet_temperature_K, "K")
+
+    _validate_positive(mass_flowrate_kg_s, "mass_flowrate_kg_s")
+    _validate_positive(inlet_temperature_K, "inlet_temperature_K")
+    _validate_positive(specific_gravity, "specific_gravity")
+    _validate_fraction(pressure_drop_ratio_factor, "pressure_drop_ratio_factor")
+
+    W, P1, P2, T1, y, k, xT = (np.asarray(value, dtype=float) for value in (
+        mass_flowrate_kg_s, inlet_pressure_kPa, outlet_pressure_kPa, inlet_temperature_K,
+        specific_gravity, heat_capacity_ratio, pressure_drop_ratio_factor))
+
+    _validate_pressure_drop(P1, P2)
+
+    if np.any(k <= 1.0):
+        raise ValueError("heat_capacity_ratio must be > 1")
+
+    if compressibility_factor is None:
+        Z = z_factor_GPSA(P1, T1, y)
+    else:
+        _validate_positive(compressibility_factor, "compressibility_factor")
+        Z = np.asarray(compressibility_factor, dtype=float)
+
+    # pressure drop ratio, limited to its choked value Fγ xT
+    F_gamma = k / 1.40
+    x = (P1 - P2) / P1
+    x_choked = F_gamma * xT
+    choked = x >= x_choked
+    x_sizing = np.minimum(x, x_choked)
+
+    Y = 1 - x_sizing / (3 * x_choked)
+    M = y * MW_AIR
+
+    cv = W * 3600 / (N8 * P1 * Y) * np.sqrt(T1 * Z / (x_sizing * M))
+
+    return ValveCv(cv[()], choked[()])
+
+def relative_cv(
+    opening: float | np.ndarray,
+    characteristic: str | np.ndarray,
+    rangeability: float = 50.0,
+) -> float | np.ndarray:
+    # inherent characteristic: Cv / rated Cv at a fractional travel (1 = fully open).
+    # characteristic may be an array, one per valve.
+    is_linear = _is_linear(characteristic)
+    x = np.asarray(opening, dtype=float)
+
+    if rangeability <= 1.0:
+        raise ValueError("rangeability must be > 1")
+
+    ratio = np.where(is_linear, x, rangeability**(x - 1))
+
+    return ratio[()]
+
+def valve_opening(
+    cv: float | np.ndarray,
+    rated_cv: float | np.ndarray,
+    characteristic: str | np.ndarray,
+    rangeability: float = 50.0,
+) -> float | np.ndarray:
+    # fractional travel at which a valve passes cv; above 1 the valve is too small.
+    # Equal percentage openings below the rangeability limit are reported as 0.
+    is_linear = _is_linear(characteristic)
+    _validate_positive(cv, "cv")
+    _validate_positive(rated_cv, "rated_cv")
+
+    if rangeability <= 1.0:
+        raise ValueError("rangeability must be > 1")
+
+    ratio = np.asarray(cv, dtype=float) / np.asarray(rated_cv, dtype=float)
+    opening = np.where(is_linear, ratio, 1 + np.log(ratio) / np.log(rangeability))
+
+    return np.maximum(opening, 0.0)[()]
+
+def _is_linear(characteristic: str | np.ndarray) -> np.ndarray:
+    characteristic = np.asarray(characteristic)
+    is_linear = characteristic == "Linear"
+
+    if not np.all(is_linear | (characteristic == "Equal Percentage")):
+        raise ValueError(f"characteristic must be one of: {', '.join(CHARACTERISTICS)}")
+
+    return is_linear
+
+def _validate_pressure_drop(P1: np.ndarray, P2: np.ndarray) -> None:
+    if np.any(P2 <= 0.0):
+        raise ValueError("outlet_pressure_kPa must be > 0")
+
+    if np.any(P1 <= P2):
+        raise ValueError("inlet_pressure_kPa must be greater than outlet_pressure_kPa")
+
+def _validate_positive(value: float | np.ndarray, name: str) -> None:
+    if np.any(np.asarray(value) <= 0.0):
+        raise ValueError(f"{name} must be > 0")
+
+def _validate_fraction(value: float | np.ndarray, name: str) -> None:
+    value = np.asarray(value)
+    if np.any((value <= 0.0) | (value > 1.0)):
+        raise ValueError(f"{name} must be between 0 and 1")
@@ -0,0 +1,194 @@
+import csv
+import functools
+from pathlib import Path
+
+import numpy as np
+
+from calculators.pressure_changers.control_valve_calc import CHARACTERISTICS, gas_valve_cv, liquid_valve_cv, relative_cv
+
+DEFAULT_CATALOG = Path(__file__).resolve().parents[2] / "res" / "control_valves.csv"
+
+_TEXT_COLUMNS = ("model", "trim", "characteristic")
+_NUMBER_COLUMNS = ("size_in", "rated_cv", "fl", "xt")
+
+class ValveCatalog:
+    # columnar valve catalog: one read-only array per column, with the rows sorted by rated Cv
+    # so that the smallest valve for a required Cv is a binary search instead of a scan
+    def __init__(self, columns: dict[str, np.ndarray]):
+        missing = [name for name in _TEXT_COLUMNS + _NUMBER_COLUMNS if name not in columns]
+        if missing:
+            raise ValueError(f"Valve catalog is missing column(s): {', '.join(missing)}")
+
+        rated_cv = np.asarray(columns["rated_cv"], dtype=float)
+        if rated_cv.ndim != 1 or np.any(rated_cv <= 0.0):
+            raise ValueError("rated_cv must be a 1-D array of values > 0")
+
+        order = np.argsort(rated_cv, kind="stable")
+
+        self.columns = {}
+        for name, values in columns.items():
+            values = np.asarray(values, dtype=float if name in _NUMBER_COLUMNS else str)
+            if values.shape != rated_cv.shape:
+                raise ValueError(f"column '{name}' has {len(values)} rows, expected {len(rated_cv)}")
+
+            values = values[order]
+            values.flags.writeable = False
+            self.columns[name] = values
+
+        self.rated_cv = self.columns["rated_cv"]
+        self.characteristic = self.columns["characteristic"]
+        relative_cv(1.0, self.characteristic)   # rejects unknown characteristics
+
+        # sorted index per characteristic: its row numbers (ascending, so also in ascending rated
+        # Cv) and their rated Cv, searched by smallest_valve
+        self._index = {}
+        for name in CHARACTERISTICS:
+            rows = np.flatnonzero(self.characteristic == name)
+            self._index[name] = (rows, np.ascontiguousarray(self.rated_cv[rows]))
+
+    def __len__(self) -> int:
+        return len(self.rated_cv)
+
+    @classmethod
+    def from_csv(cls, path: str | Path) -> "ValveCatalog":
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+        if not rows:
+            raise ValueError(f"Valve catalog '{path}' has no rows")
+
+        try:
+            columns = {name: [row[name] for row in rows] for name in rows[0]}
+        except KeyError as e:
+            raise ValueError(f"Valve catalog '{path}' has a row missing column {e}") from None
+
+        return cls(columns)
+
+    def row(self, index: int) -> dict:
+        return {name: values[index].item() for name, values in self.columns.items()}
+
+    def select(self, rows: np.ndarray) -> dict[str, np.ndarray]:
+        return {name: values[rows] for name, values in self.columns.items()}
+
+    def smallest_valve(
+        self,
+        required_cv: float | np.ndarray,
+        max_opening: float = 0.8,
+        characteristic: str | None = None,
+        rangeability: float = 50.0,
+    ) -> int | np.ndarray:
+        # row of the smallest valve passing required_cv at no more than max_opening travel, -1 if
+        # none does. The last axis of required_cv holds the operating cases of one valve (the
+        # largest governs); any leading axes are separate valves, e.g. (n_tags, n_cases). A scalar
+        # is one case. required_cv is taken as the same for every valve; see smallest_liquid_valve
+        # and smallest_gas_valve to size each valve with its own FL or xT.
+        _validate_selection(max_opening, characteristic)
+
+        best = self._search(_governing_cv(required_cv), max_opening, characteristic, rangeability)
+
+        return np.where(best < len(self), best, -1)[()]
+
+    def smallest_liquid_valve(
+        self,
+        flowrate_m3_s: float | np.ndarray,
+        inlet_pressure_kPa: float | np.ndarray,
+        outlet_pressure_kPa: float | np.ndarray,
+        fluid_density_kg_m3: float | np.ndarray,
+        vapor_pressure_kPa: float | np.ndarray,
+        critical_pressure_kPa: float | np.ndarray = 22064.0,
+        max_opening: float = 0.8,
+        characteristic: str | None = None,
+        rangeability: float = 50.0,
+    ) -> int | np.ndarray:
+        # smallest_valve for liquid_valve_cv operating cases, each valve sized with its own FL so
+        # that its own choked pressure drop applies
+        def size(fl: float) -> np.ndarray:
+            return liquid_valve_cv(flowrate_m3_s, inlet_pressure_kPa, outlet_pressure_kPa, fluid_density_kg_m3,
+                                   vapor_pressure_kPa, critical_pressure_kPa, liquid_recovery_factor=fl).cv
+
+        return self._smallest_sized_valve(size, "fl", max_opening, characteristic, rangeability)
+
+    def smallest_gas_valve(
+        self,
+        mass_flowrate_kg_s: float | np.ndarray,
+        inlet_pressure_kPa: float | np.ndarray,
+        outlet_pressure_kPa: float | np.ndarray,
+        inlet_temperature_K: float | np.ndarray,
+        specific_gravity: float | np.ndarray,
+        heat_capacity_ratio: float | np.ndarray = 1.3,
+        compressibility_factor: float | np.ndarray | None = None,
+        max_opening: float = 0.8,
+        characteristic: str | None = None,
+        rangeability: float = 50.0,
+    ) -> int | np.ndarray:
+        # smallest_valve for gas_valve_cv operating cases, each valve sized with its own xT so
+        # that its own choked pressure drop ratio applies
+        def size(xt: float) -> np.ndarray:
+            return gas_valve_cv(mass_flowrate_kg_s, inlet_pressure_kPa, outlet_pressure_kPa, inlet_temperature_K,
+                                specific_gravity, heat_capacity_ratio, pressure_drop_ratio_factor=xt,
+                                compressibility_factor=compressibility_factor).cv
+
+        return self._smallest_sized_valve(size, "xt", max_opening, characteristic, rangeability)
+
+    def _smallest_sized_valve(self, size, factor_column: str, max_opening: float, characteristic: str | None,
+                              rangeability: float) -> int | np.ndarray:
+        # the cases are sized once per distinct FL or xT in the catalog, and only the valves with
+        # that value are searched with the result
+        _validate_selection(max_opening, characteristic)
+
+        factors = self.columns[factor_column]
+        best = None
+
+        for factor in np.unique(factors):
+            best = self._search(_governing_cv(size(factor)), max_opening, characteristic, rangeability,
+                                subset=factors == factor, best=best)
+
+        return np.where(best < len(self), best, -1)[()]
+
+    def _search(self, governing_cv: np.ndarray, max_opening: float, characteristic: str | None,
+                rangeability: float, subset: np.ndarray | None = None, best: np.ndarray | None = None) -> np.ndarray:
+        # lowest row (len(self) if none) passing governing_cv, among the rows in subset if given
+        if best is None:
+            best = np.full(governing_cv.shape, len(self), dtype=np.intp)
+
+        for name in (CHARACTERISTICS if characteristic is None else (characteristic,)):
+            rows, rated_cv = self._index[name]
+            if subset is not None:
+                keep = subset[rows]
+                rows, rated_cv = rows[keep], rated_cv[keep]
+            if len(rows) == 0:
+                continue
+
+            # a valve qualifies when rated_cv * relative_cv(max_opening) >= governing_cv
+            minimum_rated_cv = governing_cv / relative_cv(max_opening, name, rangeability)
+            position = np.searchsorted(rated_cv, minimum_rated_cv, side="left")
+
+            found = position < len(rows)
+            candidate = np.where(found, rows[np.minimum(position, len(rows) - 1)], len(self))
+
+            # rows are in ascending rated Cv, so the lowest row across characteristics is the smallest valve
+            best = np.minimum(best, candidate)
+
+        return best
+
+def _governing_cv(required_cv: float | np.ndarray) -> np.ndarray:
+    cv = np.asarray(required_cv, dtype=float)
+    if cv.ndim == 0:
+        cv = cv[None]
+    if cv.shape[-1] == 0:
+        raise ValueError("required_cv must have at least one operating case")
+    if np.any(cv <= 0.0):
+        raise ValueError("required_cv must be > 0")
+
+    return cv.max(axis=-1)
+
+def _validate_selection(max_opening: float, characteristic: str | None) -> None:
+    if not 0.0 < max_opening <= 1.0:
+        raise ValueError("max_opening must be between 0 and 1")
+
+    if characteristic is not None and characteristic not in CHARACTERISTICS:
+        raise ValueError(f"characteristic must be one of: {', '.join(CHARACTERISTICS)}")
+
+@functools.lru_cache(maxsize=8)
+def load_valve_catalog(path: str | Path = DEFAULT_CATALOG) -> ValveCatalog:
+    return ValveCatalog.from_csv(path)
@@ -1,26 +1,40 @@
-from utilities.constants import constants
-import math
+from typing import NamedTuple
 
-import streamlit as st
+from utilities.constants import constants
+from utilities.units import in_units
+from calculators.pipe_flow.friction_factor_calc import friction_factor_serghides
+import numpy as np
 
 def npsh_simple(
-    pressure1_kPa: float,
-    vapor_pressure_kPa: float,
-    fluid_density_kg_m3: float,
-    relative_height_m: float,
-    velocity_m_s: float,
-    head_loss_m: float, 
-    
-) -> float:
-    #TODO: add validation
-    
-    Px = pressure1_kPa
-    Pvp = vapor_pressure_kPa
-    rho = fluid_density_kg_m3
+    pressure1_kPa: float | np.ndarray,
+    vapor_pressure_kPa: float | np.ndarray,
+    fluid_density_kg_m3: float | np.ndarray,
+    relative_height_m: float | np.ndarray,
+    velocity_m_s: float | np.ndarray,
+    head_loss_m: float | np.ndarray, 
+    
+) -> float | np.ndarray:
+    
+    pressure1_kPa = in_units(pressure1_kPa, "kPa")
+    vapor_pressure_kPa = in_units(vapor_pressure_kPa, "kPa")
+    fluid_density_kg_m3 = in_units(fluid_density_kg_m3, "kg/m3")
+    relative_height_m = in_units(relative_height_m, "m")
+    velocity_m_s = in_units(velocity_m_s, "m/s")
+    head_loss_m = in_units(head_loss_m, "m")
+    
+    Px = np.asarray(pressure1_kPa, dtype=float)
+    Pvp = np.asarray(vapor_pressure_kPa, dtype=float)
+    rho = np.asarray(fluid_density_kg_m3, dtype=float)
     g = constants['g']
-    zx = relative_height_m
-    Vx = velocity_m_s
-    hfx = head_loss_m
+    zx = np.asarray(relative_height_m, dtype=float)
+    Vx = np.asarray(velocity_m_s, dtype=float)
+    hfx = np.asarray(head_loss_m, dtype=float)
+    
+    # relative_height_m is signed (liquid level below the pump), the rest is not
+    _validate_inputs(
+        positive={"pressure1_kPa": Px, "fluid_density_kg_m3": rho},
+        non_negative={"vapor_pressure_kPa": Pvp, "velocity_m_s": Vx, "head_loss_m": hfx},
+    )
     
     # calculate NPSHa via GPSA Eqn. 12-6b
     NPSH = (1000 * (Px - Pvp) / rho / g) + zx + (Vx**2 / 2 / g) - hfx
@@ -29,39 +43,50 @@ def npsh_simple(
     
 
 def npsh_advanced(
-    pressure1_kPa: float,
-    vapor_pressure_kPa: float,
-    fluid_density_kg_m3: float,
-    relative_height_m: float,
-    velocity_m_s: float,
-    pipe_diameter_m: float, 
-    viscosity_Pa_s: float,
-    pipe_roughness_m: float,
-    equivalent_length_m: float,  
-    
-) -> float:
-    #TODO: add validation
-    
-    Px = pressure1_kPa
-    Pvp = vapor_pressure_kPa
-    rho = fluid_density_kg_m3
+    pressure1_kPa: float | np.ndarray,
+    vapor_pressure_kPa: float | np.ndarray,
+    fluid_density_kg_m3: float | np.ndarray,
+    relative_height_m: float | np.ndarray,
+    velocity_m_s: float | np.ndarray,
+    pipe_diameter_m: float | np.ndarray, 
+    viscosity_Pa_s: float | np.ndarray,
+    pipe_roughness_m: float | np.ndarray,
+    equivalent_length_m: float | np.ndarray,  
+    
+) -> float | np.ndarray:
+    
+    pressure1_kPa = in_units(pressure1_kPa, "kPa")
+    vapor_pressure_kPa = in_units(vapor_pressure_kPa, "kPa")
+    fluid_density_kg_m3 = in_units(fluid_density_kg_m3, "kg/m3")
+    relative_height_m = in_units(relative_height_m, "m")
+    velocity_m_s = in_units(velocity_m_s, "m/s")
+    pipe_diameter_m = in_units(pipe_diameter_m, "m")
+    viscosity_Pa_s = in_units(viscosity_Pa_s, "Pa.s")
+    pipe_roughness_m = in_units(pipe_roughness_m, "m")
+    equivalent_length_m = in_units(equivalent_length_m, "m")
+    
+    Px = np.asarray(pressure1_kPa, dtype=float)
+    Pvp = np.asarray(vapor_pressure_kPa, dtype=float)
+    rho = np.asarray(fluid_density_kg_m3, dtype=float)
     g = constants['g']
-    zx = relative_height_m
-    Vx = velocity_m_s
-    d = pipe_diameter_m
-    mu = viscosity_Pa_s
-    epsilon = pipe_roughness_m
-    L = equivalent_length_m
+    zx = np.asarray(relative_height_m, dtype=float)
+    Vx = np.asarray(velocity_m_s, dtype=float)
+    d = np.asarray(pipe_diameter_m, dtype=float)
+    mu = np.asarray(viscosity_Pa_s, dtype=float)
+    epsilon = np.asarray(pipe_roughness_m, dtype=float)
+    L = np.asarray(equivalent_length_m, dtype=float)
+    
+    _validate_inputs(
+        positive={"pressure1_kPa": Px, "fluid_density_kg_m3": rho, "velocity_m_s": Vx, "pipe_diameter_m": d,
+                  "viscosity_Pa_s": mu},
+        non_negative={"vapor_pressure_kPa": Pvp, "pipe_roughness_m": epsilon, "equivalent_length_m": L},
+    )
     
     # calculate Reynolds Number
     Re = rho * Vx * d / mu
     
     # calculate friction factor via Serghides' solution
-    A = -2 * math.log(epsilon/d/3.7 + 12/Re)
-    B = -2 * math.log(epsilon/d/3.7 + 2.51*A/Re)
-    C = -2 * math.log(epsilon/d/3.7 + 2.51*B/Re)
-    f_inv = A - ((B-A)**2 / (C - 2*B + A))
-    f = f_inv**-2
+    f = friction_factor_serghides(Re, epsilon/d)
     
     # calculate head loss via GPSA eqn. 17-6
     hL = f * L * Vx**2 / 2 / g / d
@@ -71,5 +96,108 @@ def npsh_advanced(
     NPSH = (1000 * (Px - Pvp) / rho / g) + zx + (Vx**2 / 2 / g) - hfx
     
     return NPSH
-    
-    
\ No newline at end of file
+
+class NPSHCurve(NamedTuple):
+    flowrate_m3_s: np.ndarray
+    npsh_available_m: np.ndarray
+    npsh_required_m: np.ndarray | None
+    margin_m: np.ndarray | None
+    cavitation_flowrate_m3_s: float | np.ndarray | None
+
+def npsh_curve(
+    flowrate_m3_s: np.ndarray,
+    pressure1_kPa: float | np.ndarray,
+    vapor_pressure_kPa: float | np.ndarray,
+    fluid_density_kg_m3: float | np.ndarray,
+    relative_height_m: float | np.ndarray,
+    pipe_diameter_m: float | np.ndarray,
+    viscosity_Pa_s: float | np.ndarray,
+    pipe_roughness_m: float | np.ndarray,
+    equivalent_length_m: float | np.ndarray,
+    npshr_flowrate_m3_s: np.ndarray | None = None,
+    npshr_m: np.ndarray | None = None,
+    required_margin_m: float = 0.0,
+) -> NPSHCurve:
+    # NPSHa over a range of flow rates (the last axis) in one call via npsh_advanced.
+    # Any other input may be an array with a trailing axis of length 1 to sweep it at the
+    # same time, e.g. relative_height_m of shape (n_levels, 1) gives one curve per level.
+    # The pump's NPSHr curve is given as points (npshr_flowrate_m3_s, npshr_m) and
+    # interpolated onto the flow rates, or as npshr_m alone if already at those flow rates.
+    # cavitation_flowrate_m3_s is the first flow rate at which NPSHa falls to
+    # NPSHr + required_margin_m (NaN if it does not within the range).
+    flowrate_m3_s = in_units(flowrate_m3_s, "m3/s")
+    pipe_diameter_m = in_units(pipe_diameter_m, "m")
+
+    Q = np.asarray(flowrate_m3_s, dtype=float)
+    d = np.asarray(pipe_diameter_m, dtype=float)
+
+    if Q.ndim != 1 or Q.size < 2 or np.any(np.diff(Q) <= 0.0):
+        raise ValueError("flowrate_m3_s must be a 1-D array of at least 2 increasing flow rates")
+
+    if np.any(Q <= 0.0):
+        raise ValueError("flowrate_m3_s must be > 0")
+
+    if np.any(d <= 0.0):
+        raise ValueError("pipe_diameter_m must be > 0")
+
+    Vx = Q / (np.pi / 4 * d**2)
+
+    NPSHa = npsh_advanced(
+        pressure1_kPa=pressure1_kPa,
+        vapor_pressure_kPa=vapor_pressure_kPa,
+        fluid_density_kg_m3=fluid_density_kg_m3,
+        relative_height_m=relative_height_m,
+        velocity_m_s=Vx,
+        pipe_diameter_m=d,
+        viscosity_Pa_s=viscosity_Pa_s,
+        pipe_roughness_m=pipe_roughness_m,
+        equivalent_length_m=equivalent_length_m,
+    )
+
+    if npshr_m is None:
+        return NPSHCurve(Q, NPSHa, None, None, None)
+
+    if npshr_flowrate_m3_s is None:
+        NPSHr = np.asarray(npshr_m, dtype=float)
+    else:
+        npshr_flowrate_m3_s = in_units(npshr_flowrate_m3_s, "m3/s")
+        Qr = np.asarray(npshr_flowrate_m3_s, dtype=float)
+        Hr = np.asarray(npshr_m, dtype=float)
+
+        if Qr.ndim != 1 or Qr.shape != Hr.shape or np.any(np.diff(Qr) <= 0.0):
+            raise ValueError("npshr_flowrate_m3_s and npshr_m must be 1-D arrays of the same length with increasing flow rates")
+
+        # NPSHr is held at its end values outside the points given
+        NPSHr = np.interp(Q, Qr, Hr)
+
+    margin = NPSHa - NPSHr
+
+    return NPSHCurve(Q, NPSHa, np.broadcast_to(NPSHr, margin.shape), margin,
+                     _first_crossing(Q, margin - required_margin_m))
+
+def _first_crossing(x: np.ndarray, y: np.ndarray) -> float | np.ndarray:
+    # x where y first drops below zero along the last axis, linearly interpolated
+    below = y < 0.0
+    i = np.argmax(below, axis=-1)
+    crossed = np.any(below, axis=-1) & (i > 0)
+
+    i0 = np.maximum(i - 1, 0)
+    y0 = np.take_along_axis(y, i0[..., None], axis=-1)[..., 0]
+    y1 = np.take_along_axis(y, i[..., None], axis=-1)[..., 0]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = x[i0] + (x[i] - x[i0]) * y0 / (y0 - y1)
+
+    # below zero from the first flow rate on counts as cavitating at the lowest flow
+    x_cross = np.where(below[..., 0], x[0], np.where(crossed, x_cross, np.nan))
+
+    return x_cross[()]
+
+def _validate_inputs(positive: dict[str, np.ndarray], non_negative: dict[str, np.ndarray]) -> None:
+    for name, value in positive.items():
+        if np.any(value <= 0.0):
+            raise ValueError(f"{name} must be > 0")
+
+    for name, value in non_negative.items():
+        if np.any(value < 0.0):
+            raise ValueError(f"{name} must be >= 0")
@@ -0,0 +1,147 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from utilities.thermo_utils import z_factor_GPSA
+from utilities.units import in_units
+
+R_UNIVERSAL = 8.31446   # kJ/kmol/K
+MW_AIR = 28.9644        # kg/kmol
+
+class PumpPower(NamedTuple):
+    hydraulic_power_kW: float | np.ndarray
+    brake_power_kW: float | np.ndarray
+    driver_power_kW: float | np.ndarray
+
+class CompressorPower(NamedTuple):
+    head_kJ_kg: float | np.ndarray
+    gas_power_kW: float | np.ndarray
+    discharge_temperature_K: float | np.ndarray
+
+def pump_power(
+    flowrate_m3_s: float | np.ndarray,
+    differential_pressure_kPa: float | np.ndarray,
+    pump_efficiency: float | np.ndarray,
+    driver_efficiency: float | np.ndarray = 1.0,
+) -> PumpPower:
+    flowrate_m3_s = in_units(flowrate_m3_s, "m3/s")
+    differential_pressure_kPa = in_units(differential_pressure_kPa, "kPa")
+
+    _validate_positive(flowrate_m3_s, "flowrate_m3_s")
+    _validate_positive(differential_pressure_kPa, "differential_pressure_kPa")
+    _validate_efficiency(pump_efficiency, "pump_efficiency")
+    _validate_efficiency(driver_efficiency, "driver_efficiency")
+
+    Q = np.asarray(flowrate_m3_s, dtype=float)
+    dP = np.asarray(differential_pressure_kPa, dtype=float)
+    eta_p = np.asarray(pump_efficiency, dtype=float)
+    eta_d = np.asarray(driver_efficiency, dtype=float)
+
+    # hydraulic power = Q * dP, kW for m3/s and kPa
+    P_hyd = Q * dP
+    P_brake = P_hyd / eta_p
+    P_driver = P_brake / eta_d
+
+    return PumpPower(P_hyd[()], P_brake[()], P_driver[()])
+
+def compressor_adiabatic_power(
+    mass_flowrate_kg_s: float | np.ndarray,
+    suction_pressure_kPa: float | np.ndarray,
+    discharge_pressure_kPa: float | np.ndarray,
+    suction_temperature_K: float | np.ndarray,
+    specific_gravity: float | np.ndarray,
+    heat_capacity_ratio: float | np.ndarray,
+    adiabatic_efficiency: float | np.ndarray,
+) -> CompressorPower:
+    m, P1, P2, T1, y, k = _compressor_inputs(mass_flowrate_kg_s, suction_pressure_kPa, discharge_pressure_kPa,
+                                             suction_temperature_K, specific_gravity, heat_capacity_ratio)
+    _validate_efficiency(adiabatic_efficiency, "adiabatic_efficiency")
+    eta = np.asarray(adiabatic_efficiency, dtype=float)
+
+    # isentropic temperature rise, then the actual discharge temperature per GPSA Eqn. 13-21
+    exponent = (k - 1) / k
+    rise = (P2 / P1)**exponent - 1
+    T2 = T1 * (1 + rise / eta)
+
+    # adiabatic head per GPSA Eqn. 13-20, with Z averaged between suction and discharge
+    Z_avg = (z_factor_GPSA(P1, T1, y) + z_factor_GPSA(P2, T2, y)) / 2
+    H = Z_avg * R_UNIVERSAL * T1 / (y * MW_AIR) * rise / exponent
+
+    power = m * H / eta
+
+    return CompressorPower(H[()], power[()], T2[()])
+
+def compressor_polytropic_power(
+    mass_flowrate_kg_s: float | np.ndarray,
+    suction_pressure_kPa: float | np.ndarray,
+    discharge_pressure_kPa: float | np.ndarray,
+    suction_temperature_K: float | np.ndarray,
+    specific_gravity: float | np.ndarray,
+    heat_capacity_ratio: float | np.ndarray,
+    polytropic_efficiency: float | np.ndarray,
+    steps: int = 1,
+) -> CompressorPower:
+    # polytropic head per GPSA Eqn. 13-23, with (n - 1)/n = (k - 1)/(k * eta_p) (Eqn. 13-24).
+    # steps > 1 splits the pressure ratio into equal-ratio steps along the polytropic path and
+    # sums the step heads, each with its own average Z, for high-ratio machines where Z varies
+    # along the compression. All steps of all operating points are evaluated at once.
+    m, P1, P2, T1, y, k = _compressor_inputs(mass_flowrate_kg_s, suction_pressure_kPa, discharge_pressure_kPa,
+                                             suction_temperature_K, specific_gravity, heat_capacity_ratio)
+    _validate_efficiency(polytropic_efficiency, "polytropic_efficiency")
+    eta = np.asarray(polytropic_efficiency, dtype=float)
+
+    if steps < 1 or steps != int(steps):
+        raise ValueError("steps must be an integer >= 1")
+
+    exponent = (k - 1) / (k * eta)
+    r = P2 / P1
+
+    # path states on a trailing axis: P_i = P1 r**(i/steps), T_i = T1 (P_i/P1)**exponent
+    fraction = np.linspace(0.0, 1.0, int(steps) + 1)
+    P_path = P1[..., None] * r[..., None]**fraction
+    T_path = T1[..., None] * (P_path / P1[..., None])**exponent[..., None]
+
+    Z_path = z_factor_GPSA(P_path, T_path, y[..., None])
+    Z_step = (Z_path[..., 1:] + Z_path[..., :-1]) / 2
+
+    # each step head is Z R T_in / MW * (T_out/T_in - 1) / exponent
+    H_step = Z_step * R_UNIVERSAL * (T_path[..., 1:] - T_path[..., :-1]) / (y[..., None] * MW_AIR) / exponent[..., None]
+    H = H_step.sum(axis=-1)
+
+    power = m * H / eta
+    T2 = T_path[..., -1]
+
+    return CompressorPower(H[()], power[()], T2[()])
+
+def _compressor_inputs(mass_flowrate_kg_s, suction_pressure_kPa, discharge_pressure_kPa,
+                       suction_temperature_K, specific_gravity, heat_capacity_ratio):
+    mass_flowrate_kg_s = in_units(mass_flowrate_kg_s, "kg/s")
+    suction_pressure_kPa = in_units(suction_pressure_kPa, "kPa")
+    discharge_pressure_kPa = in_units(discharge_pressure_kPa, "kPa")
+    suction_temperature_K = in_units(suction_temperature_K, "K")
+
+    _validate_positive(mass_flowrate_kg_s, "mass_flowrate_kg_s")
+    _validate_positive(suction_pressure_kPa, "suction_pressure_kPa")
+    _validate_positive(suction_temperature_K, "suction_temperature_K")
+    _validate_positive(specific_gravity, "specific_gravity")
+
+    m, P1, P2, T1, y, k = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (
+        mass_flowrate_kg_s, suction_pressure_kPa, discharge_pressure_kPa,
+        suction_temperature_K, specific_gravity, heat_capacity_ratio)))
+
+    if np.any(P2 <= P1):
+        raise ValueError("discharge_pressure_kPa must be greater than suction_pressure_kPa")
+
+    if np.any(k <= 1.0):
+        raise ValueError("heat_capacity_ratio must be > 1")
+
+    return m, P1, P2, T1, y, k
+
+def _validate_positive(value: float | np.ndarray, name: str) -> None:
+    if np.any(np.asarray(value) <= 0.0):
+        raise ValueError(f"{name} must be > 0")
+
+def _validate_efficiency(value: float | np.ndarray, name: str) -> None:
+    value = np.asarray(value)
+    if np.any((value <= 0.0) | (value > 1.0)):
+        raise ValueError(f"{name} must be between 0 and 1")
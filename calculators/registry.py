@@ -0,0 +1,58 @@
+import importlib
+
+# calculator name -> "module:function", imported on first use so that looking up
+# one calculator does not pull in every calculator module
+CALCULATORS = {
+    # conversion
+    "air_gas_flow_converter": "calculators.conversion.air_gas_flow_converter_calc:air_gas_flow_converter",
+    "gas_conditions_converter": "calculators.conversion.gas_conditions_calc:gas_conditions_converter",
+    
+    # geometry
+    "vessel_volume": "calculators.geometry.vessel_volume_calc:vessel_volume",
+    
+    # pipe_flow
+    "erosional_velocity": "calculators.pipe_flow.erosional_velocity_calc:erosional_velocity",
+    "friction_factor_serghides": "calculators.pipe_flow.friction_factor_calc:friction_factor_serghides",
+    "friction_factor_colebrook": "calculators.pipe_flow.friction_factor_calc:friction_factor_colebrook",
+    "segment_pressure_drop": "calculators.pipe_flow.piping_pressure_drop_calc:segment_pressure_drop",
+    
+    # pressure_changers
+    "npsh_simple": "calculators.pressure_changers.npsh_calc:npsh_simple",
+    "npsh_advanced": "calculators.pressure_changers.npsh_calc:npsh_advanced",
+    "pump_power": "calculators.pressure_changers.pump_compressor_power_calc:pump_power",
+    "compressor_adiabatic_power": "calculators.pressure_changers.pump_compressor_power_calc:compressor_adiabatic_power",
+    "compressor_polytropic_power": "calculators.pressure_changers.pump_compressor_power_calc:compressor_polytropic_power",
+    "liquid_valve_cv": "calculators.pressure_changers.control_valve_calc:liquid_valve_cv",
+    "gas_valve_cv": "calculators.pressure_changers.control_valve_calc:gas_valve_cv",
+    
+    # thermo
+    "reynolds_number": "calculators.thermo.reynolds_calc:reynolds_number",
+    "reynolds_regimes": "calculators.thermo.reynolds_calc:reynolds_regimes",
+    
+    # unit_ops
+    "teg_dehydration": "calculators.unit_ops.glycol_dehy_calc:teg_dehydration",
+    "bukacek_water_content": "calculators.unit_ops.glycol_dehy_calc:bukacek_water_content",
+    "amine_circulation_rate": "calculators.unit_ops.amine_circ_rate_calc:amine_circulation_rate",
+    
+    # utilities
+    "barometric_pressure": "calculators.utilities.barometric_pressure_calc:barometric_pressure",
+    "standard_atmosphere": "calculators.utilities.barometric_pressure_calc:standard_atmosphere",
+}
+
+def get_calculator(name: str, cached: bool = False):
+    # cached=True returns the shared memoized wrapper (see utilities.cache), for callers
+    # that repeat the same inputs
+    if name not in CALCULATORS:
+        raise ValueError(f"Unknown calculator '{name}'. Available: {', '.join(sorted(CALCULATORS))}")
+    
+    module_name, function_name = CALCULATORS[name].split(":")
+    module = importlib.import_module(module_name)
+    
+    calculator = getattr(module, function_name)
+    
+    if cached:
+        from utilities.cache import cached_calculator
+        
+        return cached_calculator(calculator)
+    
+    return calculator
@@ -0,0 +1,525 @@
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+import numpy as np
+
+SQRT2 = np.sqrt(2)
+
+# number of component sets and of compositions whose mixing-rule terms are kept
+COMPONENT_CACHE_SIZE = 64
+COMPOSITION_CACHE_SIZE = 1024
+
+_cache_lock = threading.Lock()
+_component_terms_cache = OrderedDict()
+_mixture_terms_cache = OrderedDict()
+
+class PRComponentTerms(NamedTuple):
+    # sqrt(A_i) = (c_i - d_i sqrt(T)) sqrt(P) / T and B_i = b_i P / T, with P in kPa and T in K;
+    # A_ij = (1 - k_ij) sqrt(A_i A_j)
+    c: np.ndarray
+    d: np.ndarray
+    b: np.ndarray
+    one_minus_kij: np.ndarray
+
+class PRMixtureTerms(NamedTuple):
+    # mixture A = (a0 - 2 a1 sqrt(T) + a2 T) P / T**2 and B = b P / T of a fixed composition
+    a0: float
+    a1: float
+    a2: float
+    b: float
+
+class PRFlashResult(NamedTuple):
+    vapor_fraction: np.ndarray
+    liquid_composition: np.ndarray
+    vapor_composition: np.ndarray
+    K: np.ndarray
+    Z_liquid: np.ndarray
+    Z_vapor: np.ndarray
+    iterations: np.ndarray
+    # converged on the fugacity equality; trivial states collapsed to K = 1 instead (no phase
+    # split was found) and are not converged
+    converged: np.ndarray
+    trivial: np.ndarray
+
+def pr_flash(
+    pressure_kPa: float | np.ndarray,
+    temperature_K: float | np.ndarray,
+    composition: np.ndarray,
+    critical_temperature_K: np.ndarray,
+    critical_pressure_kPa: np.ndarray,
+    acentric_factor: np.ndarray,
+    kij: np.ndarray | None = None,
+    K_init: np.ndarray | None = None,
+    tolerance: float = 1e-10,
+    max_iterations: int = 200,
+) -> PRFlashResult:
+    # isothermal two-phase flash of a batch of (P, T, z) states: composition has one row per
+    # state (or a single row for all states), component properties are 1-D arrays.
+    # Successive substitution on ln K with dominant-eigenvalue (GDEM) acceleration; K_init
+    # warm-starts the iteration, otherwise Wilson K-values are used. States with no two-phase
+    # solution are returned with vapor_fraction 0 or 1.
+    Tc = np.asarray(critical_temperature_K, dtype=float)
+    Pc = np.asarray(critical_pressure_kPa, dtype=float)
+    omega = np.asarray(acentric_factor, dtype=float)
+    n_comp = Tc.size
+
+    P = np.asarray(pressure_kPa, dtype=float)
+    T = np.asarray(temperature_K, dtype=float)
+    z = np.asarray(composition, dtype=float)
+    batch_shape = np.broadcast_shapes(P.shape, T.shape, z.shape[:-1])
+
+    if len(batch_shape) > 1 or z.shape[-1] != n_comp:
+        raise ValueError("pressure and temperature must be scalars or 1-D, and composition must have one column per component")
+
+    n_states = batch_shape[0] if batch_shape else 1
+
+    P = np.broadcast_to(P, (n_states,)).copy()
+    T = np.broadcast_to(T, (n_states,)).copy()
+    z = np.broadcast_to(z, (n_states, n_comp)).copy()
+
+    _validate_positive(P, "pressure_kPa")
+    _validate_positive(T, "temperature_K")
+    _validate_positive(Tc, "critical_temperature_K")
+    _validate_positive(Pc, "critical_pressure_kPa")
+
+    if np.any(z < 0.0):
+        raise ValueError("composition must be >= 0")
+
+    z /= z.sum(axis=1, keepdims=True)
+
+    terms = cached_component_terms(Tc, Pc, omega, kij)
+    A_i, B_i, A_ij = pr_state_parameters(P, T, terms)
+
+    if K_init is None:
+        lnK = np.log(wilson_k(P, T, Tc, Pc, omega))
+    else:
+        lnK = np.log(np.broadcast_to(np.asarray(K_init, dtype=float), (n_states, n_comp))).copy()
+
+    V = np.zeros(n_states)
+    iterations = np.zeros(n_states, dtype=np.intp)
+    converged = np.zeros(n_states, dtype=bool)
+    trivial = np.zeros(n_states, dtype=bool)
+    active = np.arange(n_states)
+
+    # previous two ln K steps of each active state, for GDEM extrapolation
+    step_prev = np.zeros((n_states, n_comp))
+
+    for iteration in range(1, max_iterations + 1):
+        K = np.exp(lnK[active])
+        za = z[active]
+
+        Va = rachford_rice(za, K, V[active] if iteration > 1 else None)
+        x, y = phase_compositions(za, K, Va)
+
+        lnphi_L, _ = pr_fugacity_coefficients(x, A_i[active], B_i[active], A_ij[active], phase="liquid")
+        lnphi_V, _ = pr_fugacity_coefficients(y, A_i[active], B_i[active], A_ij[active], phase="vapor")
+
+        step = (lnphi_L - lnphi_V) - lnK[active]
+
+        # accelerate every fifth iteration along the dominant eigenvector of the SS map
+        if iteration % 5 == 0:
+            num = (step * step_prev[active]).sum(axis=1)
+            den = (step_prev[active] * step_prev[active]).sum(axis=1)
+            lam = np.divide(num, den, out=np.zeros_like(num), where=den > 0)
+            lam = np.where((lam > 0) & (lam < 1), lam, 0.0)
+            step_taken = step * (1 / (1 - lam))[:, None]
+        else:
+            step_taken = step
+
+        lnK[active] += step_taken
+        step_prev[active] = step
+        V[active] = Va
+        iterations[active] = iteration
+
+        # states converge on the fugacity equality, or collapse to the trivial K = 1 solution
+        collapsed = np.max(np.abs(lnK[active]), axis=1) < 1e-4
+        solved = (np.max(np.abs(step), axis=1) < tolerance) & ~collapsed
+        converged[active[solved]] = True
+        trivial[active[collapsed]] = True
+        active = active[~(solved | collapsed)]
+
+        if active.size == 0:
+            break
+
+    K = np.exp(lnK)
+    V = rachford_rice(z, K, V)
+    x, y = phase_compositions(z, K, V)
+    _, Z_L = pr_fugacity_coefficients(x, A_i, B_i, A_ij, phase="liquid")
+    _, Z_V = pr_fugacity_coefficients(y, A_i, B_i, A_ij, phase="vapor")
+
+    return PRFlashResult(
+        vapor_fraction=V,
+        liquid_composition=x,
+        vapor_composition=y,
+        K=K,
+        Z_liquid=Z_L,
+        Z_vapor=Z_V,
+        iterations=iterations,
+        converged=converged,
+        trivial=trivial,
+    )
+
+def pr_flash_sweep(
+    pressure_kPa: np.ndarray,
+    temperature_K: np.ndarray,
+    composition: np.ndarray,
+    critical_temperature_K: np.ndarray,
+    critical_pressure_kPa: np.ndarray,
+    acentric_factor: np.ndarray,
+    kij: np.ndarray | None = None,
+    block_size: int = 32,
+    tolerance: float = 1e-10,
+    max_iterations: int = 200,
+) -> PRFlashResult:
+    # flash an ordered sweep over P and/or T (phase envelope, separator train) in blocks of
+    # neighbouring states; each block is flashed as one batch, warm-started from the
+    # K-values of the last two-phase state of the block before it
+    if block_size < 1:
+        raise ValueError("block_size must be at least 1")
+
+    P, T = np.broadcast_arrays(np.atleast_1d(np.asarray(pressure_kPa, dtype=float)),
+                               np.atleast_1d(np.asarray(temperature_K, dtype=float)))
+    z = np.asarray(composition, dtype=float)
+
+    results = []
+    K = None
+
+    for start in range(0, P.size, block_size):
+        block = slice(start, start + block_size)
+        zb = z[block] if z.ndim > 1 else z
+
+        result = pr_flash(P[block], T[block], zb, critical_temperature_K, critical_pressure_kPa,
+                          acentric_factor, kij=kij, K_init=K,
+                          tolerance=tolerance, max_iterations=max_iterations)
+
+        # only carry two-phase K-values forward, trivial ones are no better than Wilson
+        two_phase = np.flatnonzero((result.vapor_fraction > 0.0) & (result.vapor_fraction < 1.0))
+        K = result.K[two_phase[-1]] if two_phase.size else None
+
+        results.append(result)
+
+    return PRFlashResult(*(np.concatenate(field) for field in zip(*results)))
+
+def pr_z_factor(
+    pressure_kPa: float | np.ndarray,
+    temperature_K: float | np.ndarray,
+    composition: np.ndarray,
+    critical_temperature_K: np.ndarray,
+    critical_pressure_kPa: np.ndarray,
+    acentric_factor: np.ndarray,
+    kij: np.ndarray | None = None,
+    phase: str = "vapor",
+) -> float | np.ndarray:
+    # Z-factor of one stream composition at any number of (P, T) states; the mixing rule is
+    # reduced once per composition to four numbers, so repeated calls for the same stream
+    # do not rebuild the A_ij matrices
+    z = np.asarray(composition, dtype=float)
+    Tc = np.asarray(critical_temperature_K, dtype=float)
+
+    if z.shape != Tc.shape or z.ndim != 1:
+        raise ValueError("composition must be a 1-D array with one value per component")
+
+    if phase not in ("liquid", "vapor"):
+        raise ValueError("phase must be 'liquid' or 'vapor'")
+
+    _validate_positive(pressure_kPa, "pressure_kPa")
+    _validate_positive(temperature_K, "temperature_K")
+
+    if np.any(z < 0.0) or not np.sum(z) > 0.0:
+        raise ValueError("composition must be >= 0 with a positive sum")
+
+    z = z / np.sum(z)
+
+    terms = cached_component_terms(Tc, critical_pressure_kPa, acentric_factor, kij)
+    mixture = cached_mixture_terms(terms, z)
+
+    P = np.asarray(pressure_kPa, dtype=float)
+    T = np.asarray(temperature_K, dtype=float)
+
+    A = (mixture.a0 - 2 * mixture.a1 * np.sqrt(T) + mixture.a2 * T) * P / T**2
+    B = mixture.b * P / T
+
+    Z_liquid, Z_vapor = pr_z_roots(A, B)
+    Z = Z_liquid if phase == "liquid" else Z_vapor
+
+    return Z[()]
+
+def pr_component_terms(
+    critical_temperature_K: np.ndarray,
+    critical_pressure_kPa: np.ndarray,
+    acentric_factor: np.ndarray,
+    kij: np.ndarray | None = None,
+) -> PRComponentTerms:
+    # temperature-independent part of the PR parameters: with Tr = T / Tc and Pr = P / Pc,
+    # A_i = 0.45724 alpha_i Pr / Tr**2, sqrt(alpha_i) = 1 + m_i (1 - sqrt(Tr)) and
+    # B_i = 0.07780 Pr / Tr, so sqrt(A_i) is linear in sqrt(T) at a given P / T**2
+    Tc = np.asarray(critical_temperature_K, dtype=float)
+    Pc = np.asarray(critical_pressure_kPa, dtype=float)
+    omega = np.asarray(acentric_factor, dtype=float)
+
+    _validate_positive(Tc, "critical_temperature_K")
+    _validate_positive(Pc, "critical_pressure_kPa")
+
+    m = 0.37464 + 1.54226*omega - 0.26992*omega**2
+    g = Tc * np.sqrt(0.45724 / Pc)
+
+    if kij is None:
+        one_minus_kij = np.ones((Tc.size, Tc.size))
+    else:
+        one_minus_kij = 1 - np.broadcast_to(np.asarray(kij, dtype=float), (Tc.size, Tc.size))
+
+    return PRComponentTerms(
+        c=g * (1 + m),
+        d=g * m / np.sqrt(Tc),
+        b=0.07780 * Tc / Pc,
+        one_minus_kij=one_minus_kij,
+    )
+
+def pr_state_parameters(
+    pressure_kPa: np.ndarray,
+    temperature_K: np.ndarray,
+    terms: PRComponentTerms,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # dimensionless A_i, B_i and A_ij, one row (matrix) per state
+    P = np.asarray(pressure_kPa, dtype=float)[..., None]
+    T = np.asarray(temperature_K, dtype=float)[..., None]
+
+    sqrt_A = (terms.c - terms.d * np.sqrt(T)) * np.sqrt(P) / T
+
+    A_i = sqrt_A**2
+    B_i = terms.b * P / T
+    A_ij = terms.one_minus_kij * (sqrt_A[..., :, None] * sqrt_A[..., None, :])
+
+    return A_i, B_i, A_ij
+
+def pr_mixture_terms(terms: PRComponentTerms, composition: np.ndarray) -> PRMixtureTerms:
+    # sum_ij z_i z_j (1 - k_ij) (c_i - d_i sqrt(T)) (c_j - d_j sqrt(T)), expanded in sqrt(T)
+    z = np.asarray(composition, dtype=float)
+    zc = z * terms.c
+    zd = z * terms.d
+
+    return PRMixtureTerms(
+        a0=float(zc @ terms.one_minus_kij @ zc),
+        a1=float(zc @ terms.one_minus_kij @ zd),
+        a2=float(zd @ terms.one_minus_kij @ zd),
+        b=float(z @ terms.b),
+    )
+
+def cached_component_terms(
+    critical_temperature_K: np.ndarray,
+    critical_pressure_kPa: np.ndarray,
+    acentric_factor: np.ndarray,
+    kij: np.ndarray | None = None,
+) -> PRComponentTerms:
+    # pr_component_terms, kept per component set (keyed on the property values) with LRU eviction
+    Tc = np.asarray(critical_temperature_K, dtype=float)
+    Pc = np.asarray(critical_pressure_kPa, dtype=float)
+    omega = np.asarray(acentric_factor, dtype=float)
+    kij_key = None if kij is None else np.asarray(kij, dtype=float).tobytes()
+
+    key = (Tc.tobytes(), Pc.tobytes(), omega.tobytes(), kij_key)
+
+    return _lru_lookup(_component_terms_cache, key, COMPONENT_CACHE_SIZE,
+                       lambda: _read_only(pr_component_terms(Tc, Pc, omega, kij)))
+
+def cached_mixture_terms(terms: PRComponentTerms, composition: np.ndarray) -> PRMixtureTerms:
+    # pr_mixture_terms, kept per (component set, composition) with LRU eviction
+    z = np.asarray(composition, dtype=float)
+
+    # every field of terms enters the result, b included
+    key = (terms.c.tobytes(), terms.d.tobytes(), terms.b.tobytes(), terms.one_minus_kij.tobytes(), z.tobytes())
+
+    return _lru_lookup(_mixture_terms_cache, key, COMPOSITION_CACHE_SIZE,
+                       lambda: pr_mixture_terms(terms, z))
+
+def clear_mixing_caches() -> None:
+    with _cache_lock:
+        _component_terms_cache.clear()
+        _mixture_terms_cache.clear()
+
+def pr_fugacity_coefficients(
+    composition: np.ndarray,
+    A_i: np.ndarray,
+    B_i: np.ndarray,
+    A_ij: np.ndarray,
+    phase: str,
+) -> tuple[np.ndarray, np.ndarray]:
+    # ln(phi_i) of each component and the phase Z-factor
+    x = composition
+
+    sum_xA = (A_ij @ x[..., None])[..., 0]
+    A = (x * sum_xA).sum(axis=-1)
+    B = (x * B_i).sum(axis=-1)
+
+    Z_liquid, Z_vapor = pr_z_roots(A, B)
+    Z = Z_liquid if phase == "liquid" else Z_vapor
+
+    Zc = Z[..., None]
+    Bc = B[..., None]
+    Ac = A[..., None]
+
+    ln_phi = (B_i / Bc * (Zc - 1) - np.log(Zc - Bc)
+              - Ac / (2 * SQRT2 * Bc) * (2 * sum_xA / Ac - B_i / Bc)
+              * np.log((Zc + (1 + SQRT2) * Bc) / (Zc + (1 - SQRT2) * Bc)))
+
+    return ln_phi, Z
+
+def pr_z_roots(A: np.ndarray, B: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # smallest and largest real roots of the PR cubic
+    # Z**3 - (1 - B) Z**2 + (A - 3B**2 - 2B) Z - (AB - B**2 - B**3) = 0
+    # by the trigonometric/Cardano solution, evaluated for whole arrays at once
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+
+    c2 = -(1 - B)
+    c1 = A - 3*B**2 - 2*B
+    c0 = -(A*B - B**2 - B**3)
+
+    # depressed cubic t**3 + p t + q = 0 with Z = t - c2/3
+    p = c1 - c2**2 / 3
+    q = 2 * c2**3 / 27 - c2 * c1 / 3 + c0
+    disc = (q / 2)**2 + (p / 3)**3
+
+    one_root = disc > 0
+
+    sqrt_disc = np.sqrt(np.where(one_root, disc, 0.0))
+    t_one = np.cbrt(-q / 2 + sqrt_disc) + np.cbrt(-q / 2 - sqrt_disc)
+
+    p_neg = np.where(one_root, -1.0, np.minimum(p, -1e-300))
+    r = 2 * np.sqrt(-p_neg / 3)
+    phi = np.arccos(np.clip(3 * q / (p_neg * r), -1.0, 1.0)) / 3
+    t_max = r * np.cos(phi)
+    t_min = r * np.cos(phi - 4 * np.pi / 3)
+
+    shift = c2 / 3
+    Z_large = np.where(one_root, t_one, t_max) - shift
+    Z_small = np.where(one_root, t_one, t_min) - shift
+
+    # the liquid root must lie above the covolume B
+    Z_small = np.where(Z_small > B, Z_small, Z_large)
+
+    # one Newton step to polish both roots
+    Z_small = _polish_root(Z_small, c2, c1, c0)
+    Z_large = _polish_root(Z_large, c2, c1, c0)
+
+    return Z_small, Z_large
+
+def rachford_rice(
+    composition: np.ndarray,
+    K: np.ndarray,
+    vapor_fraction_init: np.ndarray | None = None,
+    tolerance: float = 1e-12,
+    max_iterations: int = 100,
+) -> np.ndarray:
+    # vapor fraction V of each state from sum z_i (K_i - 1) / (1 + V (K_i - 1)) = 0,
+    # limited to 0 <= V <= 1 (single phase outside); safeguarded Newton on the bracket
+    z = composition
+    Km1 = K - 1
+
+    g0 = (z * Km1).sum(axis=-1)
+    g1 = (z * Km1 / K).sum(axis=-1)
+
+    V = np.where(g0 <= 0, 0.0, 1.0)
+    two_phase = (g0 > 0) & (g1 < 0)
+
+    if not np.any(two_phase):
+        return V
+
+    zt = z[two_phase]
+    Kt = Km1[two_phase]
+
+    # bracket from the asymptotes, inside [0, 1]
+    lo = np.zeros(zt.shape[0])
+    hi = np.ones(zt.shape[0])
+    if vapor_fraction_init is None:
+        Vt = np.full(zt.shape[0], 0.5)
+    else:
+        Vt = np.clip(np.broadcast_to(vapor_fraction_init, V.shape)[two_phase], 1e-6, 1 - 1e-6)
+
+    for _ in range(max_iterations):
+        denom = 1 + Vt[:, None] * Kt
+        g = (zt * Kt / denom).sum(axis=-1)
+        dg = -(zt * Kt**2 / denom**2).sum(axis=-1)
+
+        # g decreases with V
+        lo = np.where(g > 0, Vt, lo)
+        hi = np.where(g > 0, hi, Vt)
+
+        V_new = Vt - g / dg
+        outside = (V_new <= lo) | (V_new >= hi)
+        V_new = np.where(outside, (lo + hi) / 2, V_new)
+
+        if np.max(np.abs(V_new - Vt)) < tolerance:
+            Vt = V_new
+            break
+        Vt = V_new
+
+    V[two_phase] = Vt
+
+    return V
+
+def phase_compositions(
+    composition: np.ndarray,
+    K: np.ndarray,
+    vapor_fraction: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    z = composition
+    V = np.asarray(vapor_fraction)[..., None]
+
+    x = z / (1 + V * (K - 1))
+    y = K * x
+
+    x /= x.sum(axis=-1, keepdims=True)
+    y /= y.sum(axis=-1, keepdims=True)
+
+    return x, y
+
+def wilson_k(
+    pressure_kPa: np.ndarray,
+    temperature_K: np.ndarray,
+    critical_temperature_K: np.ndarray,
+    critical_pressure_kPa: np.ndarray,
+    acentric_factor: np.ndarray,
+) -> np.ndarray:
+    P = np.asarray(pressure_kPa, dtype=float)[..., None]
+    T = np.asarray(temperature_K, dtype=float)[..., None]
+    Tc = np.asarray(critical_temperature_K, dtype=float)
+    Pc = np.asarray(critical_pressure_kPa, dtype=float)
+    omega = np.asarray(acentric_factor, dtype=float)
+
+    K = Pc / P * np.exp(5.373 * (1 + omega) * (1 - Tc / T))
+
+    return K
+
+def _polish_root(Z: np.ndarray, c2: np.ndarray, c1: np.ndarray, c0: np.ndarray) -> np.ndarray:
+    f = ((Z + c2) * Z + c1) * Z + c0
+    df = (3 * Z + 2 * c2) * Z + c1
+
+    return Z - np.divide(f, df, out=np.zeros_like(f), where=df != 0)
+
+def _lru_lookup(cache: OrderedDict, key, maxsize: int, build):
+    with _cache_lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+    value = build()
+
+    with _cache_lock:
+        cache[key] = value
+        if len(cache) > maxsize:
+            cache.popitem(last=False)
+
+    return value
+
+def _read_only(terms: PRComponentTerms) -> PRComponentTerms:
+    # cached arrays are shared between callers
+    for array in terms:
+        array.flags.writeable = False
+
+    return terms
+
+def _validate_positive(value: float | np.ndarray, name: str) -> None:
+    if np.any(np.asarray(value) <= 0.0):
+        raise ValueError(f"{name} must be > 0")
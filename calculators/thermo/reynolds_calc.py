@@ -1,18 +1,156 @@
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+from utilities.units import in_units
+
+# flow regime codes of reynolds_regimes, stored as int8
+INVALID, LAMINAR, TRANSITION, TURBULENT = -1, 0, 1, 2
+REGIME_NAMES = ("Laminar", "Transition", "Turbulent")
+
+# columns of regime_counts and regime_histogram: code + 1
+HISTOGRAM_LABELS = ("Invalid",) + REGIME_NAMES
+
+# laminar below LAMINAR_LIMIT, also where segment_pressure_drop switches to f = 64/Re
+LAMINAR_LIMIT = 2300.0
+TURBULENT_LIMIT = 4000.0
+
+# bit of each input in ReynoldsRegimes.invalid_flags
+REYNOLDS_INPUTS = ("density_kg_m3", "velocity_m_s", "diameter_m", "dynamic_viscosity_pa_s")
+
+class ReynoldsRegimes(NamedTuple):
+    # reynolds_number is NaN and regime INVALID wherever an input is not positive and finite;
+    # invalid_flags has bit i set when REYNOLDS_INPUTS[i] is the cause
+    reynolds_number: float | np.ndarray
+    regime: int | np.ndarray
+    valid: bool | np.ndarray
+    invalid_flags: int | np.ndarray
+
 def reynolds_number (
-    density_kg_m3: float,
-    velocity_m_s: float,
-    diameter_m: float,
-    dynamic_viscosity_pa_s: float
-) -> float:
+    density_kg_m3: float | np.ndarray,
+    velocity_m_s: float | np.ndarray,
+    diameter_m: float | np.ndarray,
+    dynamic_viscosity_pa_s: float | np.ndarray
+) -> float | np.ndarray:
+    density_kg_m3 = in_units(density_kg_m3, "kg/m3")
+    velocity_m_s = in_units(velocity_m_s, "m/s")
+    diameter_m = in_units(diameter_m, "m")
+    dynamic_viscosity_pa_s = in_units(dynamic_viscosity_pa_s, "Pa.s")
+
     _validate_positive(density_kg_m3, "density_kg_m3")
     _validate_positive(velocity_m_s, "velocity_m_s")
     _validate_positive(diameter_m, "diameter_m")
     _validate_positive(dynamic_viscosity_pa_s, "dynamic_viscosity_pa_s")
     
-    result = density_kg_m3 * velocity_m_s * diameter_m / dynamic_viscosity_pa_s
+    rho = np.asarray(density_kg_m3, dtype=float)
+    V = np.asarray(velocity_m_s, dtype=float)
+    d = np.asarray(diameter_m, dtype=float)
+    mu = np.asarray(dynamic_viscosity_pa_s, dtype=float)
+    
+    result = rho * V * d / mu
     
     return result
     
-def _validate_positive(value: float, name:str) -> None:
-    if value <= 0.0:
-        raise ValueError(f"{name} must be > 0")
\ No newline at end of file
+def reynolds_regimes(
+    density_kg_m3: float | np.ndarray,
+    velocity_m_s: float | np.ndarray,
+    diameter_m: float | np.ndarray,
+    dynamic_viscosity_pa_s: float | np.ndarray,
+    laminar_limit: float = LAMINAR_LIMIT,
+    turbulent_limit: float = TURBULENT_LIMIT,
+) -> ReynoldsRegimes:
+    # Reynolds number and flow regime of every element. Bad elements are flagged rather than
+    # raised on, so one bad snapshot does not stop a batch; only the limits are validated.
+    density_kg_m3 = in_units(density_kg_m3, "kg/m3")
+    velocity_m_s = in_units(velocity_m_s, "m/s")
+    diameter_m = in_units(diameter_m, "m")
+    dynamic_viscosity_pa_s = in_units(dynamic_viscosity_pa_s, "Pa.s")
+
+    if not 0.0 < laminar_limit <= turbulent_limit:
+        raise ValueError("laminar_limit must be > 0 and <= turbulent_limit")
+
+    inputs = [np.asarray(x, dtype=float) for x in (density_kg_m3, velocity_m_s, diameter_m, dynamic_viscosity_pa_s)]
+    rho, V, d, mu = inputs
+
+    shape = np.broadcast_shapes(*(x.shape for x in inputs))
+
+    # one output array, updated in place, instead of a temporary per operation
+    Re = np.empty(shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.multiply(rho, V, out=Re)
+        Re *= d
+        Re /= mu
+
+    flags = np.zeros(shape, dtype=np.uint8)
+    for bit, x in enumerate(inputs):
+        # NaN fails both comparisons
+        invalid = ~((x > 0.0) & (x < np.inf))
+        if invalid.any():
+            np.bitwise_or(flags, np.uint8(1 << bit), out=flags, where=np.broadcast_to(invalid, shape))
+
+    valid = flags == 0
+    Re[~valid] = np.nan
+
+    # NaN compares False, so invalid elements start out laminar and are overwritten below
+    regime = np.asarray(Re >= laminar_limit).view(np.int8)
+    regime += Re >= turbulent_limit
+    regime[~valid] = INVALID
+
+    return ReynoldsRegimes(Re[()], regime[()], valid[()], flags[()])
+
+def regime_counts(
+    regime: int | np.ndarray,
+    groups: int | np.ndarray | None = None,
+    n_groups: int | None = None,
+) -> np.ndarray:
+    # number of elements in each regime, columns as HISTOGRAM_LABELS. With groups (an integer
+    # id per element, e.g. a pipeline), one row of counts per group from a single bincount.
+    codes = np.asarray(regime).ravel()
+    columns = len(HISTOGRAM_LABELS)
+
+    if codes.size and (codes.min() < INVALID or codes.max() > TURBULENT):
+        raise ValueError(f"regime codes must be between {INVALID} and {TURBULENT}")
+
+    # shifted to bincount's non-negative bins and widened in one pass
+    codes = np.add(codes, 1, dtype=np.intp)
+
+    if groups is None:
+        return np.bincount(codes, minlength=columns)
+
+    ids = np.broadcast_to(np.asarray(groups, dtype=np.intp), np.shape(regime)).ravel()
+    if n_groups is None:
+        n_groups = int(ids.max()) + 1 if ids.size else 0
+
+    if np.any((ids < 0) | (ids >= n_groups)):
+        raise ValueError(f"groups must be between 0 and {n_groups - 1}")
+
+    return np.bincount(ids * columns + codes, minlength=n_groups * columns).reshape(n_groups, columns)
+
+def regime_histogram(
+    regimes: Iterable,
+    groups: Iterable | None = None,
+    n_groups: int | None = None,
+) -> np.ndarray:
+    # regime_counts summed over a stream of chunks (regime arrays, one groups array per chunk
+    # when grouped), holding one chunk at a time. n_groups is needed to group a stream.
+    if groups is None:
+        total = np.zeros(len(HISTOGRAM_LABELS), dtype=np.intp)
+
+        for regime in regimes:
+            total += regime_counts(regime)
+
+        return total
+
+    if n_groups is None or n_groups < 1:
+        raise ValueError("n_groups must be at least 1 to group a stream of chunks")
+
+    total = np.zeros((n_groups, len(HISTOGRAM_LABELS)), dtype=np.intp)
+
+    for regime, ids in zip(regimes, groups, strict=True):
+        total += regime_counts(regime, ids, n_groups)
+
+    return total
+
+def _validate_positive(value: float | np.ndarray, name:str) -> None:
+    if np.any(np.asarray(value) <= 0.0):
+        raise ValueError(f"{name} must be > 0")
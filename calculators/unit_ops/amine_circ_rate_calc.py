@@ -0,0 +1,129 @@
+import functools
+from typing import NamedTuple
+
+import numpy as np
+
+from utilities.units import in_units
+
+MOLAR_VOLUME_STD = 23.645   # m3/kmol of ideal gas at 15 °C and 101.325 kPa
+RHO_WATER = 999.1           # kg/m3 at 15 °C
+
+# design basis per amine: molecular weight [kg/kmol], pure amine density [kg/m3], typical
+# solution strength [wt fraction], rich and lean loadings [mol acid gas/mol amine]
+_AMINE_DATA = {
+    "MEA":  (61.08, 1016.0, 0.20, 0.35, 0.10),
+    "DEA":  (105.14, 1097.0, 0.30, 0.45, 0.05),
+    "MDEA": (119.16, 1038.0, 0.45, 0.45, 0.01),
+}
+
+AMINE_NAMES = tuple(_AMINE_DATA)
+_AMINE_IDS = {name: i for i, name in enumerate(AMINE_NAMES)}
+
+# loading lookup table: one read-only array per design value, indexed by amine id
+(MOLECULAR_WEIGHT, AMINE_DENSITY_kg_m3, AMINE_WT_FRACTION, RICH_LOADING, LEAN_LOADING) = (
+    np.ascontiguousarray(column) for column in np.array(list(_AMINE_DATA.values())).T
+)
+
+for _array in (MOLECULAR_WEIGHT, AMINE_DENSITY_kg_m3, AMINE_WT_FRACTION, RICH_LOADING, LEAN_LOADING):
+    _array.flags.writeable = False
+
+class AmineCirculation(NamedTuple):
+    acid_gas_pickup_kmol_h: float | np.ndarray
+    amine_flowrate_kmol_h: float | np.ndarray
+    circulation_rate_m3_h: float | np.ndarray
+
+def amine_ids(amine: str | list[str] | np.ndarray) -> int | np.ndarray:
+    # amine name(s) -> row(s) of the lookup table; a fleet's names are mapped once per distinct name
+    if isinstance(amine, str):
+        return _amine_id(amine)
+
+    names, inverse = np.unique(np.asarray(amine, dtype=str), return_inverse=True)
+    ids = np.array([_amine_id(name) for name in names], dtype=np.intp)
+
+    return ids[inverse.reshape(np.shape(amine))]
+
+@functools.lru_cache(maxsize=None)
+def _amine_id(name: str) -> int:
+    if name not in _AMINE_IDS:
+        raise ValueError(f"Unknown amine '{name}'. Available: {', '.join(AMINE_NAMES)}")
+
+    return _AMINE_IDS[name]
+
+def amine_circulation_rate(
+    gas_flowrate_Sm3_d: float | np.ndarray,
+    h2s_mol_fraction: float | np.ndarray,
+    co2_mol_fraction: float | np.ndarray,
+    amine: str | list[str] | np.ndarray,
+    amine_wt_fraction: float | np.ndarray | None = None,
+    rich_loading: float | np.ndarray | None = None,
+    lean_loading: float | np.ndarray | None = None,
+    co2_pickup_fraction: float | np.ndarray = 1.0,
+    solution_density_kg_m3: float | np.ndarray | None = None,
+) -> AmineCirculation:
+    # lean amine circulation to pick up the inlet acid gas between the lean and rich loadings.
+    # Every input may be an array, one value per unit, with amine an array of names (or ids from
+    # amine_ids); values left as None come from the lookup table of each unit's amine.
+    gas_flowrate_Sm3_d = in_units(gas_flowrate_Sm3_d, "m3/d")
+
+    _validate_positive(gas_flowrate_Sm3_d, "gas_flowrate_Sm3_d")
+    _validate_fraction(h2s_mol_fraction, "h2s_mol_fraction")
+    _validate_fraction(co2_mol_fraction, "co2_mol_fraction")
+    _validate_fraction(co2_pickup_fraction, "co2_pickup_fraction")
+
+    ids = _resolve_ids(amine)
+
+    w = AMINE_WT_FRACTION[ids] if amine_wt_fraction is None else np.asarray(amine_wt_fraction, dtype=float)
+    rich = RICH_LOADING[ids] if rich_loading is None else np.asarray(rich_loading, dtype=float)
+    lean = LEAN_LOADING[ids] if lean_loading is None else np.asarray(lean_loading, dtype=float)
+
+    if np.any((w <= 0.0) | (w > 1.0)):
+        raise ValueError("amine_wt_fraction must be > 0 and <= 1")
+
+    if np.any(lean < 0.0) or np.any(rich <= lean):
+        raise ValueError("rich_loading must be greater than lean_loading, and lean_loading >= 0")
+
+    if solution_density_kg_m3 is None:
+        # ideal mixing of amine and water volumes
+        rho = 1 / (w / AMINE_DENSITY_kg_m3[ids] + (1 - w) / RHO_WATER)
+    else:
+        _validate_positive(solution_density_kg_m3, "solution_density_kg_m3")
+        rho = np.asarray(solution_density_kg_m3, dtype=float)
+
+    Q = np.asarray(gas_flowrate_Sm3_d, dtype=float)
+    y_H2S = np.asarray(h2s_mol_fraction, dtype=float)
+    y_CO2 = np.asarray(co2_mol_fraction, dtype=float)
+    f_CO2 = np.asarray(co2_pickup_fraction, dtype=float)
+
+    acid_gas = Q / 24 / MOLAR_VOLUME_STD * (y_H2S + f_CO2 * y_CO2)
+
+    # kmol of amine per m3 of solution
+    amine_molarity = w * rho / MOLECULAR_WEIGHT[ids]
+
+    amine_flow = acid_gas / (rich - lean)
+    circulation = amine_flow / amine_molarity
+
+    return AmineCirculation(acid_gas[()], amine_flow[()], circulation[()])
+
+def _resolve_ids(amine: str | list[str] | np.ndarray) -> np.ndarray:
+    # names are looked up; integer ids (from amine_ids, for callers that repeat a fleet) are
+    # taken as they are
+    if isinstance(amine, str):
+        return np.asarray(_amine_id(amine))
+
+    ids = np.asarray(amine)
+    if ids.dtype.kind not in "iu":
+        return amine_ids(ids)
+
+    if np.any((ids < 0) | (ids >= len(AMINE_NAMES))):
+        raise ValueError(f"amine ids must be between 0 and {len(AMINE_NAMES) - 1}")
+
+    return ids.astype(np.intp, copy=False)
+
+def _validate_positive(value: float | np.ndarray, name: str) -> None:
+    if np.any(np.asarray(value) <= 0.0):
+        raise ValueError(f"{name} must be > 0")
+
+def _validate_fraction(value: float | np.ndarray, name: str) -> None:
+    value = np.asarray(value)
+    if np.any((value < 0.0) | (value > 1.0)):
+        raise ValueError(f"{name} must be between 0 and 1")
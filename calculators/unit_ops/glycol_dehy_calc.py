@@ -0,0 +1,206 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from utilities.thermo_utils import water_vapor_pressure
+from utilities.units import convert, in_units
+
+MW_WATER = 18.015       # kg/kmol
+MW_TEG = 150.174        # kg/kmol
+
+DEW_POINT_TOLERANCE_K = 1e-6
+DEW_POINT_MAX_ITERATIONS = 50
+
+# Bukacek water content, lb/MMscf -> mg/Sm3
+_LB_MMSCF = convert(1.0, "lb/MMscf", "mg/m3")
+
+class TEGDehydration(NamedTuple):
+    inlet_water_content_mg_Sm3: float | np.ndarray
+    outlet_dew_point_K: float | np.ndarray
+    equilibrium_dew_point_K: float | np.ndarray
+    lean_teg_wt_fraction: float | np.ndarray
+    water_removed_kg_h: float | np.ndarray
+    circulation_rate_m3_h: float | np.ndarray
+
+def bukacek_water_content(
+    pressure_kPa: float | np.ndarray,
+    temperature_K: float | np.ndarray,
+) -> float | np.ndarray:
+    # water content of sweet gas in equilibrium with liquid water (Bukacek, 1955), returned in
+    # mg/Sm3 (the "mg/m3" water_content unit): W [lb/MMscf] = 47484 Pv/P + B,
+    # log10(B) = -3083.87/T[°R] + 6.69449, converted from lb/MMscf
+    pressure_kPa = in_units(pressure_kPa, "kPa")
+    temperature_K = in_units(temperature_K, "K")
+
+    _validate_positive(pressure_kPa, "pressure_kPa")
+
+    P = np.asarray(pressure_kPa, dtype=float)
+    T = np.asarray(temperature_K, dtype=float)
+
+    A, B = _bukacek_terms(T)
+
+    return (A / P + B)[()]
+
+def _bukacek_terms(T: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # W [mg/Sm3] = A(T) / P[kPa] + B(T)
+    T = np.asarray(T, dtype=float)
+
+    A = _LB_MMSCF * 47484 * water_vapor_pressure(T)
+    B = _LB_MMSCF * 10**(-3083.87 / (1.8 * T) + 6.69449)
+
+    return A, B
+
+class WaterContentTable:
+    # Bukacek water content tabulated against temperature once, so a batch of contactors is
+    # read by interpolation instead of evaluating the vapor pressure equation per point.
+    # W = A(T)/P + B(T) is separable, so a 1-D table of A and B covers every pressure.
+    def __init__(
+        self,
+        min_temperature_K: float = 233.15,
+        max_temperature_K: float = 473.15,
+        points: int = 4801
+    ):
+        if points < 2:
+            raise ValueError("points must be at least 2")
+
+        if not 0.0 < min_temperature_K < max_temperature_K:
+            raise ValueError("min_temperature_K must be > 0 and below max_temperature_K")
+
+        self.min_temperature_K = min_temperature_K
+        self.max_temperature_K = max_temperature_K
+
+        self.temperatures_K = np.linspace(min_temperature_K, max_temperature_K, points)
+        self.vapor_pressures_kPa = water_vapor_pressure(self.temperatures_K)
+        self.a, self.b = _bukacek_terms(self.temperatures_K)
+
+        # the grid is uniform, so a temperature's row is found arithmetically rather than by a
+        # search, and each column is read as value + fraction * step
+        self._step_K = (max_temperature_K - min_temperature_K) / (points - 1)
+        self._da = np.diff(self.a)
+        self._db = np.diff(self.b)
+        self._dPv = np.diff(self.vapor_pressures_kPa)
+        self._ln_a = np.log(self.a)
+
+    def water_content(
+        self,
+        pressure_kPa: float | np.ndarray,
+        temperature_K: float | np.ndarray,
+    ) -> float | np.ndarray:
+        # saturated water content in mg/Sm3, as bukacek_water_content
+        P = np.asarray(pressure_kPa, dtype=float)
+        _validate_positive(P, "pressure_kPa")
+        i, fraction = self._locate(temperature_K)
+
+        W = (self.a[i] + fraction * self._da[i]) / P + self.b[i] + fraction * self._db[i]
+
+        return W[()]
+
+    def vapor_pressure(self, temperature_K: float | np.ndarray) -> float | np.ndarray:
+        i, fraction = self._locate(temperature_K)
+
+        return (self.vapor_pressures_kPa[i] + fraction * self._dPv[i])[()]
+
+    def dew_point(
+        self,
+        water_content_mg_Sm3: float | np.ndarray,
+        pressure_kPa: float | np.ndarray,
+    ) -> float | np.ndarray:
+        # water dew point: the temperature at which the gas is saturated, solved for all points at
+        # once by Newton's method on ln W, which is close to linear in T. The start is where the
+        # A/P term alone matches W; ln W is concave, so the first step may undershoot, after which
+        # the iterates rise monotonically to the root.
+        W, P = np.broadcast_arrays(np.asarray(water_content_mg_Sm3, dtype=float),
+                                   np.asarray(pressure_kPa, dtype=float))
+        _validate_positive(W, "water_content_mg_Sm3")
+        _validate_positive(P, "pressure_kPa")
+
+        W_min = self.a[0] / P + self.b[0]
+        W_max = self.a[-1] / P + self.b[-1]
+        if np.any((W < W_min) | (W > W_max)):
+            raise ValueError(f"water_content_mg_Sm3 must give a dew point between {self.min_temperature_K:.2f} K "
+                             f"and {self.max_temperature_K:.2f} K")
+
+        T = np.interp(np.log(W * P), self._ln_a, self.temperatures_K)
+
+        for _ in range(DEW_POINT_MAX_ITERATIONS):
+            i, fraction = self._row(T)
+            W_T = (self.a[i] + fraction * self._da[i]) / P + self.b[i] + fraction * self._db[i]
+            dW_dT = (self._da[i] / P + self._db[i]) / self._step_K
+
+            step = np.log(W_T / W) * W_T / dW_dT
+            T = np.clip(T - step, self.min_temperature_K, self.max_temperature_K)
+
+            if np.all(np.abs(step) < DEW_POINT_TOLERANCE_K):
+                break
+
+        return T[()]
+
+    def _locate(self, temperature_K: float | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # table row at or below each temperature, and the fraction of the way to the next row
+        T = np.asarray(temperature_K, dtype=float)
+
+        if np.any((T < self.min_temperature_K) | (T > self.max_temperature_K)):
+            raise ValueError(f"temperature_K must be between {self.min_temperature_K:.2f} and {self.max_temperature_K:.2f}")
+
+        return self._row(T)
+
+    def _row(self, T: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        position = (T - self.min_temperature_K) / self._step_K
+        i = np.minimum(position.astype(np.intp), len(self._da) - 1)
+
+        return i, position - i
+
+WATER_CONTENT_TABLE = WaterContentTable()
+
+def teg_dehydration(
+    gas_flowrate_Sm3_d: float | np.ndarray,
+    pressure_kPa: float | np.ndarray,
+    temperature_K: float | np.ndarray,
+    outlet_water_content_mg_Sm3: float | np.ndarray,
+    dew_point_approach_K: float | np.ndarray = 8.0,
+    glycol_water_ratio_L_kg: float | np.ndarray = 25.0,
+    activity_coefficient: float | np.ndarray = 0.6,
+) -> TEGDehydration:
+    # TEG contactor sizing for water-saturated inlet gas. Every input may be an array, one
+    # value per contactor operating point.
+    gas_flowrate_Sm3_d = in_units(gas_flowrate_Sm3_d, "m3/d")
+    pressure_kPa = in_units(pressure_kPa, "kPa")
+    temperature_K = in_units(temperature_K, "K")
+    outlet_water_content_mg_Sm3 = in_units(outlet_water_content_mg_Sm3, "mg/m3")
+
+    _validate_positive(gas_flowrate_Sm3_d, "gas_flowrate_Sm3_d")
+    _validate_positive(glycol_water_ratio_L_kg, "glycol_water_ratio_L_kg")
+    _validate_positive(activity_coefficient, "activity_coefficient")
+
+    if np.any(np.asarray(dew_point_approach_K) < 0.0):
+        raise ValueError("dew_point_approach_K must be >= 0")
+
+    Q, P, T, W_out, approach, ratio, gamma = (np.asarray(value, dtype=float) for value in (
+        gas_flowrate_Sm3_d, pressure_kPa, temperature_K, outlet_water_content_mg_Sm3,
+        dew_point_approach_K, glycol_water_ratio_L_kg, activity_coefficient))
+
+    table = WATER_CONTENT_TABLE
+    W_in = table.water_content(P, T)
+
+    if np.any(W_out >= W_in):
+        raise ValueError("outlet_water_content_mg_Sm3 must be below the saturated inlet water content")
+
+    # the lean glycol must hold the gas at a dew point the approach below the outlet spec;
+    # water in TEG at x_w has a fugacity of gamma x_w Pv(T), that of pure water at the dew point
+    Td_out = table.dew_point(W_out, P)
+    Td_eq = Td_out - approach
+    x_w = table.vapor_pressure(Td_eq) / (gamma * table.vapor_pressure(T))
+
+    if np.any(x_w >= 1.0):
+        raise ValueError("activity_coefficient is too low for the contactor temperature")
+
+    teg_wt = (1 - x_w) * MW_TEG / ((1 - x_w) * MW_TEG + x_w * MW_WATER)
+
+    water_removed = Q / 24 * (W_in - W_out) * 1e-6
+    circulation = water_removed * ratio / 1000
+
+    return TEGDehydration(W_in[()], Td_out[()], Td_eq[()], teg_wt[()], water_removed[()], circulation[()])
+
+def _validate_positive(value: float | np.ndarray, name: str) -> None:
+    if np.any(np.asarray(value) <= 0.0):
+        raise ValueError(f"{name} must be > 0")
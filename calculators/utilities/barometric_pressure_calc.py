@@ -1,19 +1,185 @@
+import functools
 import math
+from typing import NamedTuple
+
+import numpy as np
+
+from utilities.units import in_units
+
+# U.S. Standard Atmosphere, 1976
+P0 = 101.325            # kPa, sea level pressure
+T0 = 288.15             # K, sea level temperature
+g0 = 9.80665            # m/s2
+M0 = 28.9644            # kg/kmol, mean molecular weight of air
+R_star = 8314.32        # J/kmol/K
+
+# layer base geopotential altitudes [m] and molecular-scale temperature lapse rates [K/m],
+# up to the top of the model at 84,852 m
+LAYER_BASE_m = np.array([0.0, 11000.0, 20000.0, 32000.0, 47000.0, 51000.0, 71000.0])
+LAYER_LAPSE_RATE_K_m = np.array([-0.0065, 0.0, 0.001, 0.0028, 0.0, -0.0028, -0.002])
+MIN_ALTITUDE_m = -5000.0
+MAX_ALTITUDE_m = 84852.0
+
+_GMR = g0 * M0 / R_star
+
+def _layer_bases() -> tuple[np.ndarray, np.ndarray]:
+    # base temperature and pressure of each layer, carried up from sea level
+    T_b = np.empty(len(LAYER_BASE_m))
+    P_b = np.empty(len(LAYER_BASE_m))
+    T_b[0], P_b[0] = T0, P0
+
+    for i in range(1, len(LAYER_BASE_m)):
+        dH = LAYER_BASE_m[i] - LAYER_BASE_m[i - 1]
+        L = LAYER_LAPSE_RATE_K_m[i - 1]
+        T_b[i] = T_b[i - 1] + L * dH
+
+        if L == 0.0:
+            P_b[i] = P_b[i - 1] * np.exp(-_GMR * dH / T_b[i - 1])
+        else:
+            P_b[i] = P_b[i - 1] * (T_b[i - 1] / T_b[i])**(_GMR / L)
+
+    return T_b, P_b
+
+LAYER_BASE_TEMPERATURE_K, LAYER_BASE_PRESSURE_kPa = _layer_bases()
+
+# pressure exponent g0 M0 / (R* L) of each layer with a lapse rate (unused in isothermal layers)
+_LAYER_EXPONENT = np.array([_GMR / L if L != 0.0 else 0.0 for L in LAYER_LAPSE_RATE_K_m])
+
+_TROPOSPHERE_LAPSE_RATE = float(LAYER_LAPSE_RATE_K_m[0])
+_TROPOSPHERE_EXPONENT = float(_LAYER_EXPONENT[0])
+
+for _array in (LAYER_BASE_m, LAYER_LAPSE_RATE_K_m, LAYER_BASE_TEMPERATURE_K, LAYER_BASE_PRESSURE_kPa, _LAYER_EXPONENT):
+    _array.flags.writeable = False
+
+class Atmosphere(NamedTuple):
+    pressure_kPa: float | np.ndarray
+    temperature_K: float | np.ndarray
 
 def barometric_pressure(
-    altitude_m: float
-) -> float:
-    #TODO: add validation
-    
-    H = altitude_m
-    
-    Pb = 101.325
-    g0 = 9.80665
-    M0 = 28.9644
-    Hb = 0.0
-    R_star = 8314.32
-    Tmb = 288.15
-    
-    P = Pb * math.exp((-g0 * M0 * (H-Hb))/(R_star * Tmb))
-    
-    return P
\ No newline at end of file
+    altitude_m: float | np.ndarray,
+    isothermal: bool = False,
+    use_table: bool = False,
+) -> float | np.ndarray:
+    # pressure at geopotential altitude (within 0.1 % of geometric altitude for site elevations).
+    # isothermal=True keeps the single-layer formula at the sea level temperature;
+    # use_table=True reads the precomputed altitude table instead of evaluating the layers.
+    altitude_m = in_units(altitude_m, "m")
+    H = np.asarray(altitude_m, dtype=float)
+    H_max = _validate_altitude(H)
+
+    if isothermal:
+        P = P0 * np.exp(-_GMR * H / T0)
+        return P[()]
+
+    if use_table:
+        return atmosphere_table().pressure(H)
+
+    if H_max < LAYER_BASE_m[1]:
+        # every altitude in the troposphere (every site elevation): its closed form
+        # P = P0 (1 + L H / T0)^(-g0 M0 / (R* L)), without looking up the layer of each altitude,
+        # evaluated as exp(log) in one buffer since a power costs about two transcendentals anyway
+        if H.ndim == 0:
+            # a single site: plain floats, without the per-call cost of the ufuncs
+            x = 1.0 + _TROPOSPHERE_LAPSE_RATE / T0 * float(H)
+            return np.float64(P0 * math.exp(-_TROPOSPHERE_EXPONENT * math.log(x)))
+
+        P = np.multiply(H, _TROPOSPHERE_LAPSE_RATE / T0, out=np.empty_like(H))
+        P += 1.0
+        np.log(P, out=P)
+        P *= -_TROPOSPHERE_EXPONENT
+        np.exp(P, out=P)
+        P *= P0
+        return P[()]
+
+    return standard_atmosphere(H).pressure_kPa
+
+def standard_atmosphere(
+    altitude_m: float | np.ndarray,
+) -> Atmosphere:
+    # multi-layer U.S. Standard Atmosphere: each altitude is evaluated in its own layer, with
+    # T = T_b + L (H - H_b) and the hydrostatic pressure for a linear (or constant) temperature
+    altitude_m = in_units(altitude_m, "m")
+    H = np.asarray(altitude_m, dtype=float)
+    _validate_altitude(H)
+
+    layer = np.maximum(np.searchsorted(LAYER_BASE_m, H, side="right") - 1, 0)
+
+    dH = H - LAYER_BASE_m[layer]
+    L = LAYER_LAPSE_RATE_K_m[layer]
+    T_b = LAYER_BASE_TEMPERATURE_K[layer]
+    P_b = LAYER_BASE_PRESSURE_kPa[layer]
+
+    T = T_b + L * dH
+
+    P = np.where(L == 0.0, P_b * np.exp(-_GMR * dH / T_b), P_b * (T_b / T)**_LAYER_EXPONENT[layer])
+
+    return Atmosphere(P[()], T[()])
+
+class AtmosphereTable:
+    # standard atmosphere tabulated on a uniform altitude grid, for correcting many sites at once:
+    # the row is found arithmetically and ln P, which is close to linear in H, is interpolated
+    def __init__(
+        self,
+        min_altitude_m: float = MIN_ALTITUDE_m,
+        max_altitude_m: float = MAX_ALTITUDE_m,
+        step_m: float = 1.0
+    ):
+        if step_m <= 0.0:
+            raise ValueError("step_m must be > 0")
+
+        if not MIN_ALTITUDE_m <= min_altitude_m < max_altitude_m <= MAX_ALTITUDE_m:
+            raise ValueError(f"the table must lie between {MIN_ALTITUDE_m:,.0f} and {MAX_ALTITUDE_m:,.0f} m")
+
+        points = int(np.ceil((max_altitude_m - min_altitude_m) / step_m)) + 1
+
+        self.min_altitude_m = min_altitude_m
+        self.max_altitude_m = max_altitude_m
+        self.step_m = (max_altitude_m - min_altitude_m) / (points - 1)
+
+        self.altitudes_m = np.linspace(min_altitude_m, max_altitude_m, points)
+        self.pressures_kPa, self.temperatures_K = standard_atmosphere(self.altitudes_m)
+
+        self._ln_P = np.log(self.pressures_kPa)
+        self._d_ln_P = np.diff(self._ln_P)
+        self._dT = np.diff(self.temperatures_K)
+
+    def pressure(self, altitude_m: float | np.ndarray) -> float | np.ndarray:
+        i, fraction = self._locate(altitude_m)
+
+        return np.exp(self._ln_P[i] + fraction * self._d_ln_P[i])[()]
+
+    def temperature(self, altitude_m: float | np.ndarray) -> float | np.ndarray:
+        i, fraction = self._locate(altitude_m)
+
+        return (self.temperatures_K[i] + fraction * self._dT[i])[()]
+
+    def _locate(self, altitude_m: float | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        H = np.asarray(altitude_m, dtype=float)
+
+        if np.any((H < self.min_altitude_m) | (H > self.max_altitude_m)):
+            raise ValueError(f"altitude_m must be between {self.min_altitude_m:,.0f} and {self.max_altitude_m:,.0f}")
+
+        position = (H - self.min_altitude_m) / self.step_m
+        i = np.minimum(position.astype(np.intp), len(self._d_ln_P) - 1)
+
+        return i, position - i
+
+@functools.lru_cache(maxsize=4)
+def atmosphere_table(step_m: float = 1.0) -> AtmosphereTable:
+    # shared table over the whole model, built on first use
+    return AtmosphereTable(step_m=step_m)
+
+def _validate_altitude(H: np.ndarray) -> float:
+    # the lowest and highest altitudes are found once and the highest returned, so callers can
+    # tell whether every altitude lies in the troposphere; NaN fails the check
+    if H.ndim == 0:
+        H_min = H_max = float(H)
+    elif H.size == 0:
+        return MIN_ALTITUDE_m
+    else:
+        H_min, H_max = float(H.min()), float(H.max())
+
+    if not (MIN_ALTITUDE_m <= H_min and H_max <= MAX_ALTITUDE_m):
+        raise ValueError(f"altitude_m must be between {MIN_ALTITUDE_m:,.0f} and {MAX_ALTITUDE_m:,.0f}")
+
+    return H_max
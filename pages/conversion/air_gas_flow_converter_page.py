@@ -1,5 +1,12 @@
 import streamlit as st
-from calculators.conversion.air_gas_flow_converter_calc import air_gas_flow_converter
+import numpy as np
+
+from calculators.conversion.air_gas_flow_converter_calc import air_gas_flow_converter, air_gas_conversion_table
+from utilities.cache import cached_calculator
+from utilities.units import Quantity
+
+air_gas_flow_converter = cached_calculator(air_gas_flow_converter)
+air_gas_conversion_table = cached_calculator(air_gas_conversion_table)
 
 
 if "density_choice" not in st.session_state:
@@ -43,7 +50,76 @@ with st.container(border=True):
 
         except ValueError as e:
             st.error(str(e))
-            
+
+with st.container(border=True):
+    st.subheader("Capacity Table")
+
+    st.write("Air Ratings:")
+
+    ratings = st.data_editor(
+        {
+            "Device": ["Regulator 1", "Regulator 2", "Relief Valve"],
+            "Air Flow Rate": [100.0, 250.0, 1000.0],
+        },
+        num_rows="dynamic",
+        width="stretch",
+        )
+
+    st.write("Gases:")
+
+    gases = st.data_editor(
+        {
+            "Gas": ["Natural Gas", "Propane", "Nitrogen"],
+            "Specific Gravity": [0.60, 1.52, 0.967],
+            "Temperature [°C]": [15.0, 15.0, 15.0],
+            "Compressibility": [1.0, 1.0, 1.0],
+        },
+        num_rows="dynamic",
+        width="stretch",
+        )
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        air_temperature = st.number_input("Air Rating Temperature [°C]",
+                                          min_value=-50.0,
+                                          value=15.0)
+
+    with col2:
+        flow_basis = st.radio("Flow Rate Basis",
+                              ("Actual", "Standard"),
+                              horizontal=True,
+                              help="Actual volume flow rates (e.g. m3/hr), or standard flow rates (e.g. Sm3/hr, SCFH) as in most regulator and relief valve ratings.")
+
+    if st.button("Calculate Table", type="primary", width="stretch"):
+        try:
+            table = air_gas_conversion_table(
+                flowrates=np.asarray(ratings["Air Flow Rate"], dtype=float),
+                specific_gravity=np.asarray(gases["Specific Gravity"], dtype=float),
+                gas_temperature_K=Quantity(np.asarray(gases["Temperature [°C]"], dtype=float), "degC"),
+                air_temperature_K=Quantity(air_temperature, "degC"),
+                gas_compressibility=np.asarray(gases["Compressibility"], dtype=float),
+                flow_basis=flow_basis.lower()
+                )
+
+            st.dataframe({
+                "Device": list(ratings["Device"]),
+                "Air Flow Rate": [f"{x:,.1f}" for x in ratings["Air Flow Rate"]],
+                **{gas: [f"{x:,.1f}" for x in column] for gas, column in zip(gases["Gas"], table.gas_flowrate.T)},
+                },
+                hide_index=True,
+                width="content")
+
+            st.dataframe({
+                "Gas": list(gases["Gas"]),
+                "Correction Factor": [f"{x:.4f}" for x in table.correction_factor],
+                },
+                hide_index=True,
+                width="content")
+
+        except ValueError as e:
+            st.error(str(e))
+
 with st.container(border=True):
     st.subheader("Air-to-Gas Conversion")
 
@@ -60,14 +136,31 @@ with st.container(border=True):
     st.markdown("""
                 where:
                 
-                - $Q_{gas}$ is the flow rate of gas (any units of *actual* volume flow rate)
-                - $Q_{air}$ is the flow rate of air (any units of *actual* volume flow rate)
+                - $Q_{gas}$ is the flow rate of gas (any units of volume flow rate, actual or standard)
+                - $Q_{air}$ is the flow rate of air (any units of volume flow rate, actual or standard)
                 - $SG$ is the specific gravity of the gas, relative to air (dimensionless)
                 
                 This correlation is an idealization, and ***is only applicable when the following assumptions hold true***:
                 - the gas behaves as an ideal gas, limiting this correlation to relatively low pressures
                 - conditions (temperature, pressure) are identical between air and the gas in question
-                - conversion works for *actual* volume flow rates only, not standard (molar) flow rates
                 
                 """)
 
+    st.markdown("""
+                The capacity table corrects for a gas temperature and compressibility different from those of the air rating,
+                at the same upstream pressure. The mass flow through the device goes as $\\sqrt{MW / (Z T)}$, so that:
+                """)
+
+    st.latex(r"""
+             Q_{gas,actual} = Q_{air,actual} \cdot \sqrt{\frac{Z_{gas} T_{gas}}{SG \, Z_{air} T_{air}}}
+             \qquad
+             Q_{gas,std} = Q_{air,std} \cdot \sqrt{\frac{Z_{air} T_{air}}{SG \, Z_{gas} T_{gas}}}
+             """)
+
+    st.markdown("""
+                where:
+
+                - $T_{gas}$, $T_{air}$ are the flowing temperatures of the gas and of the air rating [K]
+                - $Z_{gas}$, $Z_{air}$ are the compressibility factors at the flowing conditions (the air is taken as ideal, $Z_{air}$ = 1)
+                """)
+
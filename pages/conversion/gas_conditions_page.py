@@ -1,6 +1,10 @@
 import streamlit as st
 
 from calculators.conversion.gas_conditions_calc import gas_conditions_converter
+from utilities.cache import cached_calculator
+from utilities.units import Quantity
+
+gas_conditions_converter = cached_calculator(gas_conditions_converter)
 
 divider_color = "red"
 
@@ -58,12 +62,12 @@ with st.container(border=True):
 if st.button("Calculate", type="primary", width="stretch"):
         try:
             V2 = gas_conditions_converter(
-                pressure1_Pa=pressure1*1000,
-                temperature1_K=temperature1+273.15,
+                pressure1_Pa=Quantity(pressure1, "kPa"),
+                temperature1_K=Quantity(temperature1, "degC"),
                 compressibility1=compressibility1,
                 volume1_m3=volume1,
-                pressure2_Pa=pressure2*1000,
-                temperature2_K=temperature2+273.15,
+                pressure2_Pa=Quantity(pressure2, "kPa"),
+                temperature2_K=Quantity(temperature2, "degC"),
                 compressibility2=compressibility2,
                 calc_z_factor=st.session_state.state_z_factor_calc,
                 specific_gravity_rel_air=specific_gravity
@@ -1,5 +1,8 @@
 import streamlit as st
 from calculators.geometry.vessel_volume_calc import vessel_volume
+from utilities.cache import cached_calculator
+
+vessel_volume = cached_calculator(vessel_volume)
 
 divider_color = "red"
 
@@ -1,5 +1,99 @@
 import streamlit as st
+import numpy as np
+
+from calculators.pressure_changers.control_valve_calc import valve_opening, CHARACTERISTICS
+from calculators.pressure_changers.control_valve_catalog_calc import load_valve_catalog
+
+divider_color = "red"
+
+catalog = load_valve_catalog()
 
 st.title("Control Valve Catalog")
 
-st.subheader("Coming soon!")
\ No newline at end of file
+with st.container(border=True):
+    col1, col2 = st.columns(2)
+
+    with col1:
+        characteristics = st.multiselect("Valve Characteristic",
+                                         CHARACTERISTICS,
+                                         default=CHARACTERISTICS)
+
+    with col2:
+        sizes = np.unique(catalog.columns["size_in"])
+        size_range = st.select_slider("Body Size [in]",
+                                      options=[f"{x:g}" for x in sizes],
+                                      value=(f"{sizes[0]:g}", f"{sizes[-1]:g}"))
+
+    size_in = catalog.columns["size_in"]
+    shown = (np.isin(catalog.characteristic, characteristics)
+             & (size_in >= float(size_range[0]))
+             & (size_in <= float(size_range[1])))
+
+    valves = catalog.select(np.flatnonzero(shown))
+
+    st.dataframe({
+        "Model": valves["model"],
+        "Size [in]": [f"{x:g}" for x in valves["size_in"]],
+        "Trim": valves["trim"],
+        "Characteristic": valves["characteristic"],
+        "Rated Cv": [f"{x:,.1f}" for x in valves["rated_cv"]],
+        "FL": [f"{x:.2f}" for x in valves["fl"]],
+        "xT": [f"{x:.2f}" for x in valves["xt"]],
+        },
+        hide_index=True,
+        width="stretch")
+
+with st.container(border=True):
+    st.subheader("Find a Valve", divider=divider_color)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        required_cv = st.number_input("Required Cv",
+                                      min_value=0.0,
+                                      value=25.0)
+
+    with col2:
+        max_opening = st.number_input("Maximum Valve Opening [%]",
+                                      min_value=1.0,
+                                      max_value=100.0,
+                                      value=80.0)
+
+    if st.button("Search", type="primary", width="stretch"):
+        try:
+            if not characteristics:
+                raise ValueError("Select at least one valve characteristic")
+
+            rows = [catalog.smallest_valve(required_cv, max_opening=max_opening/100, characteristic=name)
+                    for name in characteristics]
+            rows = [row for row in rows if row >= 0]
+
+            if rows:
+                # catalog rows are in ascending rated Cv
+                smallest = catalog.row(min(rows))
+                st.success(f"Smallest Valve: {smallest['model']} (rated Cv {smallest['rated_cv']:,.1f})")
+
+                valves = catalog.select(rows)
+                opening = valve_opening(required_cv, valves["rated_cv"], valves["characteristic"])
+
+                st.dataframe({
+                    "Characteristic": valves["characteristic"],
+                    "Model": valves["model"],
+                    "Size [in]": [f"{x:g}" for x in valves["size_in"]],
+                    "Rated Cv": [f"{x:,.1f}" for x in valves["rated_cv"]],
+                    "Valve Opening [%]": [f"{100*x:.1f}" for x in opening],
+                    },
+                    hide_index=True,
+                    width="content")
+            else:
+                st.warning(f"No catalog valve passes a Cv of {required_cv:,.1f} at {max_opening:.0f}% opening.")
+
+        except ValueError as e:
+            st.error(str(e))
+
+    st.markdown("""
+                The catalog is held as one column per valve property, sorted by rated $C_v$, so the smallest valve passing the
+                required $C_v$ at the maximum opening is found by binary search. The catalog is read from
+                `res/control_valves.csv` and lists generic globe valves; the rated $C_v$, $F_L$ and $x_T$ should be confirmed
+                against the manufacturer's data for the selected valve.
+                """)
@@ -1,7 +1,12 @@
 import streamlit as st
-import pandas as pd
+import numpy as np
 
-from calculators.pipe_flow.erosional_velocity_calc import erosional_velocity
+from calculators.pipe_flow.erosional_velocity_calc import erosional_velocity, erosional_velocity_screening
+from utilities.cache import cached_calculator
+from utilities.units import Quantity, convert
+
+erosional_velocity = cached_calculator(erosional_velocity)
+erosional_velocity_screening = cached_calculator(erosional_velocity_screening)
 
 divider_color = "red"
 
@@ -20,10 +25,10 @@ with st.container(border=True):
         try:
             Ve = erosional_velocity(
                 service_factor=service_factor,
-                mixture_density_lb_ft3=mixture_density/16.0185
+                mixture_density_lb_ft3=Quantity(mixture_density, "kg/m3")
             )
             
-            Ve /= 3.28084
+            Ve = convert(Ve, "ft/s", "m/s")
             
             Ve = f"{Ve:.2f} m/s"
             
@@ -31,7 +36,56 @@ with st.container(border=True):
     
         except ValueError as e:
             st.error(str(e))
-    
+
+with st.container(border=True):
+    st.subheader("Line List Screening", divider=divider_color)
+
+    lines = st.data_editor(
+        {
+            "Line": ["FL-101", "FL-102", "FL-103", "FL-104"],
+            "Inside Diameter [mm]": [102.3, 154.1, 77.9, 202.7],
+            "Flow Rate [m3/hr]": [400.0, 150.0, 350.0, 400.0],
+            "Mixture Density [kg/m3]": [150.0, 600.0, 80.0, 45.0],
+            "Service Factor": [100.0, 100.0, 100.0, 125.0],
+        },
+        num_rows="dynamic",
+        width="stretch",
+        )
+
+    limit_fraction = st.number_input("Flag Lines Above [% of Erosional Velocity]",
+                                     min_value=1.0,
+                                     value=100.0)
+
+    if st.button("Screen Lines", type="primary", width="stretch"):
+        try:
+            screening = erosional_velocity_screening(
+                inside_diameter_m=Quantity(np.asarray(lines["Inside Diameter [mm]"], dtype=float), "mm"),
+                flowrate_m3_s=Quantity(np.asarray(lines["Flow Rate [m3/hr]"], dtype=float), "m3/h"),
+                mixture_density_kg_m3=np.asarray(lines["Mixture Density [kg/m3]"], dtype=float),
+                service_factor=np.asarray(lines["Service Factor"], dtype=float),
+                limit_fraction=limit_fraction/100
+                )
+
+            names = np.asarray(lines["Line"], dtype=str)
+            flagged = screening.violations
+
+            if len(flagged) == 0:
+                st.success(f"No lines above {limit_fraction:.0f}% of the erosional velocity")
+            else:
+                st.error(f"{len(flagged)} of {len(names)} lines above {limit_fraction:.0f}% of the erosional velocity")
+
+                st.dataframe({
+                    "Line": list(names[flagged]),
+                    "Velocity [m/s]": [f"{x:.2f}" for x in screening.velocity_m_s[flagged]],
+                    "Erosional Velocity [m/s]": [f"{x:.2f}" for x in screening.erosional_velocity_m_s[flagged]],
+                    "Velocity Ratio [%]": [f"{100*x:.0f}" for x in screening.velocity_ratio[flagged]],
+                    },
+                    hide_index=True,
+                    width="content")
+
+        except ValueError as e:
+            st.error(str(e))
+
 with st.container(border=True):
     st.subheader("API RP 14E Erosional Velocity", divider=divider_color)
     
@@ -66,10 +120,12 @@ with st.container(border=True):
         "Continous": ["150-200", "100"],
         "Intermittent": ["250", "125"]
     }
-    df_service_factors = pd.DataFrame(service_factors_data)
-    st.dataframe(df_service_factors, hide_index=True, width="content")
+    st.dataframe(service_factors_data, hide_index=True, width="content")
     
     st.markdown("""
                 Note that the above service factors are to be used ***as a guideline only***. Actual design should use a more conservative service 
                 factor, or ensure that actual velocities are sufficiently lower than the calculated erosional velocity to provide some margin.
+
+                The line list screening compares the actual mixture velocity of each line, $V = Q / (\\pi D^2 / 4)$, against its
+                erosional velocity, and lists the lines above the chosen fraction of it, highest velocity ratio first.
                 """)
\ No newline at end of file
@@ -1,5 +1,126 @@
 import streamlit as st
+import numpy as np
+
+from calculators.pipe_flow.piping_pressure_drop_calc import segment_pressure_drop
+from calculators.thermo.reynolds_calc import LAMINAR_LIMIT
+from utilities.cache import cached_calculator
+from utilities.units import Quantity
+
+segment_pressure_drop = cached_calculator(segment_pressure_drop)
+
+divider_color = "red"
+
+if "roughness_type" not in st.session_state:
+    st.session_state.roughness_type = "Carbon Steel (45.72 µm)"
 
 st.title("Piping Pressure Drop")
 
-st.subheader("Coming soon!")
\ No newline at end of file
+with st.container(border=True):
+    col1, col2 = st.columns(2)
+
+    with col1:
+        flow_rate = st.number_input("Fluid Flow Rate [m3/hr]",
+                                    min_value=0.0,
+                                    value=10.0)
+
+        fluid_density = st.number_input("Fluid Density ρ [kg/m3]",
+                                        min_value=0.0,
+                                        value=999.0)
+
+        viscosity = st.number_input("Dynamic Viscosity [cP]",
+                                    min_value=0.0,
+                                    value=1.138)
+
+    with col2:
+        pipe_material = st.selectbox("Pipe Material",
+                                     ("Carbon Steel (45.72 µm)", "Stainless Steel (1.524 µm)", "Custom"),
+                                     key="roughness_type")
+
+        roughness_input = st.number_input("Pipe Roughness [µm]",
+                                          min_value=0.0,
+                                          value=45.72,
+                                          disabled=(not st.session_state.roughness_type=="Custom"))
+
+    st.write("Line Segments:")
+
+    segments = st.data_editor(
+        {
+            "Inner Diameter [mm]": [52.5, 52.5, 77.9],
+            "Length [m]": [25.0, 40.0, 60.0],
+            "Fittings K": [1.5, 0.9, 2.1],
+            "Elevation Change [m]": [0.0, 3.0, -1.5],
+        },
+        num_rows="dynamic",
+        width="stretch",
+        )
+
+if st.button("Calculate", type="primary", width="stretch"):
+    try:
+        if st.session_state.roughness_type == "Custom":
+            roughness = roughness_input
+        else:
+            match st.session_state.roughness_type:
+                case "Carbon Steel (45.72 µm)":
+                    roughness = 45.72
+                case "Stainless Steel (1.524 µm)":
+                    roughness = 1.524
+
+        dP = segment_pressure_drop(
+            flowrate_m3_s=Quantity(flow_rate, "m3/h"),
+            fluid_density_kg_m3=fluid_density,
+            viscosity_Pa_s=Quantity(viscosity, "cP"),
+            pipe_diameter_m=Quantity(np.asarray(segments["Inner Diameter [mm]"], dtype=float), "mm"),
+            pipe_roughness_m=Quantity(roughness, "µm"),
+            length_m=np.asarray(segments["Length [m]"], dtype=float),
+            fittings_k=np.asarray(segments["Fittings K"], dtype=float),
+            elevation_change_m=np.asarray(segments["Elevation Change [m]"], dtype=float)
+            )
+
+        dP_total = f"{np.sum(dP):.2f} kPa"
+
+        st.success(f"Total Pressure Drop: {dP_total}")
+
+        st.dataframe({
+            "Segment": list(range(1, len(dP) + 1)),
+            "Pressure Drop [kPa]": [f"{x:.3f}" for x in dP],
+            },
+            hide_index=True,
+            width="content")
+
+    except ValueError as e:
+        st.error(str(e))
+
+with st.container(border=True):
+    st.subheader("Darcy-Weisbach Pressure Drop", divider=divider_color)
+
+    st.markdown("""
+                The line is split into segments of constant diameter. The pressure drop of each segment is the sum of
+                pipe friction, fittings losses and the change in static head:
+                """)
+
+    st.latex(r"""
+             \Delta P = \left( \frac{f L}{D} + \sum K \right) \frac{\rho V^2}{2} + \rho g \Delta z
+             """)
+
+    st.markdown("""
+                where:
+
+                - $\\Delta P$ is the pressure drop of the segment [Pa]
+                - $f$ is the Darcy Friction Factor (dimensionless)
+                - $L$ is the length of the segment [m]
+                - $D$ is the inner diameter of the segment [m]
+                - $\\sum K$ is the total resistance coefficient of the fittings in the segment (dimensionless)
+                - $\\rho$ is the density of the fluid [kg/m³]
+                - $V$ is the average velocity of the fluid in the segment [m/s]
+                - $g$ is the acceleration due to gravity = 9.80665 m/s
+                - $\\Delta z$ is the elevation change from the start to the end of the segment [m]
+
+                The line pressure drop is the sum of the segment pressure drops.
+                """)
+
+    st.subheader("Friction Factor", divider=divider_color)
+
+    st.markdown(f"""
+                For laminar flow ($Re < {LAMINAR_LIMIT:,.0f}$) the friction factor is $f = 64/Re$. Otherwise, Serghides' solution of
+                the Colebrook-White equation is used, as described on the Pump NPSH page.
+                """)
@@ -1,5 +1,260 @@
 import streamlit as st
+import numpy as np
+
+from calculators.pressure_changers.control_valve_calc import liquid_valve_cv, gas_valve_cv, valve_opening, CHARACTERISTICS
+from calculators.pressure_changers.control_valve_catalog_calc import load_valve_catalog
+from utilities.cache import cached_calculator
+from utilities.units import Quantity
+
+liquid_valve_cv = cached_calculator(liquid_valve_cv)
+gas_valve_cv = cached_calculator(gas_valve_cv)
+
+divider_color = "red"
 
 st.title("Control Valve Sizing")
 
-st.subheader("Coming soon!")
\ No newline at end of file
+with st.container(border=True):
+    st.write("Valve Selection:")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        max_opening = st.number_input("Maximum Valve Opening [%]",
+                                      min_value=1.0,
+                                      max_value=100.0,
+                                      value=80.0,
+                                      help="The selected valve passes every operating case at or below this travel.")
+
+    with col2:
+        characteristic = st.selectbox("Valve Characteristic",
+                                      ("Any",) + CHARACTERISTICS)
+
+def selection() -> dict:
+    return dict(max_opening=max_opening/100, characteristic=None if characteristic == "Any" else characteristic)
+
+def show_sizing(cases, row, size, factor_column, entered_factor):
+    # the selected valve is sized with its own FL or xT, the entered one is used when no valve fits
+    catalog = load_valve_catalog()
+
+    if row < 0:
+        result = size(entered_factor)
+        cv = np.atleast_1d(result.cv)
+        st.warning(f"No catalog valve passes the maximum Cv of {cv.max():,.1f} at {max_opening:.0f}% opening.")
+        opening = None
+    else:
+        valve = catalog.row(row)
+        result = size(valve[factor_column])
+        cv = np.atleast_1d(result.cv)
+        st.success(f"Selected Valve: {valve['model']} ({valve['size_in']:g} in, {valve['trim']} trim, "
+                   f"{valve['characteristic']}, rated Cv {valve['rated_cv']:,.1f}, "
+                   f"{'FL' if factor_column == 'fl' else 'xT'} {valve[factor_column]:.2f})")
+        opening = valve_opening(cv, valve["rated_cv"], valve["characteristic"])
+
+    choked = np.broadcast_to(result.choked, cv.shape)
+
+    table = {
+        "Case": list(cases["Case"]),
+        "Required Cv": [f"{x:,.2f}" for x in cv],
+        "Choked": ["Yes" if x else "No" for x in choked],
+        }
+
+    if opening is not None:
+        table["Valve Opening [%]"] = [f"{100*x:.1f}" for x in opening]
+
+    st.dataframe(table, hide_index=True, width="content")
+
+liquid_tab, gas_tab = st.tabs(["Liquid", "Gas"])
+
+with liquid_tab:
+    with st.container(border=True):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            fluid_density = st.number_input("Fluid Density ρ [kg/m3]",
+                                            min_value=0.0,
+                                            value=999.0)
+
+            vapor_pressure = st.number_input("Vapor Pressure [kPa abs]",
+                                             min_value=0.0,
+                                             value=3.17)
+
+        with col2:
+            critical_pressure = st.number_input("Critical Pressure [kPa abs]",
+                                                min_value=0.0,
+                                                value=22064.0)
+
+            liquid_recovery_factor = st.number_input("Liquid Pressure Recovery Factor FL",
+                                                     min_value=0.0,
+                                                     max_value=1.0,
+                                                     value=0.90)
+
+        st.write("Operating Cases:")
+
+        liquid_cases = st.data_editor(
+            {
+                "Case": ["Minimum", "Normal", "Maximum"],
+                "Flow Rate [m3/hr]": [20.0, 50.0, 75.0],
+                "Inlet Pressure [kPa abs]": [1200.0, 1100.0, 1000.0],
+                "Outlet Pressure [kPa abs]": [500.0, 600.0, 700.0],
+            },
+            num_rows="dynamic",
+            width="stretch",
+            key="liquid_cases",
+            )
+
+        if st.button("Calculate", type="primary", width="stretch", key="liquid_calculate"):
+            try:
+                inputs = dict(
+                    flowrate_m3_s=Quantity(np.asarray(liquid_cases["Flow Rate [m3/hr]"], dtype=float), "m3/h"),
+                    inlet_pressure_kPa=np.asarray(liquid_cases["Inlet Pressure [kPa abs]"], dtype=float),
+                    outlet_pressure_kPa=np.asarray(liquid_cases["Outlet Pressure [kPa abs]"], dtype=float),
+                    fluid_density_kg_m3=fluid_density,
+                    vapor_pressure_kPa=vapor_pressure,
+                    critical_pressure_kPa=critical_pressure,
+                    )
+
+                row = load_valve_catalog().smallest_liquid_valve(**inputs, **selection())
+
+                show_sizing(liquid_cases, row, lambda fl: liquid_valve_cv(**inputs, liquid_recovery_factor=fl),
+                            "fl", liquid_recovery_factor)
+
+            except ValueError as e:
+                st.error(str(e))
+
+    with st.container(border=True):
+        st.subheader("Liquid Sizing", divider=divider_color)
+
+        st.markdown("""
+                    The required flow coefficient is calculated per IEC 60534-2-1 (ISA-75.01.01) for turbulent flow, without
+                    attached reducers ($F_P = 1$):
+                    """)
+
+        st.latex(r"""
+                 C_v = \frac{Q}{N_1} \sqrt{\frac{\rho_1 / \rho_o}{\Delta P_{sizing}}}
+                 \qquad \Delta P_{sizing} = \min \left( \Delta P, \; F_L^2 \left( P_1 - F_F P_v \right) \right)
+                 \qquad F_F = 0.96 - 0.28 \sqrt{\frac{P_v}{P_c}}
+                 """)
+
+        st.markdown("""
+                    where:
+
+                    - $C_v$ is the valve flow coefficient [USgpm/psi$^{0.5}$]
+                    - $Q$ is the volumetric flow rate [m³/hr]
+                    - $N_1$ = 0.0865 for $Q$ in m³/hr and $\\Delta P$ in kPa
+                    - $\\rho_1 / \\rho_o$ is the liquid density relative to water at 15 °C (1000 kg/m³)
+                    - $\\Delta P$ is the pressure drop across the valve, $P_1 - P_2$ [kPa]
+                    - $F_L$ is the liquid pressure recovery factor of the valve
+                    - $F_F$ is the liquid critical pressure ratio factor
+                    - $P_v$ is the vapor pressure of the liquid at inlet temperature [kPa abs]
+                    - $P_c$ is the critical pressure of the liquid [kPa abs]
+
+                    When $\\Delta P$ exceeds the choked pressure drop the flow is choked (flashing or cavitating) and the choked
+                    pressure drop is used.
+                    """)
+
+with gas_tab:
+    with st.container(border=True):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            specific_gravity = st.number_input("Gas Specific Gravity (air = 1)",
+                                               min_value=0.0,
+                                               value=0.65)
+
+            heat_capacity_ratio = st.number_input("Heat Capacity Ratio k = Cp/Cv",
+                                                  min_value=1.0,
+                                                  value=1.28)
+
+        with col2:
+            pressure_drop_ratio_factor = st.number_input("Pressure Drop Ratio Factor xT",
+                                                         min_value=0.0,
+                                                         max_value=1.0,
+                                                         value=0.70)
+
+        st.write("Operating Cases:")
+
+        gas_cases = st.data_editor(
+            {
+                "Case": ["Minimum", "Normal", "Maximum"],
+                "Mass Flow Rate [kg/hr]": [4000.0, 10000.0, 15000.0],
+                "Inlet Pressure [kPa abs]": [3200.0, 3000.0, 2800.0],
+                "Outlet Pressure [kPa abs]": [2000.0, 2000.0, 2000.0],
+                "Inlet Temperature [°C]": [25.0, 25.0, 25.0],
+            },
+            num_rows="dynamic",
+            width="stretch",
+            key="gas_cases",
+            )
+
+        if st.button("Calculate", type="primary", width="stretch", key="gas_calculate"):
+            try:
+                inputs = dict(
+                    mass_flowrate_kg_s=Quantity(np.asarray(gas_cases["Mass Flow Rate [kg/hr]"], dtype=float), "kg/h"),
+                    inlet_pressure_kPa=np.asarray(gas_cases["Inlet Pressure [kPa abs]"], dtype=float),
+                    outlet_pressure_kPa=np.asarray(gas_cases["Outlet Pressure [kPa abs]"], dtype=float),
+                    inlet_temperature_K=Quantity(np.asarray(gas_cases["Inlet Temperature [°C]"], dtype=float), "degC"),
+                    specific_gravity=specific_gravity,
+                    heat_capacity_ratio=heat_capacity_ratio,
+                    )
+
+                row = load_valve_catalog().smallest_gas_valve(**inputs, **selection())
+
+                show_sizing(gas_cases, row, lambda xt: gas_valve_cv(**inputs, pressure_drop_ratio_factor=xt),
+                            "xt", pressure_drop_ratio_factor)
+
+            except ValueError as e:
+                st.error(str(e))
+
+    with st.container(border=True):
+        st.subheader("Gas Sizing", divider=divider_color)
+
+        st.markdown("""
+                    The required flow coefficient is calculated per IEC 60534-2-1 (ISA-75.01.01) for turbulent flow, without
+                    attached reducers ($F_P = 1$):
+                    """)
+
+        st.latex(r"""
+                 C_v = \frac{W}{N_8 P_1 Y} \sqrt{\frac{T_1 Z}{x_{sizing} M}}
+                 \qquad Y = 1 - \frac{x_{sizing}}{3 F_\gamma x_T}
+                 \qquad x_{sizing} = \min \left( \frac{\Delta P}{P_1}, \; F_\gamma x_T \right)
+                 \qquad F_\gamma = \frac{k}{1.40}
+                 """)
+
+        st.markdown("""
+                    where:
+
+                    - $W$ is the mass flow rate [kg/hr]
+                    - $N_8$ = 0.948 for $W$ in kg/hr, $P_1$ in kPa and $T_1$ in K
+                    - $P_1$ is the inlet pressure [kPa abs]
+                    - $Y$ is the expansion factor
+                    - $T_1$ is the inlet temperature [K]
+                    - $Z$ is the inlet compressibility factor (GPSA method)
+                    - $M$ is the molecular weight of the gas = 28.9644 × SG [kg/kmol]
+                    - $x_T$ is the pressure drop ratio factor of the valve
+                    - $F_\\gamma$ is the specific heat ratio factor
+
+                    When $\\Delta P / P_1$ reaches $F_\\gamma x_T$ the flow is choked and the choked pressure drop ratio is used.
+                    """)
+
+with st.container(border=True):
+    st.subheader("Valve Selection", divider=divider_color)
+
+    st.markdown("""
+                The valve is the smallest in the control valve catalog whose flow coefficient at the maximum opening
+                covers the largest required $C_v$ of all operating cases. The inherent characteristics are:
+                """)
+
+    st.latex(r"""
+             \text{Linear: } \frac{C_v}{C_{v,rated}} = x \qquad \text{Equal Percentage: } \frac{C_v}{C_{v,rated}} = R^{\,x - 1}
+             """)
+
+    st.markdown("""
+                where:
+
+                - $x$ is the fractional valve travel (1 = fully open)
+                - $R$ is the inherent rangeability of the valve = 50
+
+                Each catalog valve is sized with its own $F_L$ (liquid) or $x_T$ (gas), listed on the Control Valve Catalog
+                page, so that its own choked-flow limit applies. The entered $F_L$ and $x_T$ are used when no catalog valve
+                fits.
+                """)
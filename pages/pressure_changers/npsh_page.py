@@ -1,6 +1,15 @@
 import streamlit as st
-from calculators.pressure_changers.npsh_calc import npsh_simple, npsh_advanced
+from calculators.pressure_changers.npsh_calc import npsh_simple, npsh_advanced, npsh_curve
+from calculators.utilities.barometric_pressure_calc import barometric_pressure
+from utilities.cache import cached_calculator
+from utilities.units import Quantity, convert
 import math
+import numpy as np
+
+npsh_simple = cached_calculator(npsh_simple)
+npsh_advanced = cached_calculator(npsh_advanced)
+npsh_curve = cached_calculator(npsh_curve)
+barometric_pressure = cached_calculator(barometric_pressure)
 
 divider_color = "red"
 
@@ -9,6 +18,9 @@ if "roughness_type" not in st.session_state:
     
 if "opt_advanced_calc" not in st.session_state:
     st.session_state.opt_advanced_calc = False
+
+if "opt_site_elevation" not in st.session_state:
+    st.session_state.opt_site_elevation = False
     
 if "methodology_expanded" not in st.session_state:
     st.session_state.methodology_expanded = False
@@ -23,11 +35,26 @@ col1, col2 = st.columns(2)
 with col1:
     with st.container(border=True):
         st.subheader("Basic", divider=divider_color)
-        atmospheric_pressure = st.number_input("Atmospheric Pressure [kPa]",
-                                               min_value=0.0,
-                                               value=101.325,
-                                               help="Atmospheric pressure has a significant impact on NPSHa.\n\n"
-                                               "Ensure the correct atmospheric pressure is used.")
+        opt_site_elevation = st.checkbox("Use site elevation?",
+                                         key="opt_site_elevation",
+                                         help="Calculate the atmospheric pressure from the U.S. Standard Atmosphere.")
+
+        if st.session_state.opt_site_elevation:
+            site_elevation = st.number_input("Site Elevation [m]",
+                                             min_value=-500.0,
+                                             max_value=9000.0,
+                                             value=0.0)
+
+            atmospheric_pressure = barometric_pressure(site_elevation)
+
+            st.caption(f"Atmospheric Pressure: {atmospheric_pressure:.3f} kPa")
+
+        else:
+            atmospheric_pressure = st.number_input("Atmospheric Pressure [kPa]",
+                                                   min_value=0.0,
+                                                   value=101.325,
+                                                   help="Atmospheric pressure has a significant impact on NPSHa.\n\n"
+                                                   "Ensure the correct atmospheric pressure is used.")
         
         inlet_pressure = st.number_input("Inlet Pressure (Px) [kPag]",
                                         min_value=0.0,
@@ -88,8 +115,8 @@ with col2:
 
 if st.button("Calculate", type="primary", width="stretch"):
     try:
-        area = math.pi / 4 * (pipe_diameter/1000)**2
-        velocity = (flow_rate / 3600) / area
+        area = math.pi / 4 * convert(pipe_diameter, "mm", "m")**2
+        velocity = convert(flow_rate, "m3/h", "m3/s") / area
         
         if st.session_state.roughness_type == "Custom":
             roughness = roughness_input
@@ -107,9 +134,9 @@ if st.button("Calculate", type="primary", width="stretch"):
                 fluid_density_kg_m3=fluid_density,
                 relative_height_m=relative_height,
                 velocity_m_s=velocity,
-                pipe_diameter_m=pipe_diameter/1000,
-                viscosity_Pa_s=viscosity/1000,
-                pipe_roughness_m=roughness/10**6,
+                pipe_diameter_m=Quantity(pipe_diameter, "mm"),
+                viscosity_Pa_s=Quantity(viscosity, "cP"),
+                pipe_roughness_m=Quantity(roughness, "µm"),
                 equivalent_length_m=pipe_length
                 )
             NPSHa = f"{NPSHa:.2f} m"
@@ -132,6 +159,95 @@ if st.button("Calculate", type="primary", width="stretch"):
 
     except ValueError as e:
         st.error(str(e))
+
+with st.container(border=True):
+    st.subheader("NPSHa Curve", divider=divider_color)
+
+    if not st.session_state.opt_advanced_calc:
+        st.info("Enable the head loss calculation to plot NPSHa over a range of flow rates.")
+
+    else:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            flow_min = st.number_input("Minimum Flow Rate [m3/hr]",
+                                       min_value=0.0,
+                                       value=0.5)
+
+            flow_max = st.number_input("Maximum Flow Rate [m3/hr]",
+                                       min_value=0.0,
+                                       value=15.0)
+
+            required_margin = st.number_input("Required NPSH Margin [m]",
+                                              min_value=0.0,
+                                              value=1.0,
+                                              help="Minimum NPSHa - NPSHr to be maintained.")
+
+        with col2:
+            st.write("Pump NPSHr Curve:")
+
+            npshr_points = st.data_editor(
+                {
+                    "Flow Rate [m3/hr]": [0.0, 5.0, 10.0, 15.0],
+                    "NPSHr [m]": [1.0, 1.5, 2.5, 4.0],
+                },
+                num_rows="dynamic",
+                width="stretch",
+                )
+
+        if st.button("Plot Curve", type="primary", width="stretch"):
+            try:
+                if st.session_state.roughness_type == "Custom":
+                    roughness = roughness_input
+                else:
+                    match st.session_state.roughness_type:
+                        case "Carbon Steel (45.72 µm)":
+                            roughness = 45.72
+                        case "Stainless Steel (1.524 µm)":
+                            roughness = 1.524
+
+                if not 0.0 < flow_min < flow_max:
+                    raise ValueError("Flow rates must satisfy 0 < minimum < maximum")
+
+                npshr_flow = np.asarray(npshr_points["Flow Rate [m3/hr]"], dtype=float)
+                npshr = np.asarray(npshr_points["NPSHr [m]"], dtype=float)
+                order = np.argsort(npshr_flow)
+
+                flow_rates = np.linspace(flow_min, flow_max, 200)
+
+                curve = npsh_curve(
+                    flowrate_m3_s=Quantity(flow_rates, "m3/h"),
+                    pressure1_kPa=inlet_pressure+atmospheric_pressure,
+                    vapor_pressure_kPa=vapor_pressure,
+                    fluid_density_kg_m3=fluid_density,
+                    relative_height_m=relative_height,
+                    pipe_diameter_m=Quantity(pipe_diameter, "mm"),
+                    viscosity_Pa_s=Quantity(viscosity, "cP"),
+                    pipe_roughness_m=Quantity(roughness, "µm"),
+                    equivalent_length_m=pipe_length,
+                    npshr_flowrate_m3_s=Quantity(npshr_flow[order], "m3/h") if npshr.size else None,
+                    npshr_m=npshr[order] if npshr.size else None,
+                    required_margin_m=required_margin,
+                    )
+
+                chart_data = {
+                    "Flow Rate [m3/hr]": flow_rates,
+                    "NPSHa [m]": curve.npsh_available_m,
+                    }
+
+                if curve.npsh_required_m is not None:
+                    chart_data["NPSHr [m]"] = curve.npsh_required_m
+
+                    if np.isnan(curve.cavitation_flowrate_m3_s):
+                        st.success(f"NPSH margin of {required_margin:.2f} m is maintained over the whole flow range")
+                    else:
+                        limit = convert(curve.cavitation_flowrate_m3_s, "m3/s", "m3/h")
+                        st.warning(f"NPSH margin of {required_margin:.2f} m is lost above {limit:.2f} m3/hr")
+
+                st.line_chart(chart_data, x="Flow Rate [m3/hr]", x_label="Flow Rate [m3/hr]", y_label="Head [m]")
+
+            except ValueError as e:
+                st.error(str(e))
         
 with st.container(border=True):
     st.subheader("Net Positive Suction Head", divider=divider_color)
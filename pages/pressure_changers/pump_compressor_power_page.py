@@ -1,5 +1,203 @@
 import streamlit as st
 
+from calculators.pressure_changers.pump_compressor_power_calc import (
+    pump_power, compressor_adiabatic_power, compressor_polytropic_power
+)
+from utilities.cache import cached_calculator
+from utilities.units import Quantity
+
+pump_power = cached_calculator(pump_power)
+compressor_adiabatic_power = cached_calculator(compressor_adiabatic_power)
+compressor_polytropic_power = cached_calculator(compressor_polytropic_power)
+
+divider_color = "red"
+
+if "compression_path" not in st.session_state:
+    st.session_state.compression_path = "Polytropic"
+
 st.title("Pump/Compressor Power")
 
-st.subheader("Coming soon!")
\ No newline at end of file
+pump_tab, compressor_tab = st.tabs(["Pump", "Compressor"])
+
+with pump_tab:
+    with st.container(border=True):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            pump_flow_rate = st.number_input("Flow Rate [m3/hr]",
+                                             min_value=0.0,
+                                             value=50.0)
+
+            differential_pressure = st.number_input("Differential Pressure [kPa]",
+                                                    min_value=0.0,
+                                                    value=500.0)
+
+        with col2:
+            pump_efficiency = st.number_input("Pump Efficiency [%]",
+                                              min_value=0.0,
+                                              max_value=100.0,
+                                              value=70.0)
+
+            driver_efficiency = st.number_input("Driver Efficiency [%]",
+                                                min_value=0.0,
+                                                max_value=100.0,
+                                                value=95.0)
+
+        if st.button("Calculate", type="primary", width="stretch", key="pump_calculate"):
+            try:
+                result = pump_power(
+                    flowrate_m3_s=Quantity(pump_flow_rate, "m3/h"),
+                    differential_pressure_kPa=differential_pressure,
+                    pump_efficiency=pump_efficiency/100,
+                    driver_efficiency=driver_efficiency/100
+                    )
+
+                st.success(f"Brake Power: {result.brake_power_kW:,.2f} kW")
+
+                st.dataframe({
+                    "Hydraulic Power [kW]": [f"{result.hydraulic_power_kW:,.2f}"],
+                    "Brake Power [kW]": [f"{result.brake_power_kW:,.2f}"],
+                    "Driver Power [kW]": [f"{result.driver_power_kW:,.2f}"],
+                    },
+                    hide_index=True,
+                    width="content")
+
+            except ValueError as e:
+                st.error(str(e))
+
+    with st.container(border=True):
+        st.subheader("Pump Power", divider=divider_color)
+
+        st.latex(r"""
+                 P_{hyd} = Q \cdot \Delta P \qquad P_{brake} = \frac{P_{hyd}}{\eta_p} \qquad P_{driver} = \frac{P_{brake}}{\eta_d}
+                 """)
+
+        st.markdown("""
+                    where:
+
+                    - $P_{hyd}$ is the hydraulic power delivered to the fluid [kW]
+                    - $Q$ is the volumetric flow rate [m³/s]
+                    - $\\Delta P$ is the differential pressure across the pump [kPa]
+                    - $\\eta_p$ is the pump efficiency
+                    - $\\eta_d$ is the driver (motor) efficiency
+                    """)
+
+with compressor_tab:
+    with st.container(border=True):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            mass_flow_rate = st.number_input("Mass Flow Rate [kg/hr]",
+                                             min_value=0.0,
+                                             value=36000.0)
+
+            suction_pressure = st.number_input("Suction Pressure [kPa abs]",
+                                               min_value=0.0,
+                                               value=3000.0)
+
+            discharge_pressure = st.number_input("Discharge Pressure [kPa abs]",
+                                                 min_value=0.0,
+                                                 value=9000.0)
+
+            suction_temperature = st.number_input("Suction Temperature [°C]",
+                                                  min_value=-273.15,
+                                                  value=30.0)
+
+        with col2:
+            specific_gravity = st.number_input("Gas Specific Gravity (air = 1)",
+                                               min_value=0.0,
+                                               value=0.65)
+
+            heat_capacity_ratio = st.number_input("Heat Capacity Ratio k = Cp/Cv",
+                                                  min_value=1.0,
+                                                  value=1.28)
+
+            compression_path = st.radio("Compression Path",
+                                        ("Polytropic", "Adiabatic"),
+                                        horizontal=True,
+                                        key="compression_path")
+
+            efficiency = st.number_input(f"{st.session_state.compression_path} Efficiency [%]",
+                                         min_value=0.0,
+                                         max_value=100.0,
+                                         value=78.0)
+
+            steps = st.number_input("Integration Steps",
+                                    min_value=1,
+                                    value=10,
+                                    disabled=st.session_state.compression_path != "Polytropic",
+                                    help="Number of equal pressure-ratio steps along the polytropic path, "
+                                    "each with its own compressibility factor.")
+
+        if st.button("Calculate", type="primary", width="stretch", key="compressor_calculate"):
+            try:
+                inputs = dict(
+                    mass_flowrate_kg_s=Quantity(mass_flow_rate, "kg/h"),
+                    suction_pressure_kPa=suction_pressure,
+                    discharge_pressure_kPa=discharge_pressure,
+                    suction_temperature_K=Quantity(suction_temperature, "degC"),
+                    specific_gravity=specific_gravity,
+                    heat_capacity_ratio=heat_capacity_ratio,
+                    )
+
+                if st.session_state.compression_path == "Polytropic":
+                    result = compressor_polytropic_power(**inputs, polytropic_efficiency=efficiency/100, steps=int(steps))
+                else:
+                    result = compressor_adiabatic_power(**inputs, adiabatic_efficiency=efficiency/100)
+
+                st.success(f"Gas Power: {result.gas_power_kW:,.1f} kW")
+
+                st.dataframe({
+                    "Head [kJ/kg]": [f"{result.head_kJ_kg:,.2f}"],
+                    "Gas Power [kW]": [f"{result.gas_power_kW:,.1f}"],
+                    "Discharge Temperature [°C]": [f"{result.discharge_temperature_K - 273.15:,.1f}"],
+                    },
+                    hide_index=True,
+                    width="content")
+
+            except ValueError as e:
+                st.error(str(e))
+
+    with st.container(border=True):
+        st.subheader("Compressor Head and Power", divider=divider_color)
+
+        st.markdown("""
+                    The adiabatic head and discharge temperature are calculated per GPSA Section 13:
+                    """)
+
+        st.latex(r"""
+                 H_{ad} = \frac{Z_{avg} R T_1}{MW} \frac{k}{k-1} \left[ \left( \frac{P_2}{P_1} \right)^{\frac{k-1}{k}} - 1 \right]
+                 \qquad T_2 = T_1 \left[ 1 + \frac{(P_2/P_1)^{\frac{k-1}{k}} - 1}{\eta_{ad}} \right]
+                 """)
+
+        st.markdown("""
+                    and the polytropic head, with the polytropic exponent $n$ found from the polytropic efficiency:
+                    """)
+
+        st.latex(r"""
+                 H_{p} = \frac{Z_{avg} R T_1}{MW} \frac{n}{n-1} \left[ \left( \frac{P_2}{P_1} \right)^{\frac{n-1}{n}} - 1 \right]
+                 \qquad \frac{n-1}{n} = \frac{k-1}{k \, \eta_p}
+                 \qquad T_2 = T_1 \left( \frac{P_2}{P_1} \right)^{\frac{n-1}{n}}
+                 """)
+
+        st.latex(r"""
+                 P_{gas} = \frac{\dot{m} H}{\eta}
+                 """)
+
+        st.markdown("""
+                    where:
+
+                    - $H$ is the adiabatic or polytropic head [kJ/kg]
+                    - $Z_{avg}$ is the average of the suction and discharge compressibility factors (GPSA method)
+                    - $R$ is the universal gas constant = 8.31446 kJ/kmol·K
+                    - $T_1$, $T_2$ are the suction and discharge temperatures [K]
+                    - $P_1$, $P_2$ are the suction and discharge pressures [kPa abs]
+                    - $MW$ is the molecular weight of the gas = 28.9644 × SG [kg/kmol]
+                    - $k$ is the heat capacity ratio $C_p/C_v$
+                    - $\\eta$ is the adiabatic or polytropic efficiency
+                    - $\\dot{m}$ is the mass flow rate [kg/s]
+
+                    For high compression ratios, the polytropic path can be split into a number of steps of equal pressure
+                    ratio. The head of each step uses the average compressibility factor of that step, and the total head is the
+                    sum of the step heads.
+                    """)
@@ -1,3 +1,136 @@
 import streamlit as st
+import numpy as np
 
-st.title("Peng-Robinson Flash Solver")
\ No newline at end of file
+from calculators.thermo.pr_flash_calc import pr_flash
+from utilities.units import convert
+from utilities.components import COMPONENT_NAMES, component_ids, component_properties
+from utilities.cache import cached_calculator
+
+pr_flash = cached_calculator(pr_flash)
+
+divider_color = "red"
+
+st.title("Peng-Robinson Flash Solver")
+
+with st.container(border=True):
+    col1, col2 = st.columns(2)
+
+    with col1:
+        pressure = st.number_input("Pressure [kPa abs]",
+                                   min_value=0.0,
+                                   value=3000.0)
+
+    with col2:
+        temperature = st.number_input("Temperature [°C]",
+                                      min_value=-273.15,
+                                      value=-23.15)
+
+    st.write("Feed Composition:")
+
+    components = st.data_editor(
+        {
+            "Component": ["Methane", "Ethane", "Propane", "n-Butane", "n-Pentane", "n-Hexane", "Carbon Dioxide", "Nitrogen"],
+            "Mole Fraction": [0.70, 0.10, 0.07, 0.05, 0.03, 0.03, 0.01, 0.01],
+        },
+        column_config={
+            "Component": st.column_config.SelectboxColumn(options=COMPONENT_NAMES, required=True),
+        },
+        num_rows="dynamic",
+        width="stretch",
+        )
+
+if st.button("Calculate", type="primary", width="stretch"):
+    try:
+        properties = component_properties(component_ids(components["Component"]))
+
+        result = pr_flash(
+            pressure_kPa=pressure,
+            temperature_K=convert(temperature, "degC", "K"),
+            composition=np.asarray(components["Mole Fraction"], dtype=float),
+            critical_temperature_K=properties.critical_temperature_K,
+            critical_pressure_kPa=properties.critical_pressure_kPa,
+            acentric_factor=properties.acentric_factor,
+            kij=properties.kij,
+            )
+
+        V = result.vapor_fraction[0]
+
+        if result.trivial[0]:
+            st.warning("Flash collapsed to the trivial solution (K = 1), the phase split is not resolved.")
+        elif not result.converged[0]:
+            st.warning("Flash did not converge, results are approximate.")
+
+        if V <= 0.0:
+            st.success("Single phase: liquid")
+        elif V >= 1.0:
+            st.success("Single phase: vapor")
+        else:
+            st.success(f"Vapor Fraction: {V:.4f} mol/mol")
+
+        st.write(f"Z-factor: liquid {result.Z_liquid[0]:.4f}, vapor {result.Z_vapor[0]:.4f}")
+
+        st.dataframe({
+            "Component": components["Component"],
+            "Liquid (x)": [f"{v:.4f}" for v in result.liquid_composition[0]],
+            "Vapor (y)": [f"{v:.4f}" for v in result.vapor_composition[0]],
+            "K": [f"{v:.4g}" for v in result.K[0]],
+            },
+            hide_index=True,
+            width="content")
+
+    except ValueError as e:
+        st.error(str(e))
+
+with st.container(border=True):
+    st.subheader("Peng-Robinson Equation of State", divider=divider_color)
+
+    st.markdown("""
+                The Peng-Robinson equation of state is written in terms of the compressibility factor as a cubic:
+                """)
+
+    st.latex(r"""
+             Z^3 - (1 - B) Z^2 + (A - 3B^2 - 2B) Z - (AB - B^2 - B^3) = 0
+             """)
+
+    st.latex(r"""
+             A_i = 0.45724 \, \alpha_i \frac{P_{r,i}}{T_{r,i}^2} \qquad B_i = 0.07780 \frac{P_{r,i}}{T_{r,i}}
+             """)
+
+    st.latex(r"""
+             \alpha_i = \left( 1 + m_i \left( 1 - \sqrt{T_{r,i}} \right) \right)^2 \qquad m_i = 0.37464 + 1.54226\omega_i - 0.26992\omega_i^2
+             """)
+
+    st.markdown("""
+                with the van der Waals mixing rules $A = \\sum_i \\sum_j x_i x_j (1 - k_{ij}) \\sqrt{A_i A_j}$ and $B = \\sum_i x_i B_i$.
+                The smallest root is used for the liquid and the largest for the vapor.
+                """)
+
+    st.subheader("Flash Calculation", divider=divider_color)
+
+    st.markdown("""
+                Starting from Wilson's K-values, the vapor fraction $V$ is found from the Rachford-Rice equation:
+                """)
+
+    st.latex(r"""
+             \sum_i \frac{z_i (K_i - 1)}{1 + V (K_i - 1)} = 0
+             """)
+
+    st.markdown("""
+                The K-values are then updated by successive substitution, $K_i = \\phi_i^L / \\phi_i^V$, until the fugacity of
+                each component is equal in both phases. Every fifth step is extrapolated along the dominant eigenvalue of the
+                iteration to speed up convergence.
+
+                where:
+
+                - $z_i$ is the mole fraction of component $i$ in the feed
+                - $K_i$ is the equilibrium ratio $y_i / x_i$ of component $i$
+                - $\\phi_i^L$, $\\phi_i^V$ are the fugacity coefficients of component $i$ in the liquid and vapor
+                - $P_{r,i}$, $T_{r,i}$ are the reduced pressure and temperature of component $i$
+                - $\\omega_i$ is the acentric factor of component $i$
+
+                - $k_{ij}$ is the binary interaction parameter between components $i$ and $j$
+
+                Component properties and binary interaction parameters are taken from the built-in component database.
+                No phase stability test is performed: a feed with no
+                two-phase solution is reported as single phase.
+                """)
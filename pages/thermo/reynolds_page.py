@@ -1,6 +1,10 @@
 import streamlit as st
-import pandas as pd
-from calculators.thermo.reynolds_calc import reynolds_number
+from calculators.thermo.reynolds_calc import (
+    reynolds_regimes, REGIME_NAMES, REYNOLDS_INPUTS, LAMINAR_LIMIT, TURBULENT_LIMIT
+)
+from utilities.cache import cached_calculator
+
+reynolds_regimes = cached_calculator(reynolds_regimes)
 
 # set the divider color to be used throughout the page
 divider_color = "red"
@@ -29,16 +33,18 @@ with st.container(border=True):
     
     if st.button("Calculate", type="primary", width="stretch"):
         try:
-            Re = reynolds_number(
+            Re, regime, valid, invalid_flags = reynolds_regimes(
                 density_kg_m3=density,
                 velocity_m_s=velocity,
                 diameter_m=diameter,
                 dynamic_viscosity_pa_s=viscosity
             )
             
-            Re = f"{Re:,.0f}"
-            
-            st.success(f"Reynolds Number: {Re}")
+            if valid:
+                st.success(f"Reynolds Number: {Re:,.0f} ({REGIME_NAMES[regime]})")
+            else:
+                invalid = [name for bit, name in enumerate(REYNOLDS_INPUTS) if invalid_flags >> bit & 1]
+                st.error(f"{', '.join(invalid)} must be > 0")
             
         except ValueError as e:
             st.error(str(e))
@@ -49,9 +55,8 @@ with st.expander("Useful Info"):
         "Fluid": ["Water @ 15°C", "Water @ 50°C", "Air @ 15°C"],
         "Density [kg/m3]": [f"{x:,.2f}" for x in [999.99, 988.00, 1.225]]
     }
-    df_densities = pd.DataFrame(densities_data)
     st.subheader("Density of Select Fluids", divider=divider_color)
-    st.dataframe(df_densities, hide_index=True, width="content")
+    st.dataframe(densities_data, hide_index=True, width="content")
     
     st.space()
     
@@ -59,9 +64,8 @@ with st.expander("Useful Info"):
         "Fluid": ["Water @ 15°C", "Water @ 50°C", "Air @ 20°C"],
         "Dynamic Viscosity [Pa·s]": [f"{x:.3e}" for x in [8.9e-4, 5.44e-4, 1.81e-5]]
     }
-    df_viscosities = pd.DataFrame(viscosities_data)
     st.subheader("Dynamic Viscosity of Select Fluids", divider=divider_color)
-    st.dataframe(df_viscosities, hide_index=True, width="content")
+    st.dataframe(viscosities_data, hide_index=True, width="content")
   
 # methodology expander section    
 with st.container(border=True):
@@ -87,9 +91,12 @@ with st.container(border=True):
     )
     
     st.markdown(
-    """
+    f"""
     The chosen characteristic length $L_c$ depends on the scenario. In the case
     of pipe flow, $L_c$ is equal to the inner diameter of the pipe.
+
+    The flow regime is taken as laminar below Re = {LAMINAR_LIMIT:,.0f}, turbulent above
+    Re = {TURBULENT_LIMIT:,.0f}, and in transition between the two.
     
     Chosing an accurate viscosity is important for accuracy of the calculated Reynolds number.
     The "Useful Info" section contains viscosity data for various common fluids.
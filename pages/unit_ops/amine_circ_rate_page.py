@@ -1,5 +1,117 @@
 import streamlit as st
+import numpy as np
+
+from calculators.unit_ops.amine_circ_rate_calc import (
+    amine_circulation_rate, amine_ids, AMINE_NAMES, AMINE_WT_FRACTION, RICH_LOADING, LEAN_LOADING
+)
+from utilities.cache import cached_calculator
+from utilities.units import convert
+
+amine_circulation_rate = cached_calculator(amine_circulation_rate)
+
+divider_color = "red"
 
 st.title("Amine Circulation Rate")
 
-st.subheader("Coming soon!")
\ No newline at end of file
+with st.container(border=True):
+    st.write("Amine Design Basis:")
+
+    design_basis = st.data_editor(
+        {
+            "Amine": list(AMINE_NAMES),
+            "Amine Strength [wt%]": [100*x for x in AMINE_WT_FRACTION],
+            "Rich Loading [mol/mol]": list(RICH_LOADING),
+            "Lean Loading [mol/mol]": list(LEAN_LOADING),
+        },
+        column_config={
+            "Amine": st.column_config.TextColumn(disabled=True),
+        },
+        hide_index=True,
+        width="stretch",
+        )
+
+    co2_pickup = st.number_input("CO2 Pickup [% of inlet CO2]",
+                                 min_value=0.0,
+                                 max_value=100.0,
+                                 value=100.0,
+                                 help="Less than 100% for selective (MDEA) treating, where part of the CO2 slips through.")
+
+    st.write("Treating Units:")
+
+    units = st.data_editor(
+        {
+            "Unit": ["Plant 1", "Plant 2", "Plant 3"],
+            "Amine": ["MEA", "DEA", "MDEA"],
+            "Gas Flow Rate [10³ Sm3/d]": [1000.0, 2500.0, 4000.0],
+            "H2S [mol%]": [0.5, 1.0, 0.2],
+            "CO2 [mol%]": [2.0, 1.5, 3.0],
+        },
+        column_config={
+            "Amine": st.column_config.SelectboxColumn(options=AMINE_NAMES, required=True),
+        },
+        num_rows="dynamic",
+        width="stretch",
+        )
+
+if st.button("Calculate", type="primary", width="stretch"):
+    try:
+        ids = amine_ids(list(units["Amine"]))
+
+        result = amine_circulation_rate(
+            gas_flowrate_Sm3_d=np.asarray(units["Gas Flow Rate [10³ Sm3/d]"], dtype=float)*1e3,
+            h2s_mol_fraction=np.asarray(units["H2S [mol%]"], dtype=float)/100,
+            co2_mol_fraction=np.asarray(units["CO2 [mol%]"], dtype=float)/100,
+            amine=ids,
+            amine_wt_fraction=np.asarray(design_basis["Amine Strength [wt%]"], dtype=float)[ids]/100,
+            rich_loading=np.asarray(design_basis["Rich Loading [mol/mol]"], dtype=float)[ids],
+            lean_loading=np.asarray(design_basis["Lean Loading [mol/mol]"], dtype=float)[ids],
+            co2_pickup_fraction=co2_pickup/100
+            )
+
+        st.success(f"Total Circulation Rate: {np.sum(result.circulation_rate_m3_h):,.1f} m3/hr")
+
+        st.dataframe({
+            "Unit": list(units["Unit"]),
+            "Amine": list(units["Amine"]),
+            "Acid Gas Pickup [kmol/hr]": [f"{x:,.2f}" for x in result.acid_gas_pickup_kmol_h],
+            "Circulation Rate [m3/hr]": [f"{x:,.2f}" for x in result.circulation_rate_m3_h],
+            "Circulation Rate [USgpm]": [f"{x:,.1f}" for x in convert(result.circulation_rate_m3_h, "m3/h", "USgpm")],
+            },
+            hide_index=True,
+            width="content")
+
+    except ValueError as e:
+        st.error(str(e))
+
+with st.container(border=True):
+    st.subheader("Circulation Rate", divider=divider_color)
+
+    st.markdown("""
+                The lean amine circulation rate is the rate that picks up the acid gas in the inlet gas between the lean and rich
+                loadings of the amine:
+                """)
+
+    st.latex(r"""
+             \dot{n}_{AG} = \frac{Q_g}{V_m} \left( y_{H_2S} + f_{CO_2} \, y_{CO_2} \right)
+             \qquad L = \frac{\dot{n}_{AG}}{\left( \alpha_{rich} - \alpha_{lean} \right) C_{amine}}
+             \qquad C_{amine} = \frac{w \, \rho_{sol}}{MW_{amine}}
+             """)
+
+    st.markdown("""
+                where:
+
+                - $\\dot{n}_{AG}$ is the acid gas picked up by the amine [kmol/hr]
+                - $Q_g$ is the gas flow rate at standard conditions [Sm³/hr]
+                - $V_m$ is the molar volume of gas at standard conditions = 23.645 Sm³/kmol
+                - $y_{H_2S}$, $y_{CO_2}$ are the mole fractions of H₂S and CO₂ in the inlet gas
+                - $f_{CO_2}$ is the fraction of the inlet CO₂ picked up
+                - $L$ is the lean amine circulation rate [m³/hr]
+                - $\\alpha_{rich}$, $\\alpha_{lean}$ are the rich and lean loadings [mol acid gas/mol amine]
+                - $C_{amine}$ is the amine concentration of the solution [kmol/m³]
+                - $w$ is the amine strength [weight fraction]
+                - $\\rho_{sol}$ is the solution density, from ideal mixing of amine and water [kg/m³]
+                - $MW_{amine}$ is the molecular weight of the amine (MEA 61.08, DEA 105.14, MDEA 119.16) [kg/kmol]
+
+                The design basis holds typical strengths and loadings of each amine, and can be edited. Rich loadings
+                should be checked against the corrosion limits of the amine and the acid gas partial pressure at the contactor.
+                """)
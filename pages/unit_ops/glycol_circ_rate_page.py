@@ -1,5 +1,137 @@
 import streamlit as st
+import numpy as np
+
+from calculators.unit_ops.glycol_dehy_calc import teg_dehydration
+from utilities.cache import cached_calculator
+from utilities.units import Quantity
+
+teg_dehydration = cached_calculator(teg_dehydration)
+
+divider_color = "red"
 
 st.title("Glycol Dehy Circulation Rate")
 
-st.subheader("Coming soon!")
\ No newline at end of file
+with st.container(border=True):
+    col1, col2 = st.columns(2)
+
+    with col1:
+        outlet_water_content = st.number_input("Outlet Water Content Spec [mg/Sm3]",
+                                               min_value=0.0,
+                                               value=64.0,
+                                               help="64 mg/Sm3 = 4 lb/MMscf, 112 mg/Sm3 = 7 lb/MMscf")
+
+        dew_point_approach = st.number_input("Dew Point Approach to Equilibrium [°C]",
+                                             min_value=0.0,
+                                             value=8.0)
+
+    with col2:
+        glycol_water_ratio = st.number_input("Glycol-to-Water Ratio [L TEG/kg water]",
+                                             min_value=0.0,
+                                             value=25.0,
+                                             help="25 L/kg = 3 USgal/lb")
+
+        activity_coefficient = st.number_input("Water Activity Coefficient in TEG",
+                                               min_value=0.0,
+                                               value=0.6)
+
+    st.write("Contactors:")
+
+    contactors = st.data_editor(
+        {
+            "Unit": ["Dehy 1", "Dehy 2", "Dehy 3"],
+            "Gas Flow Rate [10³ Sm3/d]": [2000.0, 1500.0, 800.0],
+            "Contactor Pressure [kPa abs]": [6900.0, 5500.0, 4200.0],
+            "Contactor Temperature [°C]": [30.0, 35.0, 25.0],
+        },
+        num_rows="dynamic",
+        width="stretch",
+        )
+
+if st.button("Calculate", type="primary", width="stretch"):
+    try:
+        result = teg_dehydration(
+            gas_flowrate_Sm3_d=np.asarray(contactors["Gas Flow Rate [10³ Sm3/d]"], dtype=float)*1e3,
+            pressure_kPa=np.asarray(contactors["Contactor Pressure [kPa abs]"], dtype=float),
+            temperature_K=Quantity(np.asarray(contactors["Contactor Temperature [°C]"], dtype=float), "degC"),
+            outlet_water_content_mg_Sm3=outlet_water_content,
+            dew_point_approach_K=dew_point_approach,
+            glycol_water_ratio_L_kg=glycol_water_ratio,
+            activity_coefficient=activity_coefficient
+            )
+
+        st.success(f"Total Circulation Rate: {np.sum(result.circulation_rate_m3_h):,.3f} m3/hr")
+
+        st.dataframe({
+            "Unit": list(contactors["Unit"]),
+            "Inlet Water Content [mg/Sm3]": [f"{x:,.1f}" for x in result.inlet_water_content_mg_Sm3],
+            "Outlet Dew Point [°C]": [f"{x - 273.15:.1f}" for x in result.outlet_dew_point_K],
+            "Lean TEG [wt%]": [f"{100*x:.2f}" for x in result.lean_teg_wt_fraction],
+            "Water Removed [kg/hr]": [f"{x:,.2f}" for x in result.water_removed_kg_h],
+            "Circulation Rate [m3/hr]": [f"{x:,.3f}" for x in result.circulation_rate_m3_h],
+            },
+            hide_index=True,
+            width="content")
+
+    except ValueError as e:
+        st.error(str(e))
+
+with st.container(border=True):
+    st.subheader("Water Content of Natural Gas", divider=divider_color)
+
+    st.markdown("""
+                The inlet gas is taken as saturated with water at contactor conditions. The water content of sweet natural gas
+                is calculated with the Bukacek correlation:
+                """)
+
+    st.latex(r"""
+             W = 47484 \frac{P_v}{P} + B \qquad \log_{10} B = \frac{-3083.87}{459.6 + T} + 6.69449
+             """)
+
+    st.markdown("""
+                where:
+
+                - $W$ is the water content of the gas [lb/MMscf] (1 lb/MMscf = 16.02 mg/Sm³)
+                - $P_v$ is the vapor pressure of water at $T$ (Wagner and Pruss) [psia]
+                - $P$ is the pressure of the gas [psia]
+                - $T$ is the temperature of the gas [°F]
+
+                The correlation is tabulated against temperature once, and read by interpolation for every contactor. The
+                outlet dew point is the temperature at which the outlet water content spec is the saturated water content.
+                """)
+
+    st.subheader("Lean Glycol Purity", divider=divider_color)
+
+    st.markdown("""
+                The lean glycol must hold the gas at an equilibrium dew point the approach below the outlet dew point. Water
+                in the lean glycol is in equilibrium with that dew point when:
+                """)
+
+    st.latex(r"""
+             \gamma_w x_w P_v(T_c) = P_v(T_{d,eq}) \qquad T_{d,eq} = T_{d,out} - \Delta T_{approach}
+             """)
+
+    st.markdown("""
+                where:
+
+                - $x_w$ is the mole fraction of water in the lean glycol, converted to TEG weight percent
+                - $\\gamma_w$ is the activity coefficient of water in TEG
+                - $T_c$ is the contactor temperature [K]
+                - $T_{d,out}$ is the outlet dew point [K]
+                - $\\Delta T_{approach}$ is the approach of the contactor to equilibrium, typically 6 to 11 °C
+                """)
+
+    st.subheader("Circulation Rate", divider=divider_color)
+
+    st.latex(r"""
+             \dot{m}_w = Q_g \left( W_{in} - W_{out} \right) \qquad L_{TEG} = \dot{m}_w \cdot R_{TEG}
+             """)
+
+    st.markdown("""
+                where:
+
+                - $\\dot{m}_w$ is the water removed from the gas [kg/hr]
+                - $Q_g$ is the gas flow rate at standard conditions [Sm³/hr]
+                - $W_{in}$, $W_{out}$ are the inlet and outlet water contents [kg/Sm³]
+                - $L_{TEG}$ is the lean TEG circulation rate [L/hr]
+                - $R_{TEG}$ is the glycol-to-water ratio, typically 2 to 5 USgal TEG/lb water (17 to 42 L/kg)
+                """)
@@ -1,47 +1,92 @@
 import streamlit as st
 
-from calculators.utilities.barometric_pressure_calc import barometric_pressure
+from calculators.utilities.barometric_pressure_calc import (
+    barometric_pressure, standard_atmosphere,
+    LAYER_BASE_m, LAYER_LAPSE_RATE_K_m, LAYER_BASE_TEMPERATURE_K, LAYER_BASE_PRESSURE_kPa
+)
+from utilities.cache import cached_calculator
+
+barometric_pressure = cached_calculator(barometric_pressure)
+standard_atmosphere = cached_calculator(standard_atmosphere)
+
+divider_color = "red"
+
+if "atmosphere_model" not in st.session_state:
+    st.session_state.atmosphere_model = "Multi-Layer"
 
 st.title("Barometric Pressure")
 
 with st.container(border=True):
     altitude = st.number_input("Altitude [m]",
-                               min_value=0.0,
+                               min_value=-5000.0,
+                               max_value=84852.0,
                                value=1045.0)
-    
+
+    atmosphere_model = st.radio("Atmosphere Model",
+                                ("Multi-Layer", "Isothermal"),
+                                horizontal=True,
+                                key="atmosphere_model")
+
 if st.button("Calculate", type="primary", width="stretch"):
     try:
-        Patm = barometric_pressure(
-        altitude_m=altitude)
-        
-        Patm = f"{Patm:.2f} kPa"
+        if st.session_state.atmosphere_model == "Multi-Layer":
+            Patm, Tatm = standard_atmosphere(altitude_m=altitude)
+
+            st.success(f"Barometric Pressure: {Patm:.2f} kPa")
+
+            st.dataframe({
+                "Pressure [kPa]": [f"{Patm:.3f}"],
+                "Temperature [°C]": [f"{Tatm - 273.15:.2f}"],
+                },
+                hide_index=True,
+                width="content")
 
-        st.success(f"Barometric Pressure: {Patm}")
+        else:
+            Patm = barometric_pressure(altitude_m=altitude, isothermal=True)
+
+            st.success(f"Barometric Pressure: {Patm:.2f} kPa")
 
     except ValueError as e:
         st.error(str(e))
 
 with st.container(border=True):
-    st.subheader("Barometric Pressure Formula")
+    st.subheader("Barometric Pressure Formula", divider=divider_color)
 
     st.markdown("""
-                The U.S. Standard Atmosphere provides two formulas for calculation the barometric pressure as a function of altitude. 
-                The second formula, which assumes no variation of temperature with altitude, is used here:
+                The U.S. Standard Atmosphere (1976) divides the atmosphere up to 84,852 m into layers in which the temperature
+                varies linearly with altitude. Within each layer the barometric pressure is:
                 """)
-    
+
     st.latex(r"""
+             P = P_b \left[ \frac{T_{M,b}}{T_{M,b} + L_{M,b} (H - H_b)} \right]^{\frac{g_0^{'} M_0}{R^{*} L_{M,b}}}
+             \quad \text{for } L_{M,b} \neq 0
+             \qquad
              P = P_b \cdot \exp\left(\frac{-g_0^{'} M_0 (H - H_b)}{R^{*} T_{M,b}}\right)
+             \quad \text{for } L_{M,b} = 0
              """)
-    
+
     st.markdown("""
                 where:
-                
-                - $P$ is the barometric pressure at altitude [Pa]
-                - $P_b$ is the reference pressure = 101,325 kPa
-                - $g_0^{'}$ is the acceleration due to gravity = 9.80665 m/s
+
+                - $P$ is the barometric pressure at altitude [kPa]
+                - $P_b$ is the pressure at the base of the layer [kPa]
+                - $T_{M,b}$ is the temperature at the base of the layer [K]
+                - $L_{M,b}$ is the temperature lapse rate of the layer [K/m]
+                - $g_0^{'}$ is the acceleration due to gravity = 9.80665 m/s²
                 - $M_0$ is the mean molecular weight of air at sea level = 28.9644 kg/kmol
-                - $H$ is the altitude at which to calculate the barometric pressure [m]
-                - $H_b$ is the reference altitude = 0.0 m (sea level)
+                - $H$ is the geopotential altitude at which to calculate the barometric pressure [m]
+                - $H_b$ is the altitude of the base of the layer [m]
                 - $R^{*}$ is the ideal gas constant = 8314.32 J/kmol/K
-                - $T_{M,b}$ is the reference temperature = 288.15 K
-                """)
\ No newline at end of file
+
+                The isothermal model applies the second formula from sea level ($P_b$ = 101.325 kPa, $T_{M,b}$ = 288.15 K) at
+                all altitudes. For site elevations, the geopotential altitude is within 0.1% of the geometric altitude.
+                """)
+
+    st.dataframe({
+        "Layer Base [m]": [f"{x:,.0f}" for x in LAYER_BASE_m],
+        "Lapse Rate [K/km]": [f"{1000*x:.1f}" for x in LAYER_LAPSE_RATE_K_m],
+        "Base Temperature [K]": [f"{x:.2f}" for x in LAYER_BASE_TEMPERATURE_K],
+        "Base Pressure [kPa]": [f"{x:.6g}" for x in LAYER_BASE_PRESSURE_kPa],
+        },
+        hide_index=True,
+        width="content")
@@ -0,0 +1,83 @@
+# profile cold-start import times with:
+#   python startup_profile.py                 (streamlit, every calculator and utilities module)
+#   python startup_profile.py calculators.thermo.pr_flash_calc
+#
+# each module is imported in a fresh interpreter, so the time includes everything it pulls
+# in, and the heavy dependencies it loaded are listed. Exits with 1 if a module under
+# calculators/ loads streamlit, since calculators must be importable in workers without it.
+# For a per-import breakdown of one module use python -X importtime -c "import <module>",
+# and for the app itself PYTHONPROFILEIMPORTTIME=1 streamlit run app.py
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+ROOT = Path(__file__).resolve().parent
+
+HEAVY_MODULES = ("streamlit", "pandas", "pyarrow", "scipy", "cachetools")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "heavy": [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+class ImportProfile(NamedTuple):
+    module: str
+    seconds: float
+    heavy: tuple[str, ...]
+
+def profile_import(module: str) -> ImportProfile:
+    probe = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+    completed = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True)
+
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "unknown error"
+        raise ValueError(f"Importing {module} failed: {error}")
+
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    return ImportProfile(module, result["seconds"], tuple(result["heavy"]))
+
+def default_modules() -> list[str]:
+    modules = ["streamlit"]
+
+    for package in ("calculators", "utilities"):
+        for path in sorted((ROOT / package).rglob("*.py")):
+            if path.name != "__init__.py":
+                modules.append(".".join(path.relative_to(ROOT).with_suffix("").parts))
+
+    return modules
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Report the cold import time of modules in a fresh interpreter.")
+    parser.add_argument("modules", nargs="*", help="modules to profile (default: streamlit, calculators and utilities)")
+    args = parser.parse_args(argv)
+
+    modules = args.modules or default_modules()
+    width = max(len(module) for module in modules)
+    status = 0
+
+    for module in modules:
+        try:
+            profile = profile_import(module)
+        except ValueError as e:
+            print(f"{module:<{width}}  error: {e}", file=sys.stderr)
+            status = 1
+            continue
+
+        print(f"{profile.module:<{width}}  {profile.seconds * 1000:8.1f} ms  {', '.join(profile.heavy)}")
+
+        if module.startswith("calculators.") and "streamlit" in profile.heavy:
+            print(f"{module} imports streamlit", file=sys.stderr)
+            status = 1
+
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from calculators.conversion.air_gas_flow_converter_calc import air_gas_conversion_table, air_gas_flow_converter
+
+def test_plain_conversion():
+    # Q_gas = Q_air / sqrt(SG)
+    assert air_gas_flow_converter(100.0, 0.6) == pytest.approx(129.0994, rel=1e-6)
+    assert air_gas_flow_converter(np.array([100.0, 400.0]), 0.64) == pytest.approx([125.0, 500.0])
+
+def test_temperature_and_compressibility_correction():
+    # actual flow goes as sqrt(Z T / SG) relative to air
+    Q = air_gas_flow_converter(100.0, 0.6, gas_temperature_K=320.0, air_temperature_K=288.15,
+                               gas_compressibility=0.9)
+
+    assert Q == pytest.approx(100.0 * np.sqrt(0.9 * 320.0 / 288.15 / 0.6), rel=1e-12)
+
+    Q_std = air_gas_flow_converter(100.0, 0.6, gas_temperature_K=320.0, gas_compressibility=0.9,
+                                   flow_basis="standard")
+
+    assert Q_std == pytest.approx(100.0 / np.sqrt(0.9 * 320.0 / 288.15 * 0.6), rel=1e-12)
+
+def test_conversion_table_is_an_outer_product():
+    table = air_gas_conversion_table([100.0, 200.0, 300.0], [0.6, 0.7], gas_temperature_K=[300.0, 310.0])
+
+    assert table.gas_flowrate.shape == (3, 2)
+    for j, (sg, T) in enumerate([(0.6, 300.0), (0.7, 310.0)]):
+        assert table.gas_flowrate[:, j] == pytest.approx(
+            [air_gas_flow_converter(q, sg, gas_temperature_K=T) for q in (100.0, 200.0, 300.0)], rel=1e-12)
+
+@pytest.mark.parametrize("kwargs, message", [
+    (dict(flowrate=-1.0, specific_gravity=0.6), "flowrate must be >= 0"),
+    (dict(flowrate=1.0, specific_gravity=0.0), "specific_gravity must be > 0"),
+    (dict(flowrate=1.0, specific_gravity=0.6, gas_temperature_K=-5.0), "gas_temperature_K must be > 0"),
+    (dict(flowrate=1.0, specific_gravity=0.6, flow_basis="mass"), "flow_basis"),
+])
+def test_invalid_inputs(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        air_gas_flow_converter(**kwargs)
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from calculators.unit_ops.amine_circ_rate_calc import amine_circulation_rate, amine_ids
+
+def test_mea_design_basis():
+    # 1e6 Sm3/d with 1% H2S and 2% CO2 is 1e6 / 24 / 23.645 * 0.03 = 52.87 kmol/h of acid gas;
+    # 20 wt% MEA picking up 0.35 - 0.10 mol/mol at 1002.4 kg/m3 holds 3.282 kmol amine/m3
+    result = amine_circulation_rate(1e6, 0.01, 0.02, "MEA")
+
+    rho = 1 / (0.2 / 1016.0 + 0.8 / 999.1)
+    assert result.acid_gas_pickup_kmol_h == pytest.approx(52.866, rel=1e-4)
+    assert result.amine_flowrate_kmol_h == pytest.approx(52.866 / 0.25, rel=1e-4)
+    assert result.circulation_rate_m3_h == pytest.approx(52.866 / 0.25 / (0.2 * rho / 61.08), rel=1e-4)
+    assert result.circulation_rate_m3_h == pytest.approx(64.42, abs=0.01)
+
+def test_gpsa_mea_rule_of_thumb():
+    # GPSA Eqn. 21-1 for MEA at 0.33 mol/mol net pickup: gpm = 41 * MMscfd * mol% / wt%,
+    # 41 * 35.31 * 3 / 20 = 217 gpm = 49.3 m3/h
+    result = amine_circulation_rate(1e6, 0.01, 0.02, "MEA", rich_loading=0.43, lean_loading=0.10)
+
+    assert result.circulation_rate_m3_h == pytest.approx(41 * 35.31 * 3 / 20 * 0.2271247, rel=0.02)
+
+def test_fleet_in_one_call():
+    amines = np.array(["MDEA", "MEA", "DEA", "MEA"])
+    Q = np.array([2e6, 1e6, 5e5, 3e6])
+    y_CO2 = np.array([0.03, 0.02, 0.05, 0.0])
+
+    fleet = amine_circulation_rate(Q, 0.005, y_CO2, amines, co2_pickup_fraction=0.5)
+    by_id = amine_circulation_rate(Q, 0.005, y_CO2, amine_ids(amines), co2_pickup_fraction=0.5)
+
+    for i, amine in enumerate(amines):
+        unit = amine_circulation_rate(Q[i], 0.005, y_CO2[i], amine, co2_pickup_fraction=0.5)
+        assert fleet.circulation_rate_m3_h[i] == pytest.approx(unit.circulation_rate_m3_h)
+
+    assert by_id.circulation_rate_m3_h == pytest.approx(fleet.circulation_rate_m3_h)
+
+@pytest.mark.parametrize("kwargs, message", [
+    (dict(amine="TEA"), "Unknown amine 'TEA'"),
+    (dict(amine=np.array([0, 3])), "amine ids must be between 0 and 2"),
+    (dict(rich_loading=0.05), "rich_loading must be greater than lean_loading"),
+    (dict(h2s_mol_fraction=1.5), "h2s_mol_fraction must be between 0 and 1"),
+])
+def test_invalid_inputs(kwargs, message):
+    inputs = dict(gas_flowrate_Sm3_d=1e6, h2s_mol_fraction=0.01, co2_mol_fraction=0.02, amine="DEA")
+    inputs.update(kwargs)
+
+    with pytest.raises(ValueError, match=message):
+        amine_circulation_rate(**inputs)
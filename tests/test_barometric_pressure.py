@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from calculators.utilities.barometric_pressure_calc import (
+    AtmosphereTable,
+    atmosphere_table,
+    barometric_pressure,
+    standard_atmosphere,
+)
+
+# U.S. Standard Atmosphere 1976 at the layer bases: geopotential altitude [m], kPa, K
+LAYER_BASES = [
+    (11000.0, 22.632, 216.65),
+    (20000.0, 5.4749, 216.65),
+    (32000.0, 0.86802, 228.65),
+    (47000.0, 0.11091, 270.65),
+    (51000.0, 0.066939, 270.65),
+    (71000.0, 0.0039564, 214.65),
+]
+
+@pytest.mark.parametrize("altitude, pressure, temperature", LAYER_BASES)
+def test_layer_bases(altitude, pressure, temperature):
+    # evaluated just below and at each base, so both neighbouring layers reach the tabulated value
+    atmosphere = standard_atmosphere(np.array([altitude - 1e-6, altitude]))
+
+    assert atmosphere.pressure_kPa == pytest.approx(pressure, rel=1e-4)
+    assert atmosphere.temperature_K == pytest.approx(temperature)
+
+def test_troposphere_sites():
+    # 1000 m: T = 288.15 - 6.5 = 281.65 K and P = 101.325 (281.65 / 288.15)**5.2559 = 89.875 kPa
+    H = np.array([-500.0, 0.0, 1000.0, 5000.0])
+
+    assert barometric_pressure(1000.0) == pytest.approx(89.875, abs=1e-3)
+    assert barometric_pressure(H) == pytest.approx(standard_atmosphere(H).pressure_kPa, rel=1e-12)
+    assert barometric_pressure(H) == pytest.approx([107.478, 101.325, 89.875, 54.020], abs=1e-3)
+
+def test_isothermal_formula():
+    # P0 exp(-g0 M0 H / (R* T0)) at 1000 m
+    assert barometric_pressure(1000.0, isothermal=True) == pytest.approx(89.997, abs=1e-3)
+
+def test_table_matches_the_layers():
+    H = np.linspace(-5000.0, 84852.0, 20001)
+
+    assert atmosphere_table().pressure(H) == pytest.approx(standard_atmosphere(H).pressure_kPa, rel=1e-8)
+    assert barometric_pressure(H, use_table=True) == pytest.approx(standard_atmosphere(H).pressure_kPa, rel=1e-8)
+
+def test_partial_table():
+    table = AtmosphereTable(0.0, 3000.0, step_m=10.0)
+
+    assert table.temperature(1500.0) == pytest.approx(278.4)
+    assert table.pressure(np.array([0.0, 3000.0])) == pytest.approx([101.325, 70.109], abs=1e-3)
+    with pytest.raises(ValueError, match="altitude_m must be between 0 and 3,000"):
+        table.pressure(3500.0)
+
+def test_altitude_out_of_the_model():
+    with pytest.raises(ValueError, match="altitude_m must be between -5,000 and 84,852"):
+        barometric_pressure(np.array([0.0, 90000.0]))
@@ -0,0 +1,47 @@
+import pandas as pd
+import pytest
+
+from batch import main, run_batch
+
+def test_csv_in_chunks_with_units(tmp_path):
+    # water at 2 m/s in a 4 in pipe: Re = 998 * 2 * 0.1016 / 0.001 = 202,794
+    cases = pd.DataFrame({
+        "density_kg_m3": [998.0] * 5,
+        "velocity_m_s": [2.0, 2.0, 1.0, 0.5, 2.0],
+        "diameter_m": [4.0] * 5,
+        "dynamic_viscosity_pa_s": [1.0, 1.0, 1.0, 1.0, 2.0],
+    })
+    cases.to_csv(tmp_path / "cases.csv", index=False)
+
+    assert main([
+        "reynolds_number", str(tmp_path / "cases.csv"), str(tmp_path / "out.csv"),
+        "--chunk-size", "2", "--unit", "diameter_m=in", "--unit", "dynamic_viscosity_pa_s=cP",
+    ]) == 0
+
+    out = pd.read_csv(tmp_path / "out.csv")
+
+    assert list(out.columns) == list(cases.columns) + ["reynolds_number"]
+    assert out["reynolds_number"].to_numpy() == pytest.approx(
+        [202_793.6, 202_793.6, 101_396.8, 50_698.4, 101_396.8])
+
+def test_parquet_with_set_values(tmp_path):
+    pd.DataFrame({"velocity_m_s": [1.0, 3.0]}).to_parquet(tmp_path / "cases.parquet")
+
+    rows = run_batch(
+        "reynolds_number", str(tmp_path / "cases.parquet"), str(tmp_path / "out.parquet"),
+        constants={"density_kg_m3": 1000.0, "diameter_m": 0.1, "dynamic_viscosity_pa_s": 0.001},
+        result_column="Re", keep_columns=False,
+    )
+
+    out = pd.read_parquet(tmp_path / "out.parquet")
+
+    assert rows == 2
+    assert list(out.columns) == ["Re"]
+    assert out["Re"].to_numpy() == pytest.approx([100_000.0, 300_000.0])
+
+def test_invalid_rows_are_located(tmp_path):
+    pd.DataFrame({"velocity_m_s": [1.0, 2.0, -1.0]}).to_csv(tmp_path / "cases.csv", index=False)
+
+    with pytest.raises(ValueError, match="rows 2-2: velocity_m_s must be > 0"):
+        run_batch("reynolds_number", str(tmp_path / "cases.csv"), str(tmp_path / "out.csv"), chunk_size=2,
+                  constants={"density_kg_m3": 1000.0, "diameter_m": 0.1, "dynamic_viscosity_pa_s": 0.001})
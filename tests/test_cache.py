@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utilities.cache import cached_calculator
+from utilities.units import Quantity
+
+def _counting(func):
+    calls = []
+
+    def wrapped(*args, **kwargs):
+        calls.append(args)
+        return func(*args, **kwargs)
+
+    wrapped.calls = calls
+    return wrapped
+
+def test_arrays_are_keyed_on_content():
+    def double(x):
+        return np.asarray(x) * 2
+
+    counted = _counting(double)
+    cached = cached_calculator(counted)
+
+    x = np.array([1.0, 2.0])
+    assert cached(x) == pytest.approx([2.0, 4.0])
+    assert cached(x.copy()) == pytest.approx([2.0, 4.0])
+    assert len(counted.calls) == 1
+
+    x[0] = 5.0
+    assert cached(x) == pytest.approx([10.0, 4.0])
+    assert len(counted.calls) == 2
+
+def test_results_are_read_only():
+    cached = cached_calculator(_counting(lambda x: np.asarray(x) + 1))
+
+    result = cached(np.array([1.0, 2.0]))
+
+    with pytest.raises(ValueError):
+        result[0] = 0.0
+
+def test_pandas_inputs_are_keyed_on_content():
+    counted = _counting(lambda frame: float(frame.to_numpy().sum()))
+    cached = cached_calculator(counted)
+
+    frame = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    assert cached(frame) == 10.0
+    assert cached(frame.copy()) == 10.0
+    assert len(counted.calls) == 1
+
+    assert cached(pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 5.0]})) == 11.0
+    assert cached(frame.rename(columns={"b": "c"})) == 10.0
+    assert cached(frame["a"]) == 3.0
+    assert cached(frame["a"].rename("z")) == 3.0
+    assert len(counted.calls) == 5
+
+def test_quantities_are_keyed_on_value_and_unit():
+    counted = _counting(lambda q: q.to("kPa"))
+    cached = cached_calculator(counted)
+
+    assert cached(Quantity(1.0, "bar")) == pytest.approx(100.0)
+    assert cached(Quantity(1.0, "bar")) == pytest.approx(100.0)
+    assert cached(Quantity(1.0, "MPa")) == pytest.approx(1000.0)
+    assert cached(Quantity(np.array([1.0]), "bar")) == pytest.approx([100.0])
+    assert len(counted.calls) == 3
+
+def test_wrapping_twice_shares_one_cache():
+    def square(x):
+        return x * x
+
+    cached = cached_calculator(maxsize=8)(square)
+
+    assert cached_calculator(square) is cached
+    assert cached_calculator(cached) is cached
+    assert cached_calculator(square, maxsize=8) is cached
+    assert cached.cache_parameters()["maxsize"] == 8
+
+def test_conflicting_rewrap_is_rejected():
+    def cube(x):
+        return x**3
+
+    cached_calculator(cube, ttl_s=60.0)
+
+    with pytest.raises(ValueError, match="ttl_s=60.0"):
+        cached_calculator(cube, ttl_s=10.0)
+
+    with pytest.raises(ValueError, match="maxsize"):
+        cached_calculator(cube, maxsize=2)
+
+def test_lru_eviction_and_stats():
+    counted = _counting(lambda x: x + 1)
+    cached = cached_calculator(counted, maxsize=2)
+
+    for x in (1, 2, 1, 3, 2):
+        cached(x)
+
+    info = cached.cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 4, 2, 2)
+
+def test_object_arrays_are_keyed_on_their_objects():
+    counted = _counting(lambda names: ",".join(names))
+    cached = cached_calculator(counted)
+
+    assert cached(np.array(["MEA", "DEA"], dtype=object)) == "MEA,DEA"
+    assert cached(np.array(["MEA", "DEA"], dtype=object)) == "MEA,DEA"
+    assert cached(np.array(["MEA", "MDEA"], dtype=object)) == "MEA,MDEA"
+    assert len(counted.calls) == 2
+
+def test_unhashable_inputs_are_not_cached():
+    counted = _counting(lambda items: len(items))
+    cached = cached_calculator(counted)
+
+    items = np.array([{1, 2}, {3}], dtype=object)
+    assert cached(items) == 2
+    assert cached(items) == 2
+    assert len(counted.calls) == 2
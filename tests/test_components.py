@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from calculators.thermo.pr_flash_calc import (
+    PRComponentTerms, cached_component_terms, cached_mixture_terms, clear_mixing_caches, pr_component_terms,
+    pr_mixture_terms,
+)
+from utilities.components import component_ids, component_properties
+
+def test_component_properties():
+    props = component_properties(component_ids(["Nitrogen", "Methane"]))
+
+    assert props.names == ("Nitrogen", "Methane")
+    assert props.critical_temperature_K == pytest.approx([126.20, 190.56])
+    assert props.critical_pressure_kPa == pytest.approx([3398.0, 4599.0])
+    assert props.kij == pytest.approx(np.array([[0.0, 0.0311], [0.0311, 0.0]]))
+
+    with pytest.raises(ValueError, match="Unknown component"):
+        component_ids(["Methane", "Unobtainium"])
+
+def test_cached_component_terms_match_direct():
+    clear_mixing_caches()
+    props = component_properties(component_ids(["Methane", "Ethane", "Carbon Dioxide"]))
+
+    cached = cached_component_terms(props.critical_temperature_K, props.critical_pressure_kPa,
+                                    props.acentric_factor, props.kij)
+    direct = pr_component_terms(props.critical_temperature_K, props.critical_pressure_kPa,
+                                props.acentric_factor, props.kij)
+
+    assert cached is cached_component_terms(props.critical_temperature_K, props.critical_pressure_kPa,
+                                            props.acentric_factor, props.kij)
+    for field, value in zip(cached, direct):
+        assert np.array_equal(field, value)
+
+    # b_i = 0.07780 Tc / Pc
+    assert cached.b[0] == pytest.approx(0.07780 * 190.56 / 4599.0)
+
+def _terms(b):
+    return PRComponentTerms(c=np.array([1.0, 2.0]), d=np.array([0.1, 0.2]), b=np.array(b),
+                            one_minus_kij=np.ones((2, 2)))
+
+def test_mixture_terms_are_keyed_on_every_field():
+    clear_mixing_caches()
+    z = np.array([0.4, 0.6])
+
+    first = cached_mixture_terms(_terms([0.5, 0.7]), z)
+    second = cached_mixture_terms(_terms([0.6, 0.9]), z)
+
+    assert first == pr_mixture_terms(_terms([0.5, 0.7]), z)
+    assert second == pr_mixture_terms(_terms([0.6, 0.9]), z)
+    assert second.b == pytest.approx(0.6 * 0.4 + 0.9 * 0.6)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from calculators.pressure_changers.control_valve_calc import gas_valve_cv, liquid_valve_cv, relative_cv, valve_opening
+from calculators.pressure_changers.control_valve_catalog_calc import ValveCatalog, load_valve_catalog
+
+def test_liquid_cv_reference_value():
+    # 50 m3/h of water over 100 kPa: Cv = Q / N1 sqrt(SG / dP) = 50 / 0.0865 / 10
+    result = liquid_valve_cv(50 / 3600, 500.0, 400.0, 1000.0, 3.17)
+
+    assert result.cv == pytest.approx(57.803, rel=1e-4)
+    assert not result.choked
+
+def test_liquid_cv_is_limited_to_the_choked_pressure_drop():
+    # FL**2 (P1 - FF Pv), FF = 0.96 - 0.28 sqrt(Pv / Pc)
+    FF = 0.96 - 0.28 * np.sqrt(3.17 / 22064.0)
+    dP_choked = 0.9**2 * (1000.0 - FF * 3.17)
+
+    result = liquid_valve_cv(50 / 3600, 1000.0, 100.0, 1000.0, 3.17, liquid_recovery_factor=0.9)
+
+    assert result.choked
+    assert result.cv == pytest.approx(50 / 0.0865 * np.sqrt(1 / dP_choked), rel=1e-12)
+
+def test_gas_cv_reference_value():
+    # W / (N8 P1 Y) sqrt(T Z / (x M)) with x = 0.2, Fγ xT = 1.3/1.4 * 0.7, Z given
+    result = gas_valve_cv(1.0, 1000.0, 800.0, 300.0, 0.65, heat_capacity_ratio=1.3,
+                          pressure_drop_ratio_factor=0.7, compressibility_factor=0.95)
+
+    Y = 1 - 0.2 / (3 * 1.3 / 1.4 * 0.7)
+    expected = 3600 / (0.948 * 1000.0 * Y) * np.sqrt(300.0 * 0.95 / (0.2 * 0.65 * 28.9644))
+
+    assert result.cv == pytest.approx(expected, rel=1e-12)
+    assert not result.choked
+
+def test_characteristics():
+    assert relative_cv(0.5, "Linear") == pytest.approx(0.5)
+    assert relative_cv(0.5, "Equal Percentage", 50.0) == pytest.approx(50.0**-0.5)
+    assert valve_opening(relative_cv(0.7, "Equal Percentage"), 1.0, "Equal Percentage") == pytest.approx(0.7)
+
+def _catalog():
+    # the small valve recovers poorly (low FL and xT), the large one well
+    return ValveCatalog({
+        "model": ["small", "large"],
+        "size_in": [2.0, 3.0],
+        "trim": ["Full", "Full"],
+        "characteristic": ["Linear", "Linear"],
+        "rated_cv": [30.0, 120.0],
+        "fl": [0.5, 0.9],
+        "xt": [0.3, 0.75],
+    })
+
+def test_smallest_valve_by_required_cv():
+    catalog = load_valve_catalog()
+    row = catalog.smallest_valve([10.0, 20.0, 30.0], max_opening=0.8, characteristic="Linear")
+
+    valve = catalog.row(row)
+    assert valve["rated_cv"] * 0.8 >= 30.0
+    assert all(catalog.rated_cv[i] * 0.8 < 30.0 for i in range(len(catalog))
+               if catalog.characteristic[i] == "Linear" and i < row)
+
+    assert catalog.smallest_valve(1e9) == -1
+
+    rows = catalog.smallest_valve(np.array([[10.0, 20.0], [1e9, 1.0]]), max_opening=0.8, characteristic="Linear")
+    assert list(rows) == [catalog.smallest_valve(20.0, max_opening=0.8, characteristic="Linear"), -1]
+
+def test_liquid_selection_uses_each_valves_fl():
+    catalog = _catalog()
+    cases = dict(flowrate_m3_s=40 / 3600, inlet_pressure_kPa=1000.0, outlet_pressure_kPa=200.0,
+                 fluid_density_kg_m3=1000.0, vapor_pressure_kPa=3.17)
+
+    # at FL = 0.9 the small valve would do, but it chokes far earlier with its own FL of 0.5
+    assert liquid_valve_cv(**cases, liquid_recovery_factor=0.9).cv < 0.8 * 30.0
+    assert liquid_valve_cv(**cases, liquid_recovery_factor=0.5).cv > 0.8 * 30.0
+
+    assert catalog.smallest_liquid_valve(**cases, max_opening=0.8) == 1
+
+def test_gas_selection_uses_each_valves_xt():
+    catalog = _catalog()
+    cases = dict(mass_flowrate_kg_s=2.0, inlet_pressure_kPa=3000.0, outlet_pressure_kPa=1500.0,
+                 inlet_temperature_K=300.0, specific_gravity=0.65, compressibility_factor=0.9)
+
+    assert gas_valve_cv(**cases, pressure_drop_ratio_factor=0.75).cv < 0.8 * 30.0
+    assert gas_valve_cv(**cases, pressure_drop_ratio_factor=0.3).cv > 0.8 * 30.0
+
+    assert catalog.smallest_gas_valve(**cases, max_opening=0.8) == 1
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from calculators.pipe_flow.erosional_velocity_calc import erosional_velocity, erosional_velocity_screening
+from utilities.units import Quantity
+
+def test_api_rp_14e_limit():
+    # C = 100 in water at 62.4 lb/ft3: Ve = 100 / sqrt(62.4) = 12.66 ft/s
+    assert erosional_velocity(100.0, 62.4) == pytest.approx(12.659, abs=1e-3)
+    assert erosional_velocity(np.array([100.0, 150.0]), 4.0) == pytest.approx([50.0, 75.0])
+
+def test_screening_matches_us_units():
+    # 62.4 lb/ft3 = 999.5 kg/m3, so the limit is 12.66 ft/s = 3.859 m/s in every line
+    result = erosional_velocity_screening(0.1, 0.02, Quantity(62.4, "lb/ft3"))
+
+    assert result.erosional_velocity_m_s == pytest.approx(12.659 * 0.3048, abs=1e-4)
+    assert result.velocity_m_s == pytest.approx(0.02 / (np.pi / 4 * 0.01))
+    assert result.velocity_ratio == pytest.approx(2.5465 / 3.8585, rel=1e-4)
+
+def test_violations_worst_first():
+    D = np.array([0.1, 0.05, 0.1, 0.2, 0.05])
+    Q = np.array([0.02, 0.01, 0.04, 0.01, 0.0])
+    rho = np.array([1000.0, 1000.0, 50.0, 1000.0, 1000.0])
+
+    result = erosional_velocity_screening(D, Q, rho)
+
+    ratio = Q / (np.pi / 4 * D**2) / (100.0 * 0.3048 * np.sqrt(16.018463 / rho))
+    assert result.velocity_ratio == pytest.approx(ratio, rel=1e-6)
+    # 5.09 m/s in the 2 in line and 5.09 m/s of 50 kg/m3 gas; the gas limit is 17.3 m/s
+    assert list(result.violations) == [1]
+
+    screened = erosional_velocity_screening(D, Q, rho, limit_fraction=0.25)
+    assert list(screened.violations) == list(np.argsort(-ratio)[:3])
+
+def test_invalid_lines():
+    with pytest.raises(ValueError, match="inside_diameter must be > 0"):
+        erosional_velocity_screening(np.array([0.1, 0.0]), 0.01, 1000.0)
+    with pytest.raises(ValueError, match="flowrate must be >= 0"):
+        erosional_velocity_screening(0.1, -0.01, 1000.0)
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from calculators.pipe_flow.friction_factor_calc import friction_factor_colebrook, friction_factor_serghides
+
+# Moody chart values of the Colebrook-White equation
+RE = np.array([1e5, 1e5, 1e6, 4e3])
+ROUGHNESS = np.array([0.0, 1e-4, 1e-3, 0.05])
+MOODY = np.array([0.01799, 0.01851, 0.01994, 0.07699])
+
+def test_colebrook_known_values():
+    f = friction_factor_colebrook(RE, ROUGHNESS)
+
+    assert f == pytest.approx(MOODY, abs=1e-5)
+    # f satisfies the implicit equation itself
+    assert 1 / np.sqrt(f) == pytest.approx(-2 * np.log10(ROUGHNESS / 3.7 + 2.51 / (RE * np.sqrt(f))), rel=1e-12)
+
+def test_serghides_is_within_its_accuracy_of_colebrook():
+    Re, e = np.meshgrid(np.logspace(3.7, 8, 40), np.r_[0.0, np.logspace(-6, -1.3, 20)])
+
+    assert friction_factor_serghides(Re, e) == pytest.approx(friction_factor_colebrook(Re, e), rel=1e-4)
+
+def test_scalar_inputs_return_scalars():
+    f = friction_factor_colebrook(1e5, 1e-4)
+
+    assert np.ndim(f) == 0
+    assert f == pytest.approx(0.01851, abs=1e-5)
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError, match="reynolds_number must be > 0"):
+        friction_factor_colebrook(0.0, 1e-4)
+    with pytest.raises(ValueError, match="relative_roughness must be >= 0"):
+        friction_factor_serghides(1e5, -1e-4)
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from calculators.pipe_flow.friction_factor_calc import friction_factor_serghides
+from calculators.pipe_flow.gas_network_calc import solve_gas_network
+from utilities.thermo_utils import z_factor_GPSA
+
+SG = 0.65
+T = 288.15
+ROUGHNESS = 4.572e-5
+MU = 1.1e-5
+
+def _outlet_pressure(P1, Q_sm3_d, L, D):
+    # isothermal flow equation P1**2 - P2**2 = f L G**2 Z R T / (D M), with Z at the
+    # average pressure, solved for P2 by fixed-point iteration
+    rho_b = 101325 * SG * 28.9644 / (8314.46 * 288.15)
+    G = rho_b * Q_sm3_d / 86400 / (np.pi / 4 * D**2)
+    f = friction_factor_serghides(G * D / MU, ROUGHNESS / D)
+
+    P2 = P1
+    for _ in range(100):
+        P_avg = 2 / 3 * (P1 + P2 - P1 * P2 / (P1 + P2))
+        Z = z_factor_GPSA(P_avg, T, SG)
+        P2 = np.sqrt((P1 * 1e3)**2 - f * L * G**2 * Z * 8314.46 * T / (D * SG * 28.9644)) / 1e3
+
+    return P2
+
+def test_single_pipe_matches_flow_equation():
+    solution = solve_gas_network([7000.0, np.nan], [0.0, 1.5e6], [0], [1], 20_000.0, 0.3, ROUGHNESS, SG, T, MU,
+                                 tolerance=1e-10)
+
+    assert solution.pipe_flow_sm3_d == pytest.approx([1.5e6], rel=1e-8)
+    assert solution.supply_sm3_d[0] == pytest.approx(1.5e6, rel=1e-8)
+    assert solution.pressure_kPa[1] == pytest.approx(_outlet_pressure(7000.0, 1.5e6, 20_000.0, 0.3), rel=1e-7)
+
+def test_fixed_pressures_give_back_the_flow():
+    P2 = _outlet_pressure(7000.0, 1.5e6, 20_000.0, 0.3)
+
+    solution = solve_gas_network([7000.0, P2], [0.0, 0.0], [0], [1], 20_000.0, 0.3, ROUGHNESS, SG, T, MU,
+                                 tolerance=1e-10)
+
+    assert solution.pipe_flow_sm3_d[0] == pytest.approx(1.5e6, rel=1e-6)
+    assert solution.supply_sm3_d == pytest.approx([1.5e6, -1.5e6], rel=1e-6)
+
+def test_identical_parallel_pipes_split_the_flow():
+    solution = solve_gas_network([7000.0, np.nan], [0.0, 2e6], [0, 0, 0], [1, 1, 1], 10_000.0, 0.2, ROUGHNESS, SG, T,
+                                 MU, tolerance=1e-10)
+
+    assert solution.pipe_flow_sm3_d == pytest.approx(np.full(3, 2e6 / 3), rel=1e-8)
+
+def test_tree_balances_every_node():
+    rng = np.random.default_rng(0)
+    n = 200
+    pipe_to = np.arange(1, n + 1)
+    pipe_from = (rng.random(n) * pipe_to).astype(np.intp)
+    P = np.r_[7000.0, np.full(n, np.nan)]
+    demand = np.r_[0.0, rng.uniform(100.0, 1000.0, n)]
+
+    solution = solve_gas_network(P, demand, pipe_from, pipe_to, rng.uniform(500.0, 2000.0, n), 0.3, ROUGHNESS, SG, T,
+                                 tolerance=1e-8)
+
+    inflow = np.bincount(pipe_to, solution.pipe_flow_sm3_d, minlength=n + 1)
+    outflow = np.bincount(pipe_from, solution.pipe_flow_sm3_d, minlength=n + 1)
+
+    assert (inflow - outflow)[1:] == pytest.approx(demand[1:], rel=1e-6)
+    assert solution.supply_sm3_d[0] == pytest.approx(demand.sum(), rel=1e-6)
+    assert np.all(solution.pressure_kPa[1:] < 7000.0)
+
+def test_compressor_raises_pressure_by_its_ratio():
+    solution = solve_gas_network([5000.0, np.nan, np.nan, np.nan], [0.0, 0.0, 0.0, 1e6], [0, 2], [1, 3], 20_000.0,
+                                 0.3, ROUGHNESS, SG, T, MU, compressor_from=[1], compressor_to=[2],
+                                 compressor_ratio=[1.5], tolerance=1e-10)
+
+    assert solution.pressure_kPa[2] == pytest.approx(1.5 * solution.pressure_kPa[1], rel=1e-8)
+    assert solution.compressor_flow_sm3_d == pytest.approx([1e6], rel=1e-8)
+    assert solution.pipe_flow_sm3_d == pytest.approx([1e6, 1e6], rel=1e-8)
+
+def test_disconnected_network_is_rejected():
+    with pytest.raises(ValueError, match="connected"):
+        solve_gas_network([7000.0, np.nan, np.nan, np.nan], [0.0, 1e5, 1e5, 1e5], [0, 2], [1, 3], 1000.0, 0.3,
+                          ROUGHNESS, SG, T)
+
+@pytest.mark.parametrize("ratio", [-1.5, 0.0, 0.8])
+def test_compressor_ratio_must_boost(ratio):
+    with pytest.raises(ValueError, match="compressor_ratio must be >= 1"):
+        solve_gas_network([5000.0, np.nan, np.nan, np.nan], [0.0, 0.0, 0.0, 1e6], [0, 2], [1, 3], 20_000.0, 0.3,
+                          ROUGHNESS, SG, T, MU, compressor_from=[1], compressor_to=[2], compressor_ratio=[ratio])
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from calculators.conversion.gas_standardization_calc import ZFactorCache, standardize_gas_volumes
+from utilities.thermo_utils import z_factor_GPSA
+
+def _states(n, seed=4):
+    rng = np.random.default_rng(seed)
+    P = np.round(rng.uniform(200.0, 8000.0, n), -1)
+    T = np.round(rng.uniform(270.0, 320.0, n) * 2) / 2
+    SG = rng.choice([0.58, 0.6, 0.65, 0.7, 0.75], n)
+    return P, T, SG
+
+def test_cache_returns_the_z_factor():
+    cache = ZFactorCache()
+    P, T, SG = _states(5000)
+
+    first = cache(P, T, SG)
+    second = cache(P[::-1], T[::-1], SG[::-1])
+
+    assert np.array_equal(first, z_factor_GPSA(P, T, SG))
+    assert np.array_equal(second, first[::-1])
+
+    distinct = len(np.unique(np.stack([P, T, SG], axis=1), axis=0))
+    assert len(cache) == distinct
+    assert cache.misses == distinct
+    assert cache.hits == distinct
+
+def test_full_cache_drops_the_oldest_states():
+    cache = ZFactorCache(maxsize=100)
+    P, T, SG = _states(2000)
+
+    Z = cache(P, T, SG)
+
+    assert np.array_equal(Z, z_factor_GPSA(P, T, SG))
+    assert len(cache) == 100
+
+    cache.clear()
+    old = np.arange(50.0) + 1000.0
+    new = np.arange(100.0) + 2000.0
+    cache(old, 300.0, 0.65)
+    cache(new, 300.0, 0.65)
+
+    cache(new, 300.0, 0.65)
+    assert cache.hits == 100
+    cache(old, 300.0, 0.65)
+    assert cache.misses == 200
+
+def test_cache_keeps_the_input_shape():
+    Z = ZFactorCache()(np.full((3, 4), 5000.0), 300.0, 0.65)
+
+    assert Z.shape == (3, 4)
+    assert Z == pytest.approx(np.full((3, 4), z_factor_GPSA(5000.0, 300.0, 0.65)))
+
+@pytest.mark.parametrize("z_cache", [None, True, False])
+def test_standardized_volumes(z_cache):
+    P, T, SG = _states(3000)
+    V = np.random.default_rng(5).uniform(0.0, 100.0, 3000)
+    chunks = [{"pressure_kPa": P[i:i + 1000], "temperature_K": T[i:i + 1000], "volume_m3": V[i:i + 1000],
+               "specific_gravity": SG[i:i + 1000]} for i in range(0, 3000, 1000)]
+
+    results = list(standardize_gas_volumes(chunks, z_cache=z_cache))
+
+    Z = z_factor_GPSA(P, T, SG)
+    Z_base = z_factor_GPSA(101.325, 288.15, SG)
+    expected = V * P / 101.325 * 288.15 / T * Z_base / Z
+
+    assert np.concatenate([result.standard_volume_m3 for result in results]) == pytest.approx(expected, rel=1e-14)
+    assert results[-1].records == 3000
+    assert results[-1].total_standard_volume_m3 == pytest.approx(expected.sum(), rel=1e-12)
+
+def test_default_cache_evaluates_each_state_once():
+    states = []
+
+    def counted_z_factor(P, T, SG):
+        states.append(len(P))
+        return z_factor_GPSA(P, T, SG)
+
+    P = np.tile(np.arange(1000.0, 3000.0, 100.0), 5000)
+    chunks = [{"pressure_kPa": P[i:i + 10_000], "temperature_K": np.full(10_000, 300.0),
+               "volume_m3": np.ones(10_000), "specific_gravity": np.full(10_000, 0.65)}
+              for i in range(0, len(P), 10_000)]
+
+    list(standardize_gas_volumes(chunks, z_factor=counted_z_factor))
+
+    # 20 pressures at actual conditions and the one base state, each on its first chunk
+    assert states == [20, 1]
+
+def test_shared_cache_is_reused_across_calls():
+    cache = ZFactorCache()
+    P, T, SG = _states(1000)
+    chunk = {"pressure_kPa": P, "temperature_K": T, "volume_m3": np.ones(1000), "specific_gravity": SG}
+
+    list(standardize_gas_volumes([chunk], z_cache=cache))
+    misses = cache.misses
+    list(standardize_gas_volumes([chunk], z_cache=cache))
+
+    assert cache.misses == misses
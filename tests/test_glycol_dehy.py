@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from calculators.unit_ops.glycol_dehy_calc import WATER_CONTENT_TABLE, bukacek_water_content, teg_dehydration
+from utilities.units import Quantity, convert
+
+def test_bukacek_reference_values():
+    # GPSA Fig. 20-4: about 60 lb/MMscf at 1000 psia and 100 °F
+    W = bukacek_water_content(Quantity(1000.0, "psi"), Quantity(100.0, "degF"))
+
+    assert convert(W, "mg/m3", "lb/MMscf") == pytest.approx(60.4, rel=5e-3)
+
+    # near atmospheric pressure the gas holds its water vapor pressure, y = Pv / P:
+    # 1.705 kPa at 15 °C, 0.01683 * 18.015 kg/kmol / 23.645 Sm3/kmol = 12.8 g/Sm3
+    assert bukacek_water_content(101.325, 288.15) == pytest.approx(12_830.0, rel=0.01)
+
+def test_table_matches_the_correlation():
+    P = np.array([500.0, 3000.0, 8000.0])
+    T = np.array([260.0, 300.0, 340.0])
+
+    assert WATER_CONTENT_TABLE.water_content(P, T) == pytest.approx(bukacek_water_content(P, T), rel=1e-5)
+
+def test_dew_point_inverts_the_water_content():
+    P = np.array([500.0, 3000.0, 8000.0])
+    T = np.array([260.0, 300.0, 340.0])
+
+    W = bukacek_water_content(P, T)
+
+    assert WATER_CONTENT_TABLE.dew_point(W, P) == pytest.approx(T, abs=1e-3)
+
+def test_teg_dehydration():
+    result = teg_dehydration(1e6, 7000.0, 303.15, 60.0, dew_point_approach_K=8.0, glycol_water_ratio_L_kg=25.0)
+
+    W_in = bukacek_water_content(7000.0, 303.15)
+    assert result.inlet_water_content_mg_Sm3 == pytest.approx(W_in, rel=1e-5)
+
+    # 1e6 Sm3/d over 24 h, mg -> kg
+    water = 1e6 / 24 * (W_in - 60.0) * 1e-6
+    assert result.water_removed_kg_h == pytest.approx(water, rel=1e-5)
+    assert result.circulation_rate_m3_h == pytest.approx(water * 25.0 / 1000, rel=1e-5)
+
+    assert bukacek_water_content(7000.0, result.outlet_dew_point_K) == pytest.approx(60.0, rel=1e-4)
+    assert result.equilibrium_dew_point_K == pytest.approx(result.outlet_dew_point_K - 8.0)
+    assert 0.98 < result.lean_teg_wt_fraction < 1.0
+
+def test_teg_dehydration_rejects_wet_outlet_spec():
+    with pytest.raises(ValueError, match="outlet_water_content_mg_Sm3 must be below"):
+        teg_dehydration(1e6, 7000.0, 303.15, 1e4)
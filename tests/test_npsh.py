@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from calculators.pressure_changers.npsh_calc import npsh_advanced, npsh_curve, npsh_simple
+
+def test_npsh_simple_reference_value():
+    # GPSA Eqn. 12-6b: (101.325 - 3.17) kPa of water, 2 m of static head, 1 m/s, 0.5 m of losses
+    expected = 1000 * (101.325 - 3.17) / 999.0 / 9.80665 + 2.0 + 1.0 / 2 / 9.80665 - 0.5
+
+    assert npsh_simple(101.325, 3.17, 999.0, 2.0, 1.0, 0.5) == pytest.approx(expected, rel=1e-4)
+
+def test_npsh_advanced_adds_the_pipe_losses():
+    advanced = npsh_advanced(101.325, 3.17, 999.0, 2.0, 1.0, 0.1, 1e-3, 4.572e-5, 50.0)
+    no_pipe = npsh_simple(101.325, 3.17, 999.0, 2.0, 1.0, 0.0)
+
+    assert 0.0 < no_pipe - advanced < 1.0
+
+@pytest.mark.parametrize("name, value, message", [
+    ("pressure1_kPa", 0.0, "pressure1_kPa must be > 0"),
+    ("fluid_density_kg_m3", -1.0, "fluid_density_kg_m3 must be > 0"),
+    ("vapor_pressure_kPa", -1.0, "vapor_pressure_kPa must be >= 0"),
+    ("velocity_m_s", np.array([1.0, -0.1]), "velocity_m_s must be >= 0"),
+    ("head_loss_m", -0.5, "head_loss_m must be >= 0"),
+])
+def test_npsh_simple_validation(name, value, message):
+    inputs = dict(pressure1_kPa=101.325, vapor_pressure_kPa=3.17, fluid_density_kg_m3=999.0, relative_height_m=-2.0,
+                  velocity_m_s=1.0, head_loss_m=0.5)
+    inputs[name] = value
+
+    with pytest.raises(ValueError, match=message):
+        npsh_simple(**inputs)
+
+@pytest.mark.parametrize("name, message", [
+    ("velocity_m_s", "velocity_m_s must be > 0"),
+    ("pipe_diameter_m", "pipe_diameter_m must be > 0"),
+    ("viscosity_Pa_s", "viscosity_Pa_s must be > 0"),
+    ("pipe_roughness_m", "pipe_roughness_m must be >= 0"),
+    ("equivalent_length_m", "equivalent_length_m must be >= 0"),
+])
+def test_npsh_advanced_validation(name, message):
+    inputs = dict(pressure1_kPa=101.325, vapor_pressure_kPa=3.17, fluid_density_kg_m3=999.0, relative_height_m=2.0,
+                  velocity_m_s=1.0, pipe_diameter_m=0.1, viscosity_Pa_s=1e-3, pipe_roughness_m=4.572e-5,
+                  equivalent_length_m=50.0)
+    inputs[name] = -1.0
+
+    with pytest.raises(ValueError, match=message):
+        npsh_advanced(**inputs)
+
+def test_npsh_advanced_rejects_zero_flow():
+    # the friction factor is undefined without flow
+    with pytest.raises(ValueError, match="velocity_m_s must be > 0"):
+        npsh_advanced(200.0, 5.0, 1000.0, 2.0, 0.0, 0.1, 1e-3, 4.5e-5, 50.0)
+
+# water at 15 °C from an open tank 2 m above the pump, 0.1 m suction line
+SUCTION = dict(pressure1_kPa=101.325, vapor_pressure_kPa=3.17, fluid_density_kg_m3=999.0, relative_height_m=2.0,
+               pipe_diameter_m=0.1, viscosity_Pa_s=1e-3, pipe_roughness_m=4.572e-5)
+
+def test_npsh_curve_without_pipe_losses():
+    # no equivalent length: NPSHa = (P - Pv) / rho g + z + V**2 / 2g = 12.019 m + V**2 / 2g
+    Q = np.array([0.01, 0.02, 0.03])
+    V = Q / (np.pi / 4 * 0.01)
+
+    curve = npsh_curve(Q, **SUCTION, equivalent_length_m=0.0, npshr_m=np.array([4.0, 8.0, 16.0]))
+
+    NPSHa = 1000 * (101.325 - 3.17) / 999.0 / 9.80665 + 2.0 + V**2 / 2 / 9.80665
+    assert curve.npsh_available_m == pytest.approx(NPSHa)
+    assert curve.npsh_available_m[0] == pytest.approx(12.102, abs=1e-3)
+
+    # the margin falls through zero between 0.02 and 0.03 m3/s, interpolated linearly
+    margin = NPSHa - [4.0, 8.0, 16.0]
+    assert curve.margin_m == pytest.approx(margin)
+    assert curve.cavitation_flowrate_m3_s == pytest.approx(0.02 + 0.01 * margin[1] / (margin[1] - margin[2]))
+
+def test_npsh_curve_matches_npsh_advanced_point_by_point():
+    Q = np.linspace(0.005, 0.05, 10)
+    V = Q / (np.pi / 4 * 0.01)
+
+    curve = npsh_curve(Q, **SUCTION, equivalent_length_m=50.0)
+
+    expected = [npsh_advanced(**SUCTION, velocity_m_s=v, equivalent_length_m=50.0) for v in V]
+    assert curve.npsh_available_m == pytest.approx(expected)
+    assert curve.npsh_required_m is None and curve.cavitation_flowrate_m3_s is None
+
+def test_npsh_curve_sweeps_levels_against_pump_points():
+    Q = np.linspace(0.005, 0.05, 10)
+    levels = np.array([[2.0], [-3.0]])
+    inputs = dict(SUCTION, relative_height_m=levels)
+
+    curve = npsh_curve(Q, **inputs, equivalent_length_m=10.0,
+                       npshr_flowrate_m3_s=np.array([0.0, 0.05]), npshr_m=np.array([2.0, 7.0]))
+
+    assert curve.npsh_available_m.shape == (2, 10)
+    # NPSHr interpolated onto the flow rates, the same for both levels
+    assert curve.npsh_required_m[1] == pytest.approx(2.0 + 100.0 * Q)
+    # 5 m lower the pump cavitates past 0.04 m3/s; at the higher level it does not
+    assert np.isnan(curve.cavitation_flowrate_m3_s[0])
+    assert 0.04 < curve.cavitation_flowrate_m3_s[1] < 0.045
+
+def test_npsh_curve_requires_increasing_flow_rates():
+    with pytest.raises(ValueError, match="at least 2 increasing flow rates"):
+        npsh_curve(np.array([0.02, 0.01]), **SUCTION, equivalent_length_m=50.0)
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from calculators.parallel import ParallelExecutor, parallel_map
+from calculators.pressure_changers.npsh_calc import npsh_advanced
+from calculators.thermo.reynolds_calc import reynolds_regimes
+
+CONSTANTS = dict(vapor_pressure_kPa=3.17, fluid_density_kg_m3=999.0, relative_height_m=2.0, pipe_diameter_m=0.1,
+                 viscosity_Pa_s=1e-3, pipe_roughness_m=4.572e-5, equivalent_length_m=50.0)
+
+@pytest.fixture(scope="module")
+def inputs():
+    rng = np.random.default_rng(2)
+    return {"pressure1_kPa": rng.uniform(101.325, 500.0, 1000), "velocity_m_s": rng.uniform(0.5, 3.0, 1000)}
+
+@pytest.fixture(scope="module")
+def executor():
+    with ParallelExecutor(workers=2, chunk_size=128) as executor:
+        yield executor
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_matches_serial(inputs, workers):
+    expected = npsh_advanced(**inputs, **CONSTANTS)
+
+    result = parallel_map("npsh_advanced", inputs, CONSTANTS, workers=workers, chunk_size=128)
+
+    assert result == pytest.approx(expected, rel=1e-14)
+
+def test_executor_serves_several_batches(executor, inputs):
+    first = executor.map("npsh_advanced", inputs, CONSTANTS)
+    second = executor.map(npsh_advanced, {name: column[:300] for name, column in inputs.items()}, CONSTANTS)
+
+    assert first == pytest.approx(npsh_advanced(**inputs, **CONSTANTS), rel=1e-14)
+    assert second == pytest.approx(first[:300], rel=1e-14)
+
+def test_scalar_calls_match_vectorized(executor, inputs):
+    small = {name: column[:200] for name, column in inputs.items()}
+
+    result = executor.map("npsh_advanced", small, CONSTANTS, vectorized=False)
+
+    assert result == pytest.approx(npsh_advanced(**small, **CONSTANTS), rel=1e-12)
+
+def test_inputs_are_converted_from_their_units(executor, inputs):
+    in_bar = dict(inputs, pressure1_kPa=inputs["pressure1_kPa"] / 100)
+
+    result = executor.map("npsh_advanced", in_bar, CONSTANTS, units={"pressure1_kPa": "bar"})
+
+    assert result == pytest.approx(npsh_advanced(**inputs, **CONSTANTS), rel=1e-12)
+
+def test_named_tuple_results_are_joined(executor):
+    rng = np.random.default_rng(3)
+    velocity = rng.uniform(0.001, 2.0, 500)
+
+    result = executor.map("reynolds_regimes", {"velocity_m_s": velocity},
+                          dict(density_kg_m3=999.0, diameter_m=0.05, dynamic_viscosity_pa_s=1e-3))
+    expected = reynolds_regimes(999.0, velocity, 0.05, 1e-3)
+
+    assert type(result) is type(expected)
+    assert result.reynolds_number == pytest.approx(expected.reynolds_number)
+    assert np.array_equal(result.regime, expected.regime)
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_errors_name_the_failing_chunk(inputs, workers):
+    bad = dict(inputs, pressure1_kPa=inputs["pressure1_kPa"].copy())
+    bad["pressure1_kPa"][300] = -1.0
+
+    with pytest.raises(ValueError, match=r"^cases 256-383: pressure1_kPa must be > 0"):
+        parallel_map("npsh_advanced", bad, CONSTANTS, workers=workers, chunk_size=128)
+
+def test_invalid_inputs_are_rejected(executor):
+    with pytest.raises(ValueError, match="has 2 cases, expected 3"):
+        executor.map("npsh_advanced", {"pressure1_kPa": np.ones(3), "velocity_m_s": np.ones(2)}, CONSTANTS)
+
+    with pytest.raises(ValueError, match="unknown input"):
+        executor.map("npsh_advanced", {"pressure1_kPa": np.ones(3)}, CONSTANTS, units={"head_m": "ft"})
+
+    with pytest.raises(ValueError, match="workers"):
+        ParallelExecutor(workers=0)
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from calculators.pipe_flow.friction_factor_calc import friction_factor_colebrook
+from calculators.pipe_flow.piping_pressure_drop_calc import line_pressure_drop, segment_pressure_drop
+
+def test_laminar_segment_is_hagen_poiseuille():
+    # 1 L/s of 0.1 Pa.s oil in 100 m of 0.1 m pipe, Re = 115: dP = 32 mu L V / d**2 = 4.074 kPa
+    dP = segment_pressure_drop(0.001, 900.0, 0.1, 0.1, 4.5e-5, 100.0)
+
+    V = 0.001 / (np.pi / 4 * 0.01)
+    assert dP == pytest.approx(32 * 0.1 * 100.0 * V / 0.01 / 1000, rel=1e-12)
+    assert dP == pytest.approx(4.074, rel=1e-3)
+
+def test_turbulent_segment_with_fittings_and_elevation():
+    # 10 L/s of water in 100 m of 0.1 m commercial steel, Re = 127,000, plus K = 2 and a 5 m rise
+    dP = segment_pressure_drop(0.01, 998.0, 0.001, 0.1, 4.5e-5, 100.0, fittings_k=2.0, elevation_change_m=5.0)
+
+    V = 0.01 / (np.pi / 4 * 0.01)
+    f = friction_factor_colebrook(998.0 * V * 0.1 / 0.001, 4.5e-4)
+    expected = ((f * 100.0 / 0.1 + 2.0) * 998.0 * V**2 / 2 + 998.0 * 9.80665 * 5.0) / 1000
+
+    assert f == pytest.approx(0.0195, abs=1e-4)
+    assert dP == pytest.approx(expected, rel=1e-4)
+    assert dP == pytest.approx(66.33, rel=1e-3)
+
+def test_lines_sum_their_segments():
+    line_id = np.array(["B", "A", "B", "A", "C"])
+    L = np.array([100.0, 50.0, 200.0, 150.0, 10.0])
+    segments = segment_pressure_drop(0.001, 900.0, 0.1, 0.1, 4.5e-5, L)
+
+    lines, dP = line_pressure_drop(line_id, 0.001, 900.0, 0.1, 0.1, 4.5e-5, L)
+
+    assert list(lines) == ["A", "B", "C"]
+    assert dP == pytest.approx([segments[1] + segments[3], segments[0] + segments[2], segments[4]])
+    # Hagen-Poiseuille is linear in length: 200 m of line A is twice 100 m
+    assert dP[0] == pytest.approx(2 * 4.074, rel=1e-3)
+
+def test_flow_cases_along_a_leading_axis():
+    line_id = np.array([1, 1, 2])
+    Q = np.array([[0.001], [0.002]])
+
+    lines, dP = line_pressure_drop(line_id, Q, 900.0, 0.1, 0.1, 4.5e-5, np.array([50.0, 50.0, 100.0]))
+
+    assert dP.shape == (2, 2)
+    # laminar, so doubling the flow doubles the drop
+    assert dP[1] == pytest.approx(2 * dP[0])
+
+def test_invalid_segments():
+    with pytest.raises(ValueError, match="line_id must be a 1-D array"):
+        line_pressure_drop(np.array([[1, 2]]), 0.001, 900.0, 0.1, 0.1, 4.5e-5, np.array([1.0, 1.0]))
+    with pytest.raises(ValueError, match="length_m must be >= 0"):
+        segment_pressure_drop(0.001, 900.0, 0.1, 0.1, 4.5e-5, -1.0)
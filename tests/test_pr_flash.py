@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from calculators.thermo.pr_flash_calc import (
+    pr_flash, pr_flash_sweep, pr_fugacity_coefficients, pr_state_parameters, pr_z_factor, pr_z_roots,
+    cached_component_terms, rachford_rice,
+)
+from utilities.components import component_ids, component_properties
+
+FEED = np.array([0.70, 0.10, 0.07, 0.05, 0.03, 0.03, 0.01, 0.01])
+COMPONENTS = ["Methane", "Ethane", "Propane", "n-Butane", "n-Pentane", "n-Hexane", "Carbon Dioxide", "Nitrogen"]
+
+@pytest.fixture(scope="module")
+def props():
+    return component_properties(component_ids(COMPONENTS))
+
+def _reference_z(P, T, z, props):
+    # textbook Peng-Robinson with the classic van der Waals mixing rules, roots by np.roots
+    Tc, Pc, omega, kij = props.critical_temperature_K, props.critical_pressure_kPa, props.acentric_factor, props.kij
+    m = 0.37464 + 1.54226 * omega - 0.26992 * omega**2
+    alpha = (1 + m * (1 - np.sqrt(T / Tc)))**2
+    a = 0.45724 * (8.314462 * Tc)**2 / Pc * alpha
+    b = 0.07780 * 8.314462 * Tc / Pc
+
+    a_mix = z @ ((1 - kij) * np.sqrt(np.outer(a, a))) @ z
+    A = a_mix * P / (8.314462 * T)**2
+    B = (z @ b) * P / (8.314462 * T)
+
+    roots = np.roots([1.0, -(1 - B), A - 3 * B**2 - 2 * B, -(A * B - B**2 - B**3)])
+    real = np.sort(roots[np.abs(roots.imag) < 1e-9].real)
+    real = real[real > B]
+
+    return real[0], real[-1]
+
+@pytest.mark.parametrize("P, T", [(500.0, 300.0), (5000.0, 250.0), (8000.0, 350.0), (3000.0, 200.0)])
+def test_z_factor_matches_textbook_cubic(props, P, T):
+    Z_liquid, Z_vapor = _reference_z(P, T, FEED, props)
+
+    assert pr_z_factor(P, T, FEED, props.critical_temperature_K, props.critical_pressure_kPa,
+                       props.acentric_factor, kij=props.kij, phase="vapor") == pytest.approx(Z_vapor, rel=1e-10)
+    assert pr_z_factor(P, T, FEED, props.critical_temperature_K, props.critical_pressure_kPa,
+                       props.acentric_factor, kij=props.kij, phase="liquid") == pytest.approx(Z_liquid, rel=1e-10)
+
+def test_z_factor_tends_to_ideal_gas(props):
+    Z = pr_z_factor(1e-3, 300.0, FEED, props.critical_temperature_K, props.critical_pressure_kPa,
+                    props.acentric_factor, kij=props.kij)
+
+    assert Z == pytest.approx(1.0, abs=1e-6)
+
+def test_z_roots_match_np_roots():
+    rng = np.random.default_rng(1)
+    A = rng.uniform(0.01, 2.0, 50)
+    B = rng.uniform(0.01, 0.2, 50)
+
+    Z_small, Z_large = pr_z_roots(A, B)
+
+    for a, b, small, large in zip(A, B, Z_small, Z_large):
+        roots = np.roots([1.0, -(1 - b), a - 3 * b**2 - 2 * b, -(a * b - b**2 - b**3)])
+        real = np.sort(roots[np.abs(roots.imag) < 1e-7].real)
+        real = real[real > b]
+
+        assert small == pytest.approx(real[0], rel=1e-9)
+        assert large == pytest.approx(real[-1], rel=1e-9)
+
+def test_flash_satisfies_equilibrium(props):
+    P = np.array([1000.0, 3000.0, 5000.0, 2000.0])
+    T = np.array([250.0, 260.0, 280.0, 300.0])
+
+    result = pr_flash(P, T, FEED, props.critical_temperature_K, props.critical_pressure_kPa,
+                      props.acentric_factor, kij=props.kij)
+
+    two_phase = (result.vapor_fraction > 0.0) & (result.vapor_fraction < 1.0)
+    assert two_phase.any()
+    assert np.all(result.converged[two_phase])
+    assert not np.any(result.trivial[two_phase])
+
+    V = result.vapor_fraction[two_phase, None]
+    x = result.liquid_composition[two_phase]
+    y = result.vapor_composition[two_phase]
+
+    # material balance and Rachford-Rice
+    assert (1 - V) * x + V * y == pytest.approx(np.broadcast_to(FEED, x.shape), abs=1e-10)
+    assert rachford_rice(np.broadcast_to(FEED, x.shape), result.K[two_phase]) == pytest.approx(V[:, 0], abs=1e-9)
+
+    # equal fugacities: ln(x phi_L) = ln(y phi_V)
+    terms = cached_component_terms(props.critical_temperature_K, props.critical_pressure_kPa,
+                                   props.acentric_factor, props.kij)
+    A_i, B_i, A_ij = pr_state_parameters(P[two_phase], T[two_phase], terms)
+    lnphi_L, Z_L = pr_fugacity_coefficients(x, A_i, B_i, A_ij, phase="liquid")
+    lnphi_V, Z_V = pr_fugacity_coefficients(y, A_i, B_i, A_ij, phase="vapor")
+
+    assert np.log(x) + lnphi_L == pytest.approx(np.log(y) + lnphi_V, abs=1e-8)
+    assert np.all(Z_L < Z_V)
+
+def test_flash_reports_trivial_solutions(props):
+    # compressed well above the cricondenbar, successive substitution collapses to K = 1
+    result = pr_flash(np.array([20000.0, 40000.0]), 200.0, FEED, props.critical_temperature_K,
+                      props.critical_pressure_kPa, props.acentric_factor, kij=props.kij)
+
+    assert np.all(result.trivial)
+    assert not np.any(result.converged)
+    assert np.all(np.abs(np.log(result.K)) < 1e-3)
+
+def test_sweep_matches_flash(props):
+    P = np.linspace(500.0, 6000.0, 40)
+    T = np.full(40, 260.0)
+
+    sweep = pr_flash_sweep(P, T, FEED, props.critical_temperature_K, props.critical_pressure_kPa,
+                           props.acentric_factor, kij=props.kij, block_size=8)
+    flash = pr_flash(P, T, FEED, props.critical_temperature_K, props.critical_pressure_kPa,
+                     props.acentric_factor, kij=props.kij)
+
+    assert sweep.vapor_fraction == pytest.approx(flash.vapor_fraction, abs=1e-8)
+    assert np.array_equal(sweep.converged, flash.converged)
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from calculators.pressure_changers.pump_compressor_power_calc import (
+    compressor_adiabatic_power,
+    compressor_polytropic_power,
+    pump_power,
+)
+from utilities.thermo_utils import z_factor_GPSA
+
+def test_pump_power():
+    # 0.1 m3/s against 500 kPa is 50 kW of hydraulic power
+    power = pump_power(0.1, 500.0, 0.75, 0.95)
+
+    assert power.hydraulic_power_kW == pytest.approx(50.0)
+    assert power.brake_power_kW == pytest.approx(50.0 / 0.75)
+    assert power.driver_power_kW == pytest.approx(50.0 / 0.75 / 0.95)
+
+def test_pump_power_arrays():
+    power = pump_power(np.array([0.05, 0.1]), 200.0, np.array([0.5, 0.8]))
+
+    assert power.brake_power_kW == pytest.approx([20.0, 25.0])
+
+def test_adiabatic_compression_of_air():
+    # doubling the pressure of SG 1 gas at 300 K, k = 1.4: T2 = 300 * 2**(0.4/1.4) = 365.70 K and
+    # H = Z R T1 / MW * (2**(0.4/1.4) - 1) / (0.4/1.4) = Z * 66.01 kJ/kg
+    result = compressor_adiabatic_power(2.0, 101.325, 202.65, 300.0, 1.0, 1.4, 0.8)
+
+    T2_isentropic = 300.0 * 2.0**(0.4 / 1.4)
+    T2 = 300.0 + (T2_isentropic - 300.0) / 0.8
+    Z_avg = (z_factor_GPSA(101.325, 300.0, 1.0) + z_factor_GPSA(202.65, T2, 1.0)) / 2
+    H_ideal = 8.31446 * 300.0 / 28.9644 * (T2_isentropic / 300.0 - 1) / (0.4 / 1.4)
+
+    assert T2_isentropic == pytest.approx(365.70, abs=0.01)
+    assert H_ideal == pytest.approx(66.01, abs=0.01)
+    assert result.discharge_temperature_K == pytest.approx(T2)
+    assert result.head_kJ_kg == pytest.approx(Z_avg * H_ideal)
+    assert result.gas_power_kW == pytest.approx(2.0 * Z_avg * H_ideal / 0.8)
+
+def test_polytropic_at_full_efficiency_is_adiabatic():
+    adiabatic = compressor_adiabatic_power(1.0, 101.325, 202.65, 300.0, 1.0, 1.4, 1.0)
+    polytropic = compressor_polytropic_power(1.0, 101.325, 202.65, 300.0, 1.0, 1.4, 1.0)
+
+    assert polytropic == pytest.approx(adiabatic)
+
+def test_polytropic_steps_converge():
+    # a 6:1 natural gas machine, T2 = T1 * 6**((k - 1) / (k * eta_p)) whatever the steps
+    heads = [compressor_polytropic_power(1.0, 2000.0, 12000.0, 300.0, 0.65, 1.3, 0.8, steps=steps)
+             for steps in (1, 10, 100)]
+
+    assert heads[0].discharge_temperature_K == pytest.approx(300.0 * 6.0**(0.3 / 1.3 / 0.8))
+    assert heads[2].head_kJ_kg == pytest.approx(heads[1].head_kJ_kg, rel=1e-5)
+    assert heads[2].head_kJ_kg == pytest.approx(heads[0].head_kJ_kg, rel=1e-3)
+
+def test_polytropic_operating_points_in_one_call():
+    P2 = np.array([300.0, 600.0, 1200.0])
+
+    result = compressor_polytropic_power(1.0, 100.0, P2, 300.0, 0.65, 1.3, 0.75, steps=8)
+
+    expected = [compressor_polytropic_power(1.0, 100.0, p, 300.0, 0.65, 1.3, 0.75, steps=8).head_kJ_kg for p in P2]
+    assert result.head_kJ_kg == pytest.approx(expected)
+
+@pytest.mark.parametrize("kwargs, message", [
+    (dict(discharge_pressure_kPa=100.0), "discharge_pressure_kPa must be greater than suction_pressure_kPa"),
+    (dict(heat_capacity_ratio=1.0), "heat_capacity_ratio must be > 1"),
+    (dict(polytropic_efficiency=1.2), "polytropic_efficiency must be between 0 and 1"),
+    (dict(steps=0), "steps must be an integer >= 1"),
+])
+def test_compressor_validation(kwargs, message):
+    inputs = dict(mass_flowrate_kg_s=1.0, suction_pressure_kPa=100.0, discharge_pressure_kPa=300.0,
+                  suction_temperature_K=300.0, specific_gravity=0.65, heat_capacity_ratio=1.3,
+                  polytropic_efficiency=0.75)
+    inputs.update(kwargs)
+
+    with pytest.raises(ValueError, match=message):
+        compressor_polytropic_power(**inputs)
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from calculators.thermo.reynolds_calc import (
+    INVALID,
+    LAMINAR,
+    TRANSITION,
+    TURBULENT,
+    regime_counts,
+    regime_histogram,
+    reynolds_number,
+    reynolds_regimes,
+)
+
+def test_reynolds_number_known_value():
+    # water at 2 m/s in a 0.1 m pipe: Re = 998 * 2 * 0.1 / 0.001 = 199,600
+    assert reynolds_number(998.0, 2.0, 0.1, 0.001) == pytest.approx(199_600.0)
+
+def test_regimes_and_limits():
+    # Re = 1000 V with 1000 kg/m3, 0.1 m and 0.1 Pa.s
+    V = np.array([1.0, 2.3, 3.0, 4.0, 40.0])
+
+    result = reynolds_regimes(1000.0, V, 0.1, 0.1)
+
+    assert result.reynolds_number == pytest.approx(1000.0 * V)
+    assert result.regime.dtype == np.int8
+    assert list(result.regime) == [LAMINAR, TRANSITION, TRANSITION, TURBULENT, TURBULENT]
+
+    narrow = reynolds_regimes(1000.0, V, 0.1, 0.1, laminar_limit=2000.0, turbulent_limit=3000.0)
+    assert list(narrow.regime) == [LAMINAR, TRANSITION, TURBULENT, TURBULENT, TURBULENT]
+
+def test_invalid_elements_are_flagged():
+    rho = np.array([1000.0, -1.0, 1000.0, np.nan])
+    V = np.array([1.0, 1.0, 0.0, 0.0])
+
+    result = reynolds_regimes(rho, V, 0.1, 0.001)
+
+    assert list(result.valid) == [True, False, False, False]
+    assert list(result.regime) == [TURBULENT, INVALID, INVALID, INVALID]
+    assert np.isnan(result.reynolds_number[1:]).all()
+    # bits follow REYNOLDS_INPUTS: density 1, velocity 2
+    assert list(result.invalid_flags) == [0, 1, 2, 3]
+
+def test_scalar_inputs_return_scalars():
+    result = reynolds_regimes(1000.0, 1.0, 0.1, 0.001)
+
+    assert result.regime == TURBULENT and np.ndim(result.regime) == 0
+    assert result.valid
+
+def test_regime_counts():
+    regime = np.array([LAMINAR, TURBULENT, INVALID, TURBULENT, TRANSITION], dtype=np.int8)
+
+    assert list(regime_counts(regime)) == [1, 1, 1, 2]
+    assert regime_counts(regime, groups=np.array([0, 0, 1, 2, 2])).tolist() == [
+        [0, 1, 0, 1],
+        [1, 0, 0, 0],
+        [0, 0, 1, 1],
+    ]
+
+def test_histogram_over_chunks():
+    rng = np.random.default_rng(1)
+    V = rng.uniform(-0.5, 10.0, 10_000)
+    groups = rng.integers(0, 3, 10_000)
+
+    whole = reynolds_regimes(1000.0, V, 0.1, 0.1).regime
+    chunks = [reynolds_regimes(1000.0, V[i:i + 1000], 0.1, 0.1).regime for i in range(0, 10_000, 1000)]
+    group_chunks = [groups[i:i + 1000] for i in range(0, 10_000, 1000)]
+
+    assert regime_histogram(chunks).tolist() == regime_counts(whole).tolist()
+    assert regime_histogram(chunks, group_chunks, n_groups=3).tolist() == regime_counts(whole, groups, 3).tolist()
+    assert regime_histogram(chunks).sum() == 10_000
+
+def test_invalid_codes_and_groups():
+    with pytest.raises(ValueError, match="regime codes must be between -1 and 2"):
+        regime_counts(np.array([3]))
+    with pytest.raises(ValueError, match="groups must be between 0 and 1"):
+        regime_counts(np.array([0, 1]), groups=np.array([0, 2]), n_groups=2)
+    with pytest.raises(ValueError, match="n_groups must be at least 1"):
+        regime_histogram([np.array([0])], [np.array([0])])
@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from utilities.units import Quantity, convert, in_units
+
+def test_water_content_units():
+    # 1 lb/MMscf = 16.0185 mg/Sm3
+    assert convert(1.0, "lb/MMscf", "mg/m3") == pytest.approx(16.01846, rel=1e-6)
+
+    with pytest.raises(ValueError, match="Cannot convert"):
+        convert(1.0, "lb/MMscf", "kg/m3")
+
+def test_quantity_conversion():
+    assert in_units(Quantity(1.0, "bar"), "kPa") == pytest.approx(100.0)
+    assert in_units(Quantity(np.array([0.0, 100.0]), "degC"), "K") == pytest.approx([273.15, 373.15])
+    assert in_units(5.0, "kPa") == 5.0
+
+    with pytest.raises(ValueError, match="Cannot convert"):
+        in_units(Quantity(1.0, "bar"), "m")
+
+def test_quantity_is_not_an_array():
+    with pytest.raises(TypeError, match="convert it"):
+        np.asarray(Quantity(1.0, "bar"))
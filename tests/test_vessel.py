@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from calculators.geometry.vessel_volume_calc import Vessel, vessel_volume
+
+@pytest.mark.parametrize("vessel_type, head_type, h, expected", [
+    # 2 m x 5 m vessels: shell pi * 5 m3, a sphere of the same diameter 4/3 pi m3
+    ("Horizontal", "Flat", 1.0, np.pi * 5.0 / 2),
+    ("Horizontal", "Hemispherical", 2.0, np.pi * 5.0 + 4 / 3 * np.pi),
+    ("Horizontal", "Elliptical", 2.0, np.pi * 5.0 + 2 / 3 * np.pi),
+    ("Vertical", "Flat", 2.5, np.pi * 2.5),
+    ("Vertical", "Hemispherical", 7.0, np.pi * 5.0 + 4 / 3 * np.pi),
+    ("Vertical", "Elliptical", 0.5, np.pi / 3),
+    ("Spherical", "Flat", 1.0, 2 / 3 * np.pi),
+])
+def test_known_volumes(vessel_type, head_type, h, expected):
+    vessel = Vessel(vessel_type, head_type, 5.0, 2.0)
+
+    assert vessel.volume(h) == pytest.approx(expected)
+
+@pytest.mark.parametrize("vessel_type", ["Horizontal", "Vertical"])
+@pytest.mark.parametrize("head_type", ["Flat", "Elliptical", "Hemispherical"])
+def test_matches_vessel_volume(vessel_type, head_type):
+    vessel = Vessel(vessel_type, head_type, 4.0, 1.5)
+    h = np.linspace(1e-3, vessel.max_liquid_height_m, 50)
+
+    assert vessel.volume(h) == pytest.approx(vessel_volume(vessel_type, head_type, 4.0, 1.5, h))
+
+def test_invalid_geometry_and_levels():
+    with pytest.raises(ValueError, match="Unknown head type 'Conical'"):
+        Vessel("Horizontal", "Conical", 5.0, 2.0)
+    with pytest.raises(ValueError, match="diameter_m must be > 0"):
+        Vessel("Vertical", "Flat", 5.0, 0.0)
+    with pytest.raises(ValueError, match="Liquid height must be between 0 and 2.000 m"):
+        Vessel("Spherical", "Flat", 1.0, 2.0).volume(2.1)
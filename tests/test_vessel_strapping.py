@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from calculators.geometry.vessel_strapping_calc import StrappingTable
+
+def test_flat_horizontal_cylinder():
+    # 2 m x 5 m flat-ended cylinder: half full holds pi * 1**2 * 5 / 2 = 7.854 m3
+    table = StrappingTable("Horizontal", "Flat", 5.0, 2.0)
+
+    assert table.max_volume_m3 == pytest.approx(np.pi * 5.0)
+    assert table.volume(1.0) == pytest.approx(np.pi * 5.0 / 2, rel=1e-6)
+    assert table.level(np.pi * 5.0 / 2) == pytest.approx(1.0, rel=1e-6)
+
+def test_vertical_elliptical_vessel_full():
+    # 2:1 elliptical heads hold pi * Di**3 / 24 each, on top of the shell pi * Di**2 / 4 * L
+    table = StrappingTable("Vertical", "Elliptical", 5.0, 2.0)
+
+    assert table.max_level_m == pytest.approx(6.0)
+    assert table.max_volume_m3 == pytest.approx(5.0 * np.pi + 2 * np.pi * 8.0 / 24)
+
+def test_level_inverts_volume():
+    table = StrappingTable("Horizontal", "Hemispherical", 6.0, 2.5)
+    h = np.linspace(0.0, 2.5, 101)
+
+    assert table.level(table.volume(h)) == pytest.approx(h, abs=1e-6)
+    assert table.volume(h) == pytest.approx(table.vessel.volume(h), rel=1e-5, abs=1e-9)
+
+def test_readings_out_of_range():
+    table = StrappingTable("Spherical", "Flat", 1.0, 2.0)
+
+    with pytest.raises(ValueError, match="liquid_height_m must be between 0 and 2.000"):
+        table.volume([1.0, 2.5])
+    with pytest.raises(ValueError, match="volume_m3 must be between 0"):
+        table.level(-1.0)
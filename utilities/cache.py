@@ -0,0 +1,181 @@
+import functools
+import threading
+from typing import NamedTuple
+
+import numpy as np
+from cachetools import TTLCache
+
+from utilities.units import Quantity
+
+DEFAULT_MAXSIZE = 1024
+DEFAULT_TTL_S = 3600.0
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+# one wrapper per calculator function, so page scripts (which Streamlit re-executes on
+# every rerun) and batch callers that wrap the same function share the same cache
+_wrappers = {}
+_wrappers_lock = threading.Lock()
+
+_MISSING = object()
+
+def cached_calculator(func=None, *, maxsize: int | None = None, ttl_s: float | None = None):
+    # memoize a calculator on its inputs, with LRU eviction beyond maxsize entries and
+    # entries expiring ttl_s seconds after they were computed (DEFAULT_MAXSIZE and
+    # DEFAULT_TTL_S when not given). Array and pandas inputs are keyed on their contents;
+    # results are returned read-only since they are shared between callers.
+    # Usable as @cached_calculator, @cached_calculator(maxsize=...) or cached_calculator(func);
+    # a function is only ever wrapped once, later calls return the existing wrapper and raise
+    # if they ask for a different maxsize or ttl_s than it was built with.
+    if func is None:
+        return functools.partial(cached_calculator, maxsize=maxsize, ttl_s=ttl_s)
+
+    if (maxsize is not None and maxsize < 1) or (ttl_s is not None and ttl_s <= 0.0):
+        raise ValueError("maxsize must be at least 1 and ttl_s must be > 0")
+
+    with _wrappers_lock:
+        if getattr(func, "__wrapped__", None) in _wrappers:
+            func = func.__wrapped__
+
+        wrapper = _wrappers.get(func)
+        if wrapper is None:
+            wrapper = _make_wrapper(func, DEFAULT_MAXSIZE if maxsize is None else maxsize,
+                                    DEFAULT_TTL_S if ttl_s is None else ttl_s)
+            _wrappers[func] = wrapper
+
+    parameters = wrapper.cache_parameters()
+    requested = {"maxsize": maxsize, "ttl_s": ttl_s}
+    for name, value in requested.items():
+        if value is not None and value != parameters[name]:
+            raise ValueError(f"{func.__qualname__} is already cached with {name}={parameters[name]}, "
+                             f"not {value}; wrap it once")
+
+    return wrapper
+
+def cache_stats() -> dict[str, CacheInfo]:
+    with _wrappers_lock:
+        wrappers = list(_wrappers.values())
+
+    return {f"{wrapper.__module__}.{wrapper.__qualname__}": wrapper.cache_info() for wrapper in wrappers}
+
+def clear_caches() -> None:
+    with _wrappers_lock:
+        wrappers = list(_wrappers.values())
+
+    for wrapper in wrappers:
+        wrapper.cache_clear()
+
+def _make_wrapper(func, maxsize: int, ttl_s: float):
+    cache = TTLCache(maxsize=maxsize, ttl=ttl_s)
+    lock = threading.Lock()
+    stats = {"hits": 0, "misses": 0}
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            key = _make_key(args, kwargs)
+            hash(key)
+        except TypeError:
+            # inputs that cannot be keyed are computed every time
+            return func(*args, **kwargs)
+
+        with lock:
+            result = cache.get(key, _MISSING)
+            if result is not _MISSING:
+                stats["hits"] += 1
+                return result
+            stats["misses"] += 1
+
+        # computed outside the lock, so one slow case does not block the others;
+        # exceptions propagate and are not cached
+        result = _read_only(func(*args, **kwargs))
+
+        with lock:
+            cache[key] = result
+
+        return result
+
+    def cache_info() -> CacheInfo:
+        with lock:
+            cache.expire()
+            return CacheInfo(stats["hits"], stats["misses"], maxsize, len(cache))
+
+    def cache_clear() -> None:
+        with lock:
+            cache.clear()
+            stats["hits"] = 0
+            stats["misses"] = 0
+
+    def cache_parameters() -> dict:
+        return {"maxsize": maxsize, "ttl_s": ttl_s}
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    wrapper.cache_parameters = cache_parameters
+
+    return wrapper
+
+def _make_key(args: tuple, kwargs: dict) -> tuple:
+    return (tuple(_freeze(arg) for arg in args),
+            tuple(sorted((name, _freeze(value)) for name, value in kwargs.items())))
+
+def _freeze(value):
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            # the bytes of an object array are pointers, key on the objects themselves
+            return ("ndarray", value.dtype.str, value.shape, _freeze(value.tolist()))
+
+        return ("ndarray", value.dtype.str, value.shape, value.tobytes())
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    if isinstance(value, Quantity):
+        return ("Quantity", _freeze(value.value), value.unit)
+
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_freeze(item) for item in value))
+
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((name, _freeze(item)) for name, item in value.items())))
+
+    # pandas is only imported once a pandas object is passed
+    if type(value).__module__.startswith("pandas"):
+        return _freeze_pandas(value)
+
+    return value
+
+def _freeze_pandas(value):
+    import pandas as pd
+
+    if isinstance(value, pd.DataFrame):
+        # the row hashes cover the index and the values, the columns and dtypes are added
+        return ("DataFrame", tuple(_freeze(column) for column in value.columns),
+                tuple(str(dtype) for dtype in value.dtypes),
+                pd.util.hash_pandas_object(value).values.tobytes())
+
+    if isinstance(value, pd.Series):
+        return ("Series", _freeze(value.name), str(value.dtype),
+                pd.util.hash_pandas_object(value).values.tobytes())
+
+    return value
+
+def _read_only(result):
+    if isinstance(result, np.ndarray):
+        # views may share memory with the caller's inputs, keep a private copy instead
+        if not result.flags.owndata:
+            result = result.copy()
+        result.flags.writeable = False
+
+        return result
+
+    if isinstance(result, tuple):
+        items = [_read_only(item) for item in result]
+
+        return result._make(items) if hasattr(result, "_make") else tuple(items)
+
+    return result
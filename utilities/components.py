@@ -0,0 +1,107 @@
+from typing import NamedTuple
+
+import numpy as np
+
+# pure component properties: molecular weight [kg/kmol], critical temperature [K],
+# critical pressure [kPa], acentric factor
+_COMPONENT_DATA = {
+    "Methane":          (16.043, 190.56, 4599.0, 0.0115),
+    "Ethane":           (30.070, 305.32, 4872.0, 0.0995),
+    "Propane":          (44.097, 369.83, 4248.0, 0.1523),
+    "i-Butane":         (58.123, 407.80, 3640.0, 0.1835),
+    "n-Butane":         (58.123, 425.12, 3796.0, 0.2002),
+    "i-Pentane":        (72.150, 460.40, 3380.0, 0.2275),
+    "n-Pentane":        (72.150, 469.70, 3370.0, 0.2515),
+    "n-Hexane":         (86.177, 507.60, 3025.0, 0.3013),
+    "n-Heptane":        (100.204, 540.20, 2740.0, 0.3495),
+    "n-Octane":         (114.231, 568.70, 2490.0, 0.3996),
+    "n-Nonane":         (128.258, 594.60, 2290.0, 0.4435),
+    "n-Decane":         (142.285, 617.70, 2110.0, 0.4923),
+    "Nitrogen":         (28.014, 126.20, 3398.0, 0.0377),
+    "Carbon Dioxide":   (44.010, 304.13, 7377.0, 0.2239),
+    "Hydrogen Sulfide": (34.081, 373.40, 8963.0, 0.0900),
+    "Oxygen":           (31.999, 154.58, 5043.0, 0.0222),
+    "Hydrogen":         (2.016, 33.19, 1313.0, -0.2160),
+    "Water":            (18.015, 647.10, 22064.0, 0.3449),
+}
+
+# Peng-Robinson binary interaction parameters, zero for pairs not listed
+# (hydrocarbon-hydrocarbon pairs are taken as ideal)
+_KIJ_DATA = {
+    ("Nitrogen", "Methane"): 0.0311,
+    ("Nitrogen", "Ethane"): 0.0515,
+    ("Nitrogen", "Propane"): 0.0852,
+    ("Nitrogen", "i-Butane"): 0.1033,
+    ("Nitrogen", "n-Butane"): 0.0800,
+    ("Nitrogen", "i-Pentane"): 0.0922,
+    ("Nitrogen", "n-Pentane"): 0.1000,
+    ("Nitrogen", "n-Hexane"): 0.1496,
+    ("Nitrogen", "Carbon Dioxide"): -0.0170,
+    ("Nitrogen", "Hydrogen Sulfide"): 0.1767,
+    ("Carbon Dioxide", "Methane"): 0.0919,
+    ("Carbon Dioxide", "Ethane"): 0.1322,
+    ("Carbon Dioxide", "Propane"): 0.1241,
+    ("Carbon Dioxide", "i-Butane"): 0.1200,
+    ("Carbon Dioxide", "n-Butane"): 0.1333,
+    ("Carbon Dioxide", "i-Pentane"): 0.1219,
+    ("Carbon Dioxide", "n-Pentane"): 0.1222,
+    ("Carbon Dioxide", "n-Hexane"): 0.1100,
+    ("Carbon Dioxide", "Hydrogen Sulfide"): 0.0974,
+    ("Hydrogen Sulfide", "Methane"): 0.0850,
+    ("Hydrogen Sulfide", "Ethane"): 0.0840,
+    ("Hydrogen Sulfide", "Propane"): 0.0750,
+    ("Hydrogen Sulfide", "i-Butane"): 0.0480,
+    ("Hydrogen Sulfide", "n-Butane"): 0.0600,
+    ("Hydrogen Sulfide", "n-Pentane"): 0.0650,
+}
+
+COMPONENT_NAMES = tuple(_COMPONENT_DATA)
+
+_COMPONENT_IDS = {name: i for i, name in enumerate(COMPONENT_NAMES)}
+
+# one contiguous, read-only array per property, indexed by component id
+MOLECULAR_WEIGHT, CRITICAL_TEMPERATURE_K, CRITICAL_PRESSURE_kPa, ACENTRIC_FACTOR = (
+    np.ascontiguousarray(column) for column in np.array(list(_COMPONENT_DATA.values())).T
+)
+
+KIJ = np.zeros((len(COMPONENT_NAMES), len(COMPONENT_NAMES)))
+for (_name_i, _name_j), _k in _KIJ_DATA.items():
+    KIJ[_COMPONENT_IDS[_name_i], _COMPONENT_IDS[_name_j]] = _k
+    KIJ[_COMPONENT_IDS[_name_j], _COMPONENT_IDS[_name_i]] = _k
+
+for _array in (MOLECULAR_WEIGHT, CRITICAL_TEMPERATURE_K, CRITICAL_PRESSURE_kPa, ACENTRIC_FACTOR, KIJ):
+    _array.flags.writeable = False
+
+class ComponentProperties(NamedTuple):
+    names: tuple[str, ...]
+    molecular_weight: np.ndarray
+    critical_temperature_K: np.ndarray
+    critical_pressure_kPa: np.ndarray
+    acentric_factor: np.ndarray
+    kij: np.ndarray
+
+def component_ids(names: str | list[str]) -> np.ndarray:
+    if isinstance(names, str):
+        names = [names]
+
+    unknown = [name for name in names if name not in _COMPONENT_IDS]
+    if unknown:
+        raise ValueError(f"Unknown component(s): {', '.join(map(str, unknown))}")
+
+    return np.array([_COMPONENT_IDS[name] for name in names], dtype=np.intp)
+
+def component_properties(ids: np.ndarray) -> ComponentProperties:
+    # properties of a set of components, in the order of ids
+    ids = np.asarray(ids, dtype=np.intp)
+
+    if ids.ndim != 1 or np.any((ids < 0) | (ids >= len(COMPONENT_NAMES))):
+        raise ValueError(f"ids must be a 1-D array of component ids between 0 and {len(COMPONENT_NAMES) - 1}")
+
+    return ComponentProperties(
+        names=tuple(COMPONENT_NAMES[i] for i in ids),
+        molecular_weight=MOLECULAR_WEIGHT[ids],
+        critical_temperature_K=CRITICAL_TEMPERATURE_K[ids],
+        critical_pressure_kPa=CRITICAL_PRESSURE_kPa[ids],
+        acentric_factor=ACENTRIC_FACTOR[ids],
+        kij=KIJ[np.ix_(ids, ids)],
+    )
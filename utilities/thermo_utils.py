@@ -1,13 +1,62 @@
+import functools
+import math
+
+import numpy as np
+
+# constants of GPSA Eqn. 17-12 in log form, so the SG and temperature terms can be
+# evaluated as one exp() instead of two power functions
+_LN_GPSA_A = np.log(0.0527 * 10**5)
+_GPSA_SG_EXPONENT = 1.785 * np.log(10)
+_GPSA_T_EXPONENT = 3.825
+
 def z_factor_GPSA(
-    pressure_kPa: float,
-    temperature_K: float,
-    specific_gravity: float
-) -> float:
-    P = pressure_kPa
-    T = temperature_K
-    y = specific_gravity
-    
-    Fpv = ( 1 + (P * 0.0527 * 10**5 * 10**(1.785 * y)) / (T**3.825))**0.5
-    Z  = 1 / Fpv**2
-    
-    return Z
\ No newline at end of file
+    pressure_kPa: float | np.ndarray,
+    temperature_K: float | np.ndarray,
+    specific_gravity: float | np.ndarray
+) -> float | np.ndarray:
+    P = np.asarray(pressure_kPa, dtype=float)
+    k = gpsa_z_coefficient(temperature_K, specific_gravity)
+
+    # Fpv**2 = 1 + P * k, per GPSA Eqn. 17-12, and Z = 1 / Fpv**2 per Eqn. 17-13
+    Z = 1 / (1 + P * k)
+
+    return Z
+
+def gpsa_z_coefficient(
+    temperature_K: float | np.ndarray,
+    specific_gravity: float | np.ndarray
+) -> float | np.ndarray:
+    # k = 0.0527e5 * 10**(1.785*SG) / T**3.825, the pressure-independent part of Fpv**2
+    if np.ndim(temperature_K) == 0 and np.ndim(specific_gravity) == 0:
+        return _gpsa_z_coefficient_scalar(float(temperature_K), float(specific_gravity))
+
+    T = np.asarray(temperature_K, dtype=float)
+    y = np.asarray(specific_gravity, dtype=float)
+
+    k = np.exp(_LN_GPSA_A + _GPSA_SG_EXPONENT * y - _GPSA_T_EXPONENT * np.log(T))
+
+    return k
+
+@functools.lru_cache(maxsize=4096)
+def _gpsa_z_coefficient_scalar(temperature_K: float, specific_gravity: float) -> float:
+    return math.exp(_LN_GPSA_A + _GPSA_SG_EXPONENT * specific_gravity - _GPSA_T_EXPONENT * math.log(temperature_K))
+
+# Wagner and Pruss (2002) saturation pressure of water, valid from the triple point to the
+# critical point
+_WATER_TC_K = 647.096
+_WATER_PC_kPa = 22064.0
+_WAGNER_A = (-7.85951783, 1.84408259, -11.7866497, 22.6807411, -15.9618719, 1.80122502)
+_WAGNER_EXPONENTS = (1.0, 1.5, 3.0, 3.5, 4.0, 7.5)
+
+def water_vapor_pressure(temperature_K: float | np.ndarray) -> float | np.ndarray:
+    T = np.asarray(temperature_K, dtype=float)
+
+    if np.any((T <= 0.0) | (T > _WATER_TC_K)):
+        raise ValueError(f"temperature_K must be > 0 and <= {_WATER_TC_K}")
+
+    tau = 1 - T / _WATER_TC_K
+    series = sum(a * tau**n for a, n in zip(_WAGNER_A, _WAGNER_EXPONENTS))
+
+    Pv = _WATER_PC_kPa * np.exp(_WATER_TC_K / T * series)
+
+    return Pv[()]
@@ -0,0 +1,129 @@
+import functools
+from typing import NamedTuple
+
+import numpy as np
+
+# unit -> (dimension, scale, offset) with value_SI = value * scale + offset
+_UNITS = {
+    # pressure (absolute), Pa
+    "Pa": ("pressure", 1.0, 0.0),
+    "kPa": ("pressure", 1e3, 0.0),
+    "MPa": ("pressure", 1e6, 0.0),
+    "bar": ("pressure", 1e5, 0.0),
+    "psi": ("pressure", 6894.757293168361, 0.0),
+    "atm": ("pressure", 101325.0, 0.0),
+
+    # temperature (absolute, not differences), K
+    "K": ("temperature", 1.0, 0.0),
+    "degC": ("temperature", 1.0, 273.15),
+    "degF": ("temperature", 5 / 9, 459.67 * 5 / 9),
+    "degR": ("temperature", 5 / 9, 0.0),
+
+    # length, m
+    "m": ("length", 1.0, 0.0),
+    "km": ("length", 1e3, 0.0),
+    "cm": ("length", 1e-2, 0.0),
+    "mm": ("length", 1e-3, 0.0),
+    "µm": ("length", 1e-6, 0.0),
+    "um": ("length", 1e-6, 0.0),
+    "in": ("length", 0.0254, 0.0),
+    "ft": ("length", 0.3048, 0.0),
+
+    # volume, m3
+    "m3": ("volume", 1.0, 0.0),
+    "L": ("volume", 1e-3, 0.0),
+    "ft3": ("volume", 0.028316846592, 0.0),
+    "USgal": ("volume", 0.003785411784, 0.0),
+    "bbl": ("volume", 0.158987294928, 0.0),
+
+    # density, kg/m3
+    "kg/m3": ("density", 1.0, 0.0),
+    "g/cm3": ("density", 1e3, 0.0),
+    "lb/ft3": ("density", 16.018463373960138, 0.0),
+    # water content of gas per standard volume, kg/Sm3: a mass per volume at standard
+    # conditions, not a density, so it does not convert to or from density units
+    "mg/m3": ("water_content", 1e-6, 0.0),
+    "lb/MMscf": ("water_content", 0.45359237 / 28316.846592, 0.0),
+
+    # velocity, m/s
+    "m/s": ("velocity", 1.0, 0.0),
+    "ft/s": ("velocity", 0.3048, 0.0),
+
+    # dynamic viscosity, Pa.s
+    "Pa.s": ("viscosity", 1.0, 0.0),
+    "mPa.s": ("viscosity", 1e-3, 0.0),
+    "cP": ("viscosity", 1e-3, 0.0),
+
+    # volumetric flow rate, m3/s
+    "m3/s": ("volume_flow", 1.0, 0.0),
+    "m3/h": ("volume_flow", 1 / 3600, 0.0),
+    "m3/d": ("volume_flow", 1 / 86400, 0.0),
+    "L/s": ("volume_flow", 1e-3, 0.0),
+    "ft3/s": ("volume_flow", 0.028316846592, 0.0),
+    "USgpm": ("volume_flow", 0.003785411784 / 60, 0.0),
+    "bbl/d": ("volume_flow", 0.158987294928 / 86400, 0.0),
+
+    # mass flow rate, kg/s
+    "kg/s": ("mass_flow", 1.0, 0.0),
+    "kg/h": ("mass_flow", 1 / 3600, 0.0),
+    "lb/h": ("mass_flow", 0.45359237 / 3600, 0.0),
+}
+
+UNITS = tuple(_UNITS)
+
+class UnitConversion(NamedTuple):
+    # to_value = from_value * scale + offset
+    scale: float
+    offset: float
+
+class Quantity:
+    # a value (or whole array) tagged with its unit, accepted by calculators in place of a
+    # number in the unit of the parameter name. Not a tuple, so np.asarray cannot quietly
+    # turn it into a (value, unit) array; it has to be converted with to() or in_units.
+    __slots__ = ("value", "unit")
+
+    def __init__(self, value: float | np.ndarray, unit: str):
+        self.value = value
+        self.unit = unit
+
+    def __repr__(self) -> str:
+        return f"Quantity({self.value!r}, {self.unit!r})"
+
+    def __array__(self, dtype=None, copy=None):
+        raise TypeError(f"a Quantity in '{self.unit}' is not an array, convert it with .to(unit) or in_units first")
+
+    def to(self, unit: str) -> float | np.ndarray:
+        return convert(self.value, self.unit, unit)
+
+@functools.lru_cache(maxsize=None)
+def unit_conversion(from_unit: str, to_unit: str) -> UnitConversion:
+    # the two unit definitions folded into one multiplier (and offset, for temperatures)
+    for unit in (from_unit, to_unit):
+        if unit not in _UNITS:
+            raise ValueError(f"Unknown unit '{unit}'")
+
+    from_dimension, from_scale, from_offset = _UNITS[from_unit]
+    to_dimension, to_scale, to_offset = _UNITS[to_unit]
+
+    if from_dimension != to_dimension:
+        raise ValueError(f"Cannot convert {from_dimension} in '{from_unit}' to {to_dimension} in '{to_unit}'")
+
+    return UnitConversion(scale=from_scale / to_scale, offset=(from_offset - to_offset) / to_scale)
+
+def convert(value: float | np.ndarray, from_unit: str, to_unit: str) -> float | np.ndarray:
+    scale, offset = unit_conversion(from_unit, to_unit)
+    x = np.asarray(value, dtype=float)
+
+    if scale != 1.0:
+        x = x * scale
+    if offset != 0.0:
+        x = x + offset
+
+    return x[()]
+
+def in_units(value: float | np.ndarray | Quantity, unit: str) -> float | np.ndarray:
+    # calculator inputs: a Quantity is converted to unit, anything else is taken to be in unit
+    if isinstance(value, Quantity):
+        return value.to(unit)
+
+    return value